@@ -0,0 +1,180 @@
+"""Cold-start benchmarks: package import, client construction, first request.
+
+Every trial runs in a fresh interpreter, so module caches and lazily built
+pydantic validators start cold exactly as in a serverless worker. Requests
+go to a local stand-in server, so the numbers measure the SDK and not the
+network. Results are written as JSON for comparison across releases.
+
+Usage::
+
+    python benchmarks/cold_start.py                      # writes benchmarks/results/<version>.json
+    python benchmarks/cold_start.py --runs 30 --output bench.json
+    python benchmarks/cold_start.py --compare benchmarks/results/3.10.0.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+_ID = "00000000-0000-0000-0000-000000000001"
+_NOW = "2026-01-01T00:00:00Z"
+
+# Canned responses for the one GET each scenario sends.
+_RESPONSES: dict[str, dict[str, Any]] = {
+    f"/api/v2/tasks/{_ID}/status": {"id": _ID, "status": "started"},
+    f"/api/v3/sessions/{_ID}": {
+        "id": _ID,
+        "status": "running",
+        "model": "bu-mini",
+        "createdAt": _NOW,
+        "updatedAt": _NOW,
+    },
+    f"/api/v4/runs/{_ID}/status": {"status": "running"},
+}
+
+# name -> (import statement, client construction, first request)
+_SCENARIOS: dict[str, tuple[str, str, str]] = {
+    "import_root": ("import browser_use_sdk", "", ""),
+    "import_v3": ("import browser_use_sdk.v3", "", ""),
+    "import_v4": ("import browser_use_sdk.v4", "", ""),
+    "v2": (
+        "from browser_use_sdk import BrowserUse",
+        "client = BrowserUse(api_key='bench', base_url=BASE + '/api/v2')",
+        f"client.tasks.status('{_ID}')",
+    ),
+    "v3": (
+        "from browser_use_sdk.v3 import BrowserUse",
+        "client = BrowserUse(api_key='bench', base_url=BASE + '/api/v3')",
+        f"client.sessions.get('{_ID}')",
+    ),
+    "v4": (
+        "from browser_use_sdk.v4 import BrowserUse",
+        "client = BrowserUse(api_key='bench', base_url=BASE + '/api/v4')",
+        f"client.runs.status('{_ID}')",
+    ),
+}
+
+_PROBE = """
+import json, time
+BASE = {base!r}
+t0 = time.perf_counter()
+{import_stmt}
+t1 = time.perf_counter()
+{construct}
+t2 = time.perf_counter()
+{request}
+t3 = time.perf_counter()
+print(json.dumps({{"import_ms": (t1 - t0) * 1e3, "construct_ms": (t2 - t1) * 1e3, "first_request_ms": (t3 - t2) * 1e3}}))
+"""
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body = _RESPONSES.get(self.path.split("?", 1)[0])
+        payload = json.dumps(body if body is not None else {"detail": "not found"}).encode()
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _trial(scenario: str, base: str) -> dict[str, float]:
+    import_stmt, construct, request = _SCENARIOS[scenario]
+    code = _PROBE.format(base=base, import_stmt=import_stmt, construct=construct, request=request)
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    timings = json.loads(out)
+    timings["process_ms"] = (time.perf_counter() - start) * 1e3
+    if not construct:
+        del timings["construct_ms"], timings["first_request_ms"]
+    return timings
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "median": round(statistics.median(ordered), 3),
+        "p90": round(ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))], 3),
+        "min": round(ordered[0], 3),
+    }
+
+
+def run(runs: int, scenarios: list[str]) -> dict[str, Any]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        results: dict[str, dict[str, dict[str, float]]] = {}
+        for scenario in scenarios:
+            _trial(scenario, base)  # warm the OS page cache and .pyc files
+            trials = [_trial(scenario, base) for _ in range(runs)]
+            results[scenario] = {metric: _summarize([t[metric] for t in trials]) for metric in trials[0]}
+    finally:
+        server.shutdown()
+    try:
+        sdk_version = version("browser-use-sdk")
+    except PackageNotFoundError:
+        sdk_version = "unknown"
+    return {
+        "sdk_version": sdk_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "runs": runs,
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> str:
+    """Median-to-median change per scenario and metric, as a text table."""
+    lines = [f"{'scenario':<14}{'metric':<18}{'before':>10}{'after':>10}{'change':>9}"]
+    for scenario, metrics in current["results"].items():
+        for metric, stats in metrics.items():
+            before = previous.get("results", {}).get(scenario, {}).get(metric, {}).get("median")
+            if before is None:
+                continue
+            after = stats["median"]
+            change = (after - before) / before * 100 if before else 0.0
+            lines.append(f"{scenario:<14}{metric:<18}{before:>10.2f}{after:>10.2f}{change:>8.1f}%")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=15, help="fresh-interpreter trials per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(_SCENARIOS), help="repeatable; default all")
+    parser.add_argument("--output", type=Path, help="JSON results path (default benchmarks/results/<version>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results JSON to diff against")
+    args = parser.parse_args()
+
+    report = run(args.runs, args.scenario or list(_SCENARIOS))
+    output = args.output or Path(__file__).parent / "results" / f"{report['sdk_version']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    for scenario, metrics in report["results"].items():
+        summary = "  ".join(f"{metric}={stats['median']:.2f}" for metric, stats in metrics.items())
+        print(f"{scenario:<14}{summary}")
+    print(f"wrote {output}")
+    if args.compare is not None:
+        print(compare(report, json.loads(args.compare.read_text())))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,75 +4,117 @@ Default imports expose the v2 client and core error type.
 For v3, use ``from browser_use_sdk.v3 import BrowserUse``.
 """
 
-from ._core.errors import BrowserUseError
-from .v2.client import AsyncBrowserUse, BrowserUse
-from .v2.helpers import AsyncTaskRun, TaskResult, TaskStream
+from typing import TYPE_CHECKING
 
-from .generated.v2.models import (
-    AccountView,
-    BrowserDownloadFile,
-    BrowserDownloadListResponse,
-    BrowserSessionItemView,
-    BrowserSessionListResponse,
-    BrowserSessionView,
-    CreateBrowserSessionRequest,
-    CreateSessionRequest,
-    CreateSkillRequest,
-    CreateSkillResponse,
-    CreateTaskRequest,
-    CustomProxy,
-    ExecuteSkillRequest,
-    ExecuteSkillResponse,
-    FileView,
-    ProfileCreateRequest,
-    ProfileUpdateRequest,
-    MarketplaceSkillListResponse,
-    MarketplaceSkillResponse,
-    ParameterSchema,
-    PlanInfo,
-    ProfileListResponse,
-    ProfileView,
-    RefineSkillRequest,
-    RefineSkillResponse,
-    SessionItemView,
-    SessionListResponse,
-    SessionSettings,
-    SessionView,
-    ShareView,
-    SkillExecutionListResponse,
-    SkillExecutionOutputResponse,
-    SkillExecutionView,
-    SkillListResponse,
-    SkillResponse,
-    TaskCreatedResponse,
-    TaskListResponse,
-    TaskLogFileResponse,
-    TaskOutputFileResponse,
-    TaskStatusView,
-    TaskStepView,
-    TaskItemView,
-    TaskView,
-    UpdateBrowserSessionRequest,
-    UpdateSessionRequest,
-    UpdateSkillRequest,
-    UpdateTaskRequest,
-    UploadFilePresignedUrlResponse,
-    UploadFileRequest,
-    # Enums
-    BrowserSessionStatus,
-    BrowserSessionUpdateAction,
-    ContentType,
-    ParameterType,
-    ProxyCountryCode,
-    SessionStatus,
-    SessionUpdateAction,
-    SkillCategory,
-    SkillsGenerationStatus,
-    SupportedLLMs,
-    TaskStatus,
-    TaskUpdateAction,
+from ._lazy import attach
+
+# Names are imported on first access; see _lazy.py.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "._core.cache": ["ResultCache"],
+        "._core.errors": ["BrowserUseError"],
+        "._core.http": ["HedgePolicy"],
+        "._core.request_template": ["RequestTemplate"],
+        "._core.schema": ["schema_sizes"],
+        ".v2.client": ["AsyncBrowserUse", "BrowserUse"],
+        ".v2.helpers": ["AsyncTaskRun", "SlimTaskResult", "TaskResult", "TaskStream", "parse_actions"],
+        ".generated.v2.models": [
+            "AccountView", "BrowserDownloadFile", "BrowserDownloadListResponse",
+            "BrowserSessionItemView", "BrowserSessionListResponse", "BrowserSessionView",
+            "CreateBrowserSessionRequest", "CreateSessionRequest", "CreateSkillRequest",
+            "CreateSkillResponse", "CreateTaskRequest", "CustomProxy", "ExecuteSkillRequest",
+            "ExecuteSkillResponse", "FileView", "ProfileCreateRequest", "ProfileUpdateRequest",
+            "MarketplaceSkillListResponse", "MarketplaceSkillResponse", "ParameterSchema",
+            "PlanInfo", "ProfileListResponse", "ProfileView", "RefineSkillRequest",
+            "RefineSkillResponse", "SessionItemView", "SessionListResponse", "SessionSettings",
+            "SessionView", "ShareView", "SkillExecutionListResponse",
+            "SkillExecutionOutputResponse", "SkillExecutionView", "SkillListResponse",
+            "SkillResponse", "TaskCreatedResponse", "TaskListResponse", "TaskLogFileResponse",
+            "TaskOutputFileResponse", "TaskStatusView", "TaskStepView", "TaskItemView", "TaskView",
+            "UpdateBrowserSessionRequest", "UpdateSessionRequest", "UpdateSkillRequest",
+            "UpdateTaskRequest", "UploadFilePresignedUrlResponse", "UploadFileRequest",
+            "BrowserSessionStatus", "BrowserSessionUpdateAction", "ContentType", "ParameterType",
+            "ProxyCountryCode", "SessionStatus", "SessionUpdateAction", "SkillCategory",
+            "SkillsGenerationStatus", "SupportedLLMs", "TaskStatus", "TaskUpdateAction",
+        ],
+    },
 )
 
+if TYPE_CHECKING:
+    from ._core.cache import ResultCache
+    from ._core.errors import BrowserUseError
+    from ._core.http import HedgePolicy
+    from ._core.request_template import RequestTemplate
+    from ._core.schema import schema_sizes
+    from .v2.client import AsyncBrowserUse, BrowserUse
+    from .v2.helpers import AsyncTaskRun, SlimTaskResult, TaskResult, TaskStream, parse_actions
+
+    from .generated.v2.models import (
+        AccountView,
+        BrowserDownloadFile,
+        BrowserDownloadListResponse,
+        BrowserSessionItemView,
+        BrowserSessionListResponse,
+        BrowserSessionView,
+        CreateBrowserSessionRequest,
+        CreateSessionRequest,
+        CreateSkillRequest,
+        CreateSkillResponse,
+        CreateTaskRequest,
+        CustomProxy,
+        ExecuteSkillRequest,
+        ExecuteSkillResponse,
+        FileView,
+        ProfileCreateRequest,
+        ProfileUpdateRequest,
+        MarketplaceSkillListResponse,
+        MarketplaceSkillResponse,
+        ParameterSchema,
+        PlanInfo,
+        ProfileListResponse,
+        ProfileView,
+        RefineSkillRequest,
+        RefineSkillResponse,
+        SessionItemView,
+        SessionListResponse,
+        SessionSettings,
+        SessionView,
+        ShareView,
+        SkillExecutionListResponse,
+        SkillExecutionOutputResponse,
+        SkillExecutionView,
+        SkillListResponse,
+        SkillResponse,
+        TaskCreatedResponse,
+        TaskListResponse,
+        TaskLogFileResponse,
+        TaskOutputFileResponse,
+        TaskStatusView,
+        TaskStepView,
+        TaskItemView,
+        TaskView,
+        UpdateBrowserSessionRequest,
+        UpdateSessionRequest,
+        UpdateSkillRequest,
+        UpdateTaskRequest,
+        UploadFilePresignedUrlResponse,
+        UploadFileRequest,
+        # Enums
+        BrowserSessionStatus,
+        BrowserSessionUpdateAction,
+        ContentType,
+        ParameterType,
+        ProxyCountryCode,
+        SessionStatus,
+        SessionUpdateAction,
+        SkillCategory,
+        SkillsGenerationStatus,
+        SupportedLLMs,
+        TaskStatus,
+        TaskUpdateAction,
+    )
+
 __all__ = [
     # Client
     "BrowserUse",
@@ -81,6 +123,12 @@ __all__ = [
     "TaskStream",
     "AsyncTaskRun",
     "TaskResult",
+    "SlimTaskResult",
+    "parse_actions",
+    "HedgePolicy",
+    "ResultCache",
+    "RequestTemplate",
+    "schema_sizes",
     # Response models
     "AccountView",
     "BrowserDownloadFile",
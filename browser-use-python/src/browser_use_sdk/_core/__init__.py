@@ -1,9 +1,16 @@
+from typing import Literal
+
 from .errors import BrowserUseError
-from .http import AsyncHttpClient, SyncHttpClient
+from .http import AsyncHttpClient, HedgePolicy, SyncHttpClient
 
 _UNSET: object = object()
 """Sentinel for parameters where ``None`` has explicit API meaning (e.g. sending
 JSON ``null`` to disable proxies).  Using ``_UNSET`` as the default lets the SDK
 distinguish "caller didn't pass a value" from "caller explicitly passed ``None``"."""
 
-__all__ = ["BrowserUseError", "SyncHttpClient", "AsyncHttpClient", "_UNSET"]
+OnTimeout = Literal["raise", "cancel"]
+"""What a client-side wait does with the remote run when it times out: leave it
+running (``"raise"``) or stop it first (``"cancel"``) so it stops billing and
+frees a concurrency slot. ``TimeoutError`` is raised either way."""
+
+__all__ = ["BrowserUseError", "SyncHttpClient", "AsyncHttpClient", "HedgePolicy", "_UNSET", "OnTimeout"]
@@ -0,0 +1,174 @@
+"""Bounded-concurrency batch execution with optional straggler hedging.
+
+:func:`run_batch` runs one coroutine per item with at most ``concurrency`` in
+flight and tracks how long each item took. With a :class:`StragglerPolicy`,
+an item that runs past a percentile of its finished peers' durations gets a
+duplicate (hedge) attempt; whichever attempt finishes first wins and the
+other is cancelled. Attempt coroutines are expected to stop their remote run
+when cancelled, even mid-create, so the loser stops billing right away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class StragglerPolicy:
+    """Opt-in speculative re-execution of straggler runs in a batch.
+
+    An item is hedged once it has run longer than ``multiplier`` times the
+    ``percentile`` of the durations of items that already finished, provided
+    at least ``min_samples`` items have finished. Extra spend is capped by
+    ``max_hedge_ratio`` (fraction of the batch size) and, if set,
+    ``max_hedges`` (absolute). Each item is hedged at most once.
+
+    After a batch, :attr:`hedged` and :attr:`hedge_wins` report how many
+    duplicates were launched and how many of them finished first.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.9,
+        multiplier: float = 1.5,
+        min_samples: int = 5,
+        max_hedge_ratio: float = 0.1,
+        max_hedges: int | None = None,
+        check_interval: float = 1.0,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_hedges = max_hedges
+        self.check_interval = check_interval
+        self.hedged = 0
+        self.hedge_wins = 0
+
+
+class _BatchTimings:
+    """Durations of finished items and the hedge budget for one batch."""
+
+    def __init__(self, policy: StragglerPolicy, size: int) -> None:
+        self.policy = policy
+        self.durations: list[float] = []
+        budget = math.floor(size * policy.max_hedge_ratio)
+        if policy.max_hedges is not None:
+            budget = min(budget, policy.max_hedges)
+        self.budget = budget
+
+    def threshold(self) -> float | None:
+        if len(self.durations) < self.policy.min_samples:
+            return None
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, math.ceil(self.policy.percentile * len(ordered)) - 1)
+        return ordered[index] * self.policy.multiplier
+
+    def take_hedge(self) -> bool:
+        if self.budget <= 0:
+            return False
+        self.budget -= 1
+        self.policy.hedged += 1
+        return True
+
+
+async def _cancel_all(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    pending = [t for t in tasks if not t.done()]
+    for t in pending:
+        t.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _run_hedged(
+    item: T,
+    run_one: Callable[[T], Awaitable[R]],
+    timings: _BatchTimings,
+) -> R:
+    loop = asyncio.get_running_loop()
+    primary: asyncio.Future[R] = asyncio.ensure_future(run_one(item))
+    started = {primary: loop.time()}
+    pending: set[asyncio.Future[R]] = {primary}
+    hedge: asyncio.Future[R] | None = None
+
+    try:
+        while True:
+            threshold = timings.threshold() if hedge is None else None
+            if hedge is not None:
+                wait = None
+            elif threshold is None:
+                wait = timings.policy.check_interval
+            else:
+                wait = max(0.0, started[primary] + threshold - loop.time())
+
+            done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if done:
+                # Both attempts can land in the same wakeup: any success beats a failure.
+                answered = [attempt for attempt in done if attempt.exception() is None]
+                if not answered:
+                    if pending:
+                        continue  # the other attempt may still succeed
+                    return (primary if primary in done else done.pop()).result()
+                await _cancel_all(pending)
+                winner = primary if primary in answered else answered[0]
+                if winner is not primary:
+                    timings.policy.hedge_wins += 1
+                # Measured from the primary's start: that is how long the item took.
+                timings.durations.append(loop.time() - started[primary])
+                return winner.result()
+
+            if (
+                hedge is None
+                and threshold is not None
+                and loop.time() - started[primary] >= threshold
+                and timings.take_hedge()
+            ):
+                hedge = asyncio.ensure_future(run_one(item))
+                started[hedge] = loop.time()
+                pending.add(hedge)
+    except BaseException:
+        await _cancel_all(started)
+        raise
+
+
+async def run_batch(
+    items: Iterable[T],
+    run_one: Callable[[T], Awaitable[R]],
+    *,
+    concurrency: int = 10,
+    straggler: StragglerPolicy | None = None,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Run ``run_one`` for every item, at most ``concurrency`` at a time.
+
+    Results come back in input order. With ``return_exceptions=False`` the
+    first failure cancels the remaining items and is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    items = list(items)
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = _BatchTimings(straggler, len(items)) if straggler is not None else None
+
+    async def one(item: T) -> R:
+        async with semaphore:
+            if timings is None:
+                return await run_one(item)
+            return await _run_hedged(item, run_one, timings)
+
+    tasks = [asyncio.ensure_future(one(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        await _cancel_all(tasks)
+        raise
@@ -0,0 +1,224 @@
+"""Pool of standalone browsers shared by the v2 and v3 async clients.
+
+Works with either version's ``AsyncBrowsers`` resource: both expose the same
+``create``/``get``/``stop`` calls and return views with ``id``, ``status``,
+``cdp_url`` and ``timeout_at``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+from . import _UNSET
+from .errors import BrowserUseError
+
+# (profile_id, proxy_country_code, browser_screen_width, browser_screen_height)
+BrowserKey = Tuple[Optional[str], Any, Optional[int], Optional[int]]
+
+
+class _PooledBrowser:
+    __slots__ = ("view", "key")
+
+    def __init__(self, view: Any, key: BrowserKey) -> None:
+        self.view = view
+        self.key = key
+
+    @property
+    def id(self) -> str:
+        return str(self.view.id)
+
+    def seconds_left(self) -> float:
+        return (self.view.timeout_at - datetime.now(timezone.utc)).total_seconds()
+
+
+class BrowserPool:
+    """Pre-created standalone browsers, leased out per job and reused.
+
+    Browsers are grouped by profile, proxy country and screen size. A leased
+    browser keeps its tabs, cookies and storage from earlier jobs; use a
+    separate group (or don't pool) when jobs must not share state. Browsers
+    within ``recycle_before`` seconds of their ``timeout_at`` are stopped and
+    replaced instead of being leased. :meth:`close` stops every browser the
+    pool created, including ones still leased.
+
+    Usage::
+
+        pool = client.browser_pool(max_size=4)
+        await pool.warm(2, proxy_country_code="us")
+        async with pool.lease(proxy_country_code="us") as browser:
+            await scrape(browser.cdp_url)
+    """
+
+    def __init__(
+        self,
+        browsers: Any,
+        *,
+        max_size: int = 10,
+        timeout: int | None = None,
+        recycle_before: float = 60,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._browsers = browsers
+        self._max_size = max_size
+        self._timeout = timeout
+        self._recycle_before = recycle_before
+        self._idle: dict[BrowserKey, list[_PooledBrowser]] = {}
+        self._leased: dict[str, _PooledBrowser] = {}
+        self._creating = 0
+        self._semaphore: asyncio.Semaphore | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Browsers owned by the pool, leased, idle or being created."""
+        return len(self._leased) + sum(len(b) for b in self._idle.values()) + self._creating
+
+    async def warm(
+        self,
+        count: int,
+        *,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+        browser_screen_width: int | None = None,
+        browser_screen_height: int | None = None,
+    ) -> None:
+        """Create browsers until the group has ``count`` idle ones (within ``max_size``)."""
+        key: BrowserKey = (profile_id, proxy_country_code, browser_screen_width, browser_screen_height)
+        missing = min(count - len(self._idle.get(key, [])), self._max_size - self.size)
+        if missing <= 0:
+            return
+        results = await asyncio.gather(*(self._warm_one(key) for _ in range(missing)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @contextlib.asynccontextmanager
+    async def lease(
+        self,
+        *,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+        browser_screen_width: int | None = None,
+        browser_screen_height: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Lease a browser from the matching group; it returns to the pool on exit.
+
+        If the block raises, the browser is stopped rather than reused.
+        """
+        key: BrowserKey = (profile_id, proxy_country_code, browser_screen_width, browser_screen_height)
+        pooled = await self._acquire(key)
+        try:
+            yield pooled.view
+        except BaseException:
+            await asyncio.shield(self._discard(pooled))
+            raise
+        else:
+            await self._release(pooled)
+
+    async def close(self) -> None:
+        """Stop every browser the pool created, idle or still leased."""
+        self._closed = True
+        owned = [b for browsers in self._idle.values() for b in browsers] + list(self._leased.values())
+        self._idle.clear()
+        self._leased.clear()
+        await asyncio.gather(*(self._stop(b) for b in owned))
+
+    def _slots(self) -> asyncio.Semaphore:
+        # Created lazily so the pool can be built outside a running loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_size)
+        return self._semaphore
+
+    async def _create(self, key: BrowserKey) -> _PooledBrowser:
+        profile_id, proxy_country_code, width, height = key
+        try:
+            view = await self._browsers.create(
+                profile_id=profile_id,
+                proxy_country_code=proxy_country_code,
+                timeout=self._timeout,
+                browser_screen_width=width,
+                browser_screen_height=height,
+            )
+        finally:
+            self._creating -= 1
+        return _PooledBrowser(view, key)
+
+    async def _warm_one(self, key: BrowserKey) -> None:
+        # Each warm create holds a slot, like a lease, until its browser is
+        # idle, so a lease never creates past max_size while it is in flight.
+        async with self._slots():
+            if self._closed or self.size >= self._max_size:
+                return
+            self._creating += 1
+            pooled = await self._create(key)
+            if self._closed:
+                await self._stop(pooled)
+            else:
+                self._idle.setdefault(key, []).append(pooled)
+
+    async def _acquire(self, key: BrowserKey) -> _PooledBrowser:
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        await self._slots().acquire()
+        try:
+            idle = self._idle.get(key, [])
+            while idle:
+                pooled = idle.pop()
+                self._leased[pooled.id] = pooled
+                if await self._usable(pooled):
+                    return pooled
+                del self._leased[pooled.id]
+                await self._stop(pooled)
+            if self.size >= self._max_size:
+                # The free slots hold idle browsers of other groups: trade one.
+                spare = self._take_oldest_idle()
+                if spare is not None:
+                    await self._stop(spare)
+            self._creating += 1
+            pooled = await self._create(key)
+            self._leased[pooled.id] = pooled
+            return pooled
+        except BaseException:
+            self._slots().release()
+            raise
+
+    def _take_oldest_idle(self) -> _PooledBrowser | None:
+        idle = [b for browsers in self._idle.values() for b in browsers]
+        if not idle:
+            return None
+        oldest = min(idle, key=lambda b: b.seconds_left())
+        self._idle[oldest.key].remove(oldest)
+        return oldest
+
+    async def _usable(self, pooled: _PooledBrowser) -> bool:
+        if pooled.seconds_left() <= self._recycle_before:
+            return False
+        try:
+            view = await self._browsers.get(pooled.id)
+        except BrowserUseError:
+            return False
+        return view.status.value == "active"
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        self._leased.pop(pooled.id, None)
+        self._slots().release()
+        if self._closed or pooled.seconds_left() <= self._recycle_before:
+            await self._stop(pooled)
+        else:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+
+    async def _discard(self, pooled: _PooledBrowser) -> None:
+        self._leased.pop(pooled.id, None)
+        self._slots().release()
+        await self._stop(pooled)
+
+    async def _stop(self, pooled: _PooledBrowser) -> None:
+        try:
+            await self._browsers.stop(pooled.id)
+        except BrowserUseError:
+            pass  # already stopped or timed out
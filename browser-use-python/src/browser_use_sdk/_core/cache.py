@@ -0,0 +1,220 @@
+"""Opt-in memoization of task results for repeated identical runs.
+
+Results are keyed on a canonical hash of the create request body, stored as
+JSON strings with a TTL, and kept either in an in-memory LRU or in a SQLite
+file shared across processes. Concurrent identical submissions are
+single-flighted: the first one runs remotely, the rest wait for its result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from .codec import _json_default
+
+R = TypeVar("R")
+
+# Sent with a create call but not part of what it runs; ignored by ResultCache.key.
+_TRANSPORT_FIELDS = frozenset({"idempotency_key"})
+
+
+class _LeaderCancelled(Exception):
+    """Set on an in-flight future whose leading run was cancelled."""
+
+
+def _key_default(value: Any) -> Any:
+    try:
+        return _json_default(value)
+    except TypeError:
+        return str(value)
+
+
+class _MemoryBackend:
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._items: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[float, str] | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def set(self, key: str, stored_at: float, value: str) -> None:
+        with self._lock:
+            self._items[key] = (stored_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+
+class _DiskBackend:
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+
+    def get(self, key: str) -> tuple[float, str] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT stored_at, value FROM results WHERE key = ?", (key,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, stored_at: float, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, stored_at, value) VALUES (?, ?, ?)",
+                (key, stored_at, value),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+
+class ResultCache:
+    """Result cache for ``client.run()`` on the v2 and v3 clients.
+
+    Pass ``path`` to persist results in a SQLite file instead of an
+    in-memory LRU of ``maxsize`` entries. Only successful results are
+    stored; follow-up runs (``session_id``) and keep-alive sessions are never
+    cached. :attr:`hits` and :attr:`misses` count lookups.
+
+    Usage::
+
+        client = AsyncBrowserUse(result_cache=ResultCache(ttl=600))
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300,
+        maxsize: int = 1024,
+        path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._backend: _MemoryBackend | _DiskBackend = (
+            _DiskBackend(os.fspath(path)) if path is not None else _MemoryBackend(maxsize)
+        )
+        self._async_inflight: dict[str, asyncio.Future[Any]] = {}
+        self._sync_inflight: set[str] = set()
+        self._sync_changed = threading.Condition()
+
+    @staticmethod
+    def key(namespace: str, body: dict[str, Any]) -> str:
+        """Canonical hash of a create request body within ``namespace`` (e.g. ``"v3"``).
+
+        Transport-only fields such as ``idempotency_key`` are left out, so a
+        keyed (e.g. journaled) run still matches an identical earlier one.
+        """
+        body = {k: v for k, v in body.items() if k not in _TRANSPORT_FIELDS}
+        canonical = json.dumps(
+            [namespace, body], sort_keys=True, separators=(",", ":"), default=_key_default
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Cached value for ``key`` if present and younger than ``ttl``."""
+        item = self._backend.get(key)
+        if item is None:
+            return None
+        stored_at, value = item
+        if time.time() - stored_at > self.ttl:
+            self._backend.delete(key)
+            return None
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        self._backend.set(key, time.time(), value)
+
+    async def aget_or_run(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[R]],
+        encode: Callable[[R], str | None],
+        decode: Callable[[str], R],
+    ) -> R:
+        """Return the cached result, join an identical in-flight run, or start one.
+
+        If the run being joined is cancelled, its joiners start over: one of
+        them becomes the new leader and the rest join it.
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return decode(cached)
+            inflight = self._async_inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # Joiners share the leader's result object (or its exception).
+                result = await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                continue
+            self.hits += 1
+            return result  # type: ignore[no-any-return]
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        try:
+            result = await run()
+        except BaseException as e:
+            # A cancelled leader must not cancel its joiners: they retry instead.
+            future.set_exception(e if isinstance(e, Exception) else _LeaderCancelled())
+            future.exception()  # nobody may have joined; don't log "never retrieved"
+            raise
+        finally:
+            self._async_inflight.pop(key, None)
+        value = encode(result)
+        if value is not None:
+            self.put(key, value)
+        future.set_result(result)
+        return result
+
+    def get_or_run(
+        self,
+        key: str,
+        run: Callable[[], R],
+        encode: Callable[[R], str | None],
+        decode: Callable[[str], R],
+    ) -> R:
+        """Blocking variant of :meth:`aget_or_run`, single-flighted across threads."""
+        with self._sync_changed:
+            while key in self._sync_inflight:
+                self._sync_changed.wait()
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return decode(cached)
+            self.misses += 1
+            self._sync_inflight.add(key)
+        try:
+            result = run()
+            value = encode(result)
+            if value is not None:
+                self.put(key, value)
+            return result
+        finally:
+            with self._sync_changed:
+                self._sync_inflight.discard(key)
+                self._sync_changed.notify_all()
@@ -0,0 +1,121 @@
+"""JSON codecs for request bodies and response payloads.
+
+The HTTP clients encode and decode through a :class:`JSONCodec`. When orjson
+is installed (``pip install "browser-use-sdk[orjson]"``) :func:`default_codec`
+returns an :class:`OrjsonCodec`; otherwise it falls back to the stdlib
+:mod:`json` module. Both accept and reject the same values and decode to the
+same data: pydantic models, dataclasses, ``Enum``, ``UUID`` and
+``datetime`` all go through :func:`_json_default` (orjson's native dataclass
+and datetime encoding is bypassed). The bytes may differ in float spelling
+(``1e16`` vs ``1e+16``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON values request bodies may carry."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow, so nested values come back through here like any other.
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """Stdlib JSON, in the same format as httpx's ``json=`` encoding.
+
+    Plain dicts, lists and scalars are written by the C encoder without being
+    copied first; only values it cannot encode reach :func:`_json_default`.
+    """
+
+    name = "json"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_json_default
+        )
+
+    def encode(self, data: Any) -> bytes:
+        return self._encoder.encode(data).encode()
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a plain JSON value holds a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson-backed codec; requires the ``orjson`` extra.
+
+    Values orjson treats differently from the stdlib codec are handed back
+    to it: integers beyond 64 bits are encoded by :class:`JSONCodec`, and
+    NaN/infinity (which orjson would write as ``null``) raise ``ValueError``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        super().__init__()
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._encode_error = orjson.JSONEncodeError
+        self._options = (
+            orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def encode(self, data: Any) -> bytes:
+        try:
+            encoded = self._dumps(data, default=_json_default, option=self._options)
+        except self._encode_error:
+            # Oversized ints; unsupported types raise TypeError from here too.
+            return super().encode(data)
+        # A non-finite float can only have been written as null.
+        if b"null" in encoded and _has_non_finite(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return encoded
+
+    def decode(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+_default: JSONCodec | None = None
+
+
+def default_codec() -> JSONCodec:
+    """The shared codec: orjson when installed, stdlib json otherwise."""
+    global _default
+    if _default is None:
+        try:
+            _default = OrjsonCodec()
+        except ImportError:
+            _default = JSONCodec()
+    return _default
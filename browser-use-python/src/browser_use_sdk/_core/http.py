@@ -2,40 +2,117 @@ from __future__ import annotations
 
 import time
 import asyncio
-from datetime import datetime
-from enum import Enum
-from typing import Any
-from uuid import UUID
+import math
+from collections import deque
+from typing import Any, TypeVar
+from uuid import uuid4
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from .codec import JSONCodec, default_codec
 from .errors import BrowserUseError
 
 _RETRY_STATUSES = {429}
+# Gateway errors and transport failures are only retried when repeating the
+# request cannot duplicate work: idempotent methods, or a keyed create.
+_TRANSIENT_STATUSES = {502, 503, 504}
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+_IDEMPOTENCY_HEADER = "Idempotency-Key"
 _DEFAULT_MAX_RETRIES = 3
 _BACKOFF_BASE = 0.5
 
+M = TypeVar("M", bound=BaseModel)
 
-def _clean_json(data: Any) -> Any:
-    """Prepare data for JSON serialization."""
-    if isinstance(data, dict):
-        return {k: _clean_json(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [_clean_json(v) for v in data]
-    if isinstance(data, BaseModel):
-        return data.model_dump(by_alias=True, exclude_none=True)
-    if isinstance(data, Enum):
-        return data.value
-    if isinstance(data, UUID):
-        return str(data)
-    if isinstance(data, datetime):
-        return data.isoformat()
-    return data
 
+def _idempotency_key(key: str | None) -> str:
+    """Return the caller's key, or a fresh random one."""
+    return key if key is not None else uuid4().hex
 
-def _should_retry(status_code: int) -> bool:
-    return status_code in _RETRY_STATUSES
+
+class _IdempotentCreate(BaseModel):
+    """Mixin for create responses: the key the create call was sent with."""
+
+    # Excluded so it never ends up in model_dump() or a cached/journaled copy.
+    idempotency_key: str = Field(default="", exclude=True)
+
+
+C = TypeVar("C", bound=_IdempotentCreate)
+
+
+def _validate_created(model: type[C], data: Any, key: str) -> C:
+    """Validate a create response into ``model`` and record its idempotency key."""
+    created = model.model_validate(data)
+    created.idempotency_key = key
+    return created
+
+
+class _JSONBytes(bytes):
+    """A request body that is already encoded JSON; sent as-is."""
+
+
+def _encode_body(data: Any, codec: JSONCodec) -> bytes:
+    """Serialize a request body to JSON bytes in a single pass."""
+    if isinstance(data, _JSONBytes):
+        return data
+    return codec.encode(data)
+
+
+class HedgePolicy:
+    """Opt-in hedging of idempotent GETs on the async clients.
+
+    When a GET has not answered within the rolling ``percentile`` of recent
+    GET latencies (over the last ``window`` requests, never less than
+    ``min_delay`` seconds), a second identical request is sent and the first
+    reply wins. Nothing is hedged until ``min_samples`` latencies are known,
+    and hedges never exceed ``max_ratio`` of all GETs.
+
+    :attr:`requests`, :attr:`hedged` and :attr:`hedge_wins` count GETs sent,
+    duplicates launched, and duplicates that answered first.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        max_ratio: float = 0.05,
+    ) -> None:
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def _delay(self) -> float | None:
+        """Seconds to wait before hedging, or None if hedging is not allowed now."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        if self.hedged + 1 > self.max_ratio * self.requests:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(ordered[index], self.min_delay)
+
+    def _record(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+
+def _should_retry(status_code: int, retry_safe: bool) -> bool:
+    return status_code in _RETRY_STATUSES or (retry_safe and status_code in _TRANSIENT_STATUSES)
+
+
+def _prepare_retry(method: str, idempotency_key: str | None) -> tuple[dict[str, str] | None, bool]:
+    if idempotency_key is None:
+        return None, method in _IDEMPOTENT_METHODS
+    return {_IDEMPOTENCY_HEADER: idempotency_key}, True
 
 
 def _raise_for_status(response: httpx.Response) -> None:
@@ -61,7 +138,17 @@ def _raise_for_status(response: httpx.Response) -> None:
 
 
 class SyncHttpClient:
-    """Synchronous HTTP client with retry and error handling."""
+    """Synchronous HTTP client with retry and error handling.
+
+    Every request is retried on 429. Requests that are safe to repeat are
+    also retried on transport errors and 502/503/504: GET, HEAD, OPTIONS,
+    PUT and DELETE, and creates sent with ``idempotency_key`` (carried as the
+    ``Idempotency-Key`` header). All retries share ``max_retries``; pass
+    ``max_retries=0`` to disable them.
+
+    Bodies are encoded and decoded with ``codec``; the default uses orjson
+    when it is installed (see :func:`~.codec.default_codec`).
+    """
 
     def __init__(
         self,
@@ -69,8 +156,11 @@ class SyncHttpClient:
         api_key: str,
         timeout: float = 30.0,
         max_retries: int = _DEFAULT_MAX_RETRIES,
+        *,
+        codec: JSONCodec | None = None,
     ) -> None:
         self._max_retries = max_retries
+        self._codec = codec or default_codec()
         self._client = httpx.Client(
             base_url=base_url,
             headers={"X-Browser-Use-API-Key": api_key},
@@ -84,23 +174,59 @@ class SyncHttpClient:
         *,
         json: Any = None,
         params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Any:
-        json = _clean_json(json) if json is not None else None
+        response = self._send(method, path, json=json, params=params, idempotency_key=idempotency_key)
+        if response.status_code == 204:
+            return None
+        return self._codec.decode(response.content)
+
+    def request_model(
+        self,
+        model: type[M],
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> M:
+        """Send a request and validate the response body straight into ``model``.
+
+        The raw bytes go to pydantic-core in one pass instead of
+        ``json.loads`` followed by ``model_validate``; validation is the same.
+        Used by the endpoints that are polled.
+        """
+        return model.model_validate_json(self._send(method, path, params=params).content)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> httpx.Response:
+        content = _encode_body(json, self._codec) if json is not None else None
         params = _clean_params(params)
+        headers, retry_safe = _prepare_retry(method, idempotency_key)
+        if content is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
         for attempt in range(self._max_retries + 1):
             if attempt > 0:
                 time.sleep(min(_BACKOFF_BASE * (2 ** attempt), 10))
-            response = self._client.request(method, path, json=json, params=params)
+            try:
+                response = self._client.request(method, path, content=content, params=params, headers=headers)
+            except httpx.TransportError:
+                if retry_safe and attempt < self._max_retries:
+                    continue
+                raise
 
-            if _should_retry(response.status_code) and attempt < self._max_retries:
+            if _should_retry(response.status_code, retry_safe) and attempt < self._max_retries:
                 continue
-
-            _raise_for_status(response)
-            if response.status_code == 204:
-                return None
-            return response.json()
+            break
 
         _raise_for_status(response)  # type: ignore[possibly-undefined]
+        return response  # type: ignore[possibly-undefined]
 
     def close(self) -> None:
         self._client.close()
@@ -114,6 +240,9 @@ class AsyncHttpClient:
     as the underlying transport. ``api_key`` is optional in that mode — if
     non-empty, it triggers top-up behavior (backend credits the API key's
     project instead of one auto-created from the wallet).
+
+    Pass ``hedge`` to race a duplicate of slow GETs (see :class:`HedgePolicy`).
+    Retries and ``codec`` follow the same rules as :class:`SyncHttpClient`.
     """
 
     def __init__(
@@ -124,8 +253,12 @@ class AsyncHttpClient:
         max_retries: int = _DEFAULT_MAX_RETRIES,
         *,
         x402_client: Any = None,
+        hedge: HedgePolicy | None = None,
+        codec: JSONCodec | None = None,
     ) -> None:
         self._max_retries = max_retries
+        self._codec = codec or default_codec()
+        self._hedge = hedge
         if x402_client is not None:
             from .x402 import x402_async_httpx_client
             self._client = x402_async_httpx_client(
@@ -145,23 +278,95 @@ class AsyncHttpClient:
         *,
         json: Any = None,
         params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Any:
-        json = _clean_json(json) if json is not None else None
+        response = await self._send(method, path, json=json, params=params, idempotency_key=idempotency_key)
+        if response.status_code == 204:
+            return None
+        return self._codec.decode(response.content)
+
+    async def request_model(
+        self,
+        model: type[M],
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> M:
+        """Send a request and validate the response body straight into ``model``.
+
+        See :meth:`SyncHttpClient.request_model`.
+        """
+        return model.model_validate_json((await self._send(method, path, params=params)).content)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> httpx.Response:
+        content = _encode_body(json, self._codec) if json is not None else None
         params = _clean_params(params)
+        headers, retry_safe = _prepare_retry(method, idempotency_key)
+        if content is not None:
+            headers = {**(headers or {}), "Content-Type": "application/json"}
         for attempt in range(self._max_retries + 1):
             if attempt > 0:
                 await asyncio.sleep(min(_BACKOFF_BASE * (2 ** attempt), 10))
-            response = await self._client.request(method, path, json=json, params=params)
+            try:
+                if method == "GET" and self._hedge is not None:
+                    response = await self._hedged_get(path, params, self._hedge)
+                else:
+                    response = await self._client.request(
+                        method, path, content=content, params=params, headers=headers
+                    )
+            except httpx.TransportError:
+                if retry_safe and attempt < self._max_retries:
+                    continue
+                raise
 
-            if _should_retry(response.status_code) and attempt < self._max_retries:
+            if _should_retry(response.status_code, retry_safe) and attempt < self._max_retries:
                 continue
-
-            _raise_for_status(response)
-            if response.status_code == 204:
-                return None
-            return response.json()
+            break
 
         _raise_for_status(response)  # type: ignore[possibly-undefined]
+        return response  # type: ignore[possibly-undefined]
+
+    async def _hedged_get(
+        self, path: str, params: dict[str, Any] | None, policy: HedgePolicy
+    ) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delay = policy._delay()
+        policy.requests += 1
+        primary = asyncio.ensure_future(self._client.request("GET", path, params=params))
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                pending |= done
+                if not done:
+                    policy.hedged += 1
+                    pending.add(asyncio.ensure_future(self._client.request("GET", path, params=params)))
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Both copies can land in the same wakeup: any success beats a failure.
+                answered = [attempt for attempt in done if attempt.exception() is None]
+                if not answered:
+                    if pending:
+                        continue  # the other copy may still answer
+                    return (primary if primary in done else done.pop()).result()
+                winner = primary if primary in answered else answered[0]
+                if winner is not primary:
+                    policy.hedge_wins += 1
+                policy._record(loop.time() - started)
+                return winner.result()
+        finally:
+            for attempt in pending:
+                attempt.cancel()
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,126 @@
+"""Append-only SQLite journal of batch submissions, for resuming after a crash.
+
+Every submission is written as three kinds of rows, each a single INSERT:
+
+- ``submitted``: the idempotency key and the request payload, before the
+  create call is sent;
+- ``created``: the remote id returned by the create call;
+- ``finished``: the terminal result as JSON.
+
+Rows are never updated or deleted, so the write path is one append per
+state change (WAL mode, ``synchronous=NORMAL``). Reading folds the rows into
+one :class:`JournalEntry` per key. Because the key is also sent as the
+create call's ``Idempotency-Key``, re-submitting an entry that crashed
+before its ``created`` row landed does not start a second run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from .codec import _json_default
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT,
+    ts REAL NOT NULL
+)
+"""
+
+
+class JournalEntry:
+    """Folded state of one submission."""
+
+    __slots__ = ("key", "payload", "remote_id", "result")
+
+    def __init__(self, key: str, payload: dict[str, Any]) -> None:
+        self.key = key
+        self.payload = payload
+        self.remote_id: str | None = None
+        self.result: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.result is not None
+
+    def __repr__(self) -> str:
+        state = "finished" if self.finished else "created" if self.remote_id else "submitted"
+        return f"JournalEntry(key={self.key!r}, remote_id={self.remote_id!r}, state={state})"
+
+
+class Journal:
+    """SQLite-backed record of submissions, their remote ids and results.
+
+    Pass one to ``run_many(..., journal=...)``; after a restart, open the same
+    file and call ``resume(journal)`` to pick up where the batch left off.
+
+    Usage::
+
+        journal = Journal("batch.sqlite")
+        runs = await client.runs.run_many(tasks, journal=journal)
+        # ...after a crash:
+        runs = await client.runs.resume(Journal("batch.sqlite"))
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def _append(self, key: str, kind: str, value: str | None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO journal (key, kind, value, ts) VALUES (?, ?, ?, ?)",
+                (key, kind, value, time.time()),
+            )
+
+    def submitted(self, key: str, payload: dict[str, Any]) -> None:
+        """Record a submission before its create call is sent."""
+        self._append(key, "submitted", json.dumps(payload, default=_json_default))
+
+    def created(self, key: str, remote_id: str) -> None:
+        """Record the remote id a submission was created as."""
+        self._append(key, "created", remote_id)
+
+    def finished(self, key: str, result: str) -> None:
+        """Record a submission's terminal result (serialized JSON)."""
+        self._append(key, "finished", result)
+
+    def entries(self) -> list[JournalEntry]:
+        """Every submission in the order it was made."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, kind, value FROM journal ORDER BY seq").fetchall()
+        folded: dict[str, JournalEntry] = {}
+        for key, kind, value in rows:
+            if kind == "submitted":
+                folded.setdefault(key, JournalEntry(key, json.loads(value)))
+                continue
+            entry = folded.get(key)
+            if entry is None:
+                continue
+            if kind == "created":
+                entry.remote_id = value
+            elif kind == "finished":
+                entry.result = value
+        return list(folded.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
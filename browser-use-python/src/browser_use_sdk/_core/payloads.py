@@ -0,0 +1,54 @@
+"""Lazy decoding of the generated models' raw payload fields.
+
+v2 step actions and v3 message data arrive as JSON-in-a-string, and v4 event
+data is an untyped dict. The ``parse_actions``, ``parse_message`` and
+``as_typed`` helpers decode on first call and keep the result on the
+instance, so consumers that only read ``type`` or ``summary`` never pay for
+decoding.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+V = TypeVar("V")
+
+
+def _cached(obj: BaseModel, key: str, source: Any, decode: Callable[[], V]) -> V:
+    """``decode()``, computed once per ``source`` value and cached on ``obj``.
+
+    The cache remembers which value it decoded, so reassigning the field (or
+    ``model_copy(update=...)``) is never answered with a stale result.
+    """
+    cached = obj.__dict__.get(key)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+    value = decode()
+    # Not a model field: stored directly so it never reaches model_dump().
+    obj.__dict__[key] = (source, value)
+    return value
+
+
+def _loads_or_text(raw: str) -> Any:
+    """Decode ``raw`` if it holds a JSON object or array, else return it unchanged."""
+    if raw.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    return raw
+
+
+class BrowserReady(BaseModel):
+    """Data of a v4 ``browser.ready`` run event."""
+
+    model_config = ConfigDict(extra="allow")
+
+    live_view_url: str
+
+
+# Run event types with a known data shape, for ``as_typed()``.
+_EVENT_MODELS: dict[str, type[BaseModel]] = {"browser.ready": BrowserReady}
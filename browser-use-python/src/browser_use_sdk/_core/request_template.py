@@ -0,0 +1,51 @@
+"""Create bodies whose static fields are serialized once.
+
+High-volume callers send millions of creates that differ only in the task
+(and maybe a field or two). A :class:`RequestTemplate` holds the shared
+fields (settings models, schemas, secrets) already encoded as JSON fragments;
+each create then encodes only its own fields and splices the two together.
+
+Build one with ``tasks.template(...)`` (v2), ``sessions.template(...)`` (v3)
+or ``runs.template(...)`` (v4), which take the same arguments as ``create``::
+
+    template = client.tasks.template(llm="gpt-4.1", secrets=secrets, session_settings=settings)
+    for task in tasks:
+        client.tasks.create(task, template=template)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .codec import default_codec
+from .http import _JSONBytes
+
+
+class RequestTemplate:
+    """Frozen, pre-serialized request fields shared by many creates.
+
+    Fields passed at create time take precedence over the template's.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        # One '"key":value' fragment per field, so a per-call field can
+        # replace a static one without re-encoding the rest.
+        encode = default_codec().encode
+        self._fields = {key: encode({key: value})[1:-1] for key, value in body.items()}
+
+    def __repr__(self) -> str:
+        return f"RequestTemplate({sorted(self._fields)})"
+
+    def render(self, fields: dict[str, Any]) -> _JSONBytes:
+        """Encode ``fields`` and splice in the template's own fields."""
+        parts = [fragment for key, fragment in self._fields.items() if key not in fields]
+        if fields:
+            parts.insert(0, default_codec().encode(fields)[1:-1])
+        return _JSONBytes(b"{" + b",".join(parts) + b"}")
+
+
+def _render(template: RequestTemplate | None, body: dict[str, Any]) -> Any:
+    """``body``, spliced into ``template`` when one is given."""
+    return body if template is None else template.render(body)
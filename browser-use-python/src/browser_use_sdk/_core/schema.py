@@ -0,0 +1,208 @@
+"""Per-class cache of structured-output JSON schemas, shared by v2 and v3.
+
+``model_json_schema()`` walks the whole model tree on every call, which adds
+up when a batch sends the same output schema thousands of times. Schemas are
+computed once per model class; classes are held weakly so models created on
+the fly can still be garbage collected.
+
+``compact=True`` selects a minimized schema that validates exactly the same
+documents: pydantic's auto-generated titles are dropped, ``$defs`` are inlined
+wherever that does not grow the payload, and JSON is written without
+whitespace. Explicit titles and descriptions are kept, since the agent reads
+them. Use :func:`schema_sizes` to see what a model saves.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import weakref
+from typing import Any, Callable, Iterator
+
+from pydantic import BaseModel
+
+_schemas: weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]] = weakref.WeakKeyDictionary()
+_serialized: weakref.WeakKeyDictionary[type[BaseModel], str] = weakref.WeakKeyDictionary()
+_compact_schemas: weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]] = weakref.WeakKeyDictionary()
+_compact_serialized: weakref.WeakKeyDictionary[type[BaseModel], str] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+_DEFS = "#/$defs/"
+
+# Keywords whose value is a subschema (or a list of them), and keywords whose
+# value maps names to subschemas. Everything else (enum, const, default,
+# examples, ...) is literal data and is never rewritten.
+_SUBSCHEMA_KEYWORDS = frozenset({
+    "items", "prefixItems", "additionalItems", "additionalProperties", "contains",
+    "propertyNames", "unevaluatedItems", "unevaluatedProperties",
+    "not", "if", "then", "else", "allOf", "anyOf", "oneOf",
+})
+_SUBSCHEMA_MAPS = frozenset({"properties", "patternProperties", "dependentSchemas", "$defs", "definitions"})
+
+# Keywords that only annotate; a ``$ref`` sibling of these can simply override
+# the referenced schema's value when the reference is inlined.
+_ANNOTATIONS = frozenset({"title", "description", "default", "examples", "deprecated", "readOnly", "writeOnly"})
+
+
+def json_schema(model: type[BaseModel], *, compact: bool = False) -> dict[str, Any]:
+    """``model.model_json_schema()``, computed once per class.
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
+    cache = _compact_schemas if compact else _schemas
+    schema = cache.get(model)
+    if schema is None:
+        schema = compact_schema(json_schema(model), title=model.__name__) if compact else model.model_json_schema()
+        with _lock:
+            schema = cache.setdefault(model, schema)
+    return schema
+
+
+def json_schema_str(model: type[BaseModel], *, compact: bool = False) -> str:
+    """``json.dumps(model.model_json_schema())``, computed once per class."""
+    cache = _compact_serialized if compact else _serialized
+    text = cache.get(model)
+    if text is None:
+        schema = json_schema(model, compact=compact)
+        text = json.dumps(schema, separators=(",", ":")) if compact else json.dumps(schema)
+        with _lock:
+            text = cache.setdefault(model, text)
+    return text
+
+
+def schema_sizes(model: type[BaseModel]) -> tuple[int, int]:
+    """Bytes of ``model``'s output schema as sent by default and with ``compact_schemas=True``.
+
+    Usage::
+
+        full, compact = schema_sizes(Product)
+        print(f"{full} -> {compact} bytes ({1 - compact / full:.0%} smaller)")
+    """
+    return len(json_schema_str(model).encode()), len(json_schema_str(model, compact=True).encode())
+
+
+def compact_schema(schema: dict[str, Any], *, title: str | None = None) -> dict[str, Any]:
+    """Minimize a pydantic JSON schema without changing what it accepts.
+
+    ``title`` is the root's auto-generated title (the model's class name), which
+    is dropped along with the generated field and ``$defs`` titles.
+    """
+    return _inline_defs(_strip_titles(schema, title))
+
+
+def _title_from_name(name: str) -> str:
+    # Mirrors pydantic's GenerateJsonSchema.get_title_from_name.
+    return name.title().replace("_", " ").strip()
+
+
+def _subschemas(node: dict[str, Any]) -> Iterator[Any]:
+    for key, value in node.items():
+        if key in _SUBSCHEMA_MAPS and isinstance(value, dict):
+            yield from value.values()
+        elif key in _SUBSCHEMA_KEYWORDS:
+            yield from value if isinstance(value, list) else (value,)
+
+
+def _map_subschemas(node: dict[str, Any], fn: Callable[[Any, str, str | None], Any]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in _SUBSCHEMA_MAPS and isinstance(value, dict):
+            value = {name: fn(sub, key, name) for name, sub in value.items()}
+        elif key in _SUBSCHEMA_KEYWORDS:
+            value = [fn(sub, key, None) for sub in value] if isinstance(value, list) else fn(value, key, None)
+        out[key] = value
+    return out
+
+
+def _strip_titles(node: Any, auto_title: str | None) -> Any:
+    if not isinstance(node, dict):
+        return node
+
+    def child(sub: Any, keyword: str, name: str | None) -> Any:
+        if keyword == "properties" and name is not None:
+            return _strip_titles(sub, _title_from_name(name))
+        if keyword in ("$defs", "definitions") and name is not None and isinstance(sub, dict):
+            # Generic models are keyed by a mangled title: Page[Item] -> Page_Item_.
+            generated = sub.get("title")
+            if isinstance(generated, str) and re.sub(r"\W", "_", generated) == name:
+                return _strip_titles(sub, generated)
+            return _strip_titles(sub, name)
+        return _strip_titles(sub, None)
+
+    out = _map_subschemas(node, child)
+    if auto_title is not None and out.get("title") == auto_title:
+        del out["title"]
+    return out
+
+
+def _refs(node: Any, found: list[str]) -> list[str]:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_DEFS):
+            found.append(ref[len(_DEFS):])
+        for sub in _subschemas(node):
+            _refs(sub, found)
+    return found
+
+
+def _substitute(node: Any, ref: str, target: dict[str, Any]) -> Any:
+    if not isinstance(node, dict):
+        return node
+    if node.get("$ref") == ref:
+        siblings = {k: v for k, v in node.items() if k != "$ref"}
+        if (siblings.keys() & target.keys()) - _ANNOTATIONS:
+            return {"allOf": [target], **siblings}
+        return {**target, **siblings}
+    return _map_subschemas(node, lambda sub, _keyword, _name: _substitute(sub, ref, target))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _recursive(defs: dict[str, Any]) -> set[str]:
+    edges = {name: set(_refs(body, [])) for name, body in defs.items()}
+    recursive: set[str] = set()
+    for start in defs:
+        stack, seen = list(edges[start]), set()
+        while stack:
+            name = stack.pop()
+            if name == start:
+                recursive.add(start)
+                break
+            if name in seen or name not in edges:
+                continue
+            seen.add(name)
+            stack.extend(edges[name])
+    return recursive
+
+
+def _inline_defs(schema: dict[str, Any]) -> dict[str, Any]:
+    defs = dict(schema.get("$defs") or {})
+    if not defs:
+        return schema
+    body = {k: v for k, v in schema.items() if k != "$defs"}
+    changed = True
+    while changed:
+        changed = False
+        counts: dict[str, int] = {}
+        for name in _refs(body, []) + [n for sub in defs.values() for n in _refs(sub, [])]:
+            counts[name] = counts.get(name, 0) + 1
+        recursive = _recursive(defs)
+        for name, target in defs.items():
+            uses = counts.get(name, 0)
+            if uses and name in recursive:
+                continue
+            # Inline unless repeating the definition at every use costs more
+            # than keeping it once under $defs and referencing it.
+            size = len(_dumps(target))
+            if uses * size > size + len(_dumps(name)) + 1 + uses * len(_dumps({"$ref": _DEFS + name})):
+                continue
+            ref = _DEFS + name
+            del defs[name]
+            body = _substitute(body, ref, target)
+            defs = {other: _substitute(sub, ref, target) for other, sub in defs.items()}
+            changed = True
+            break
+    return {"$defs": defs, **body} if defs else body
@@ -0,0 +1,127 @@
+"""Merged polling of many event streams from a single task.
+
+:func:`merge_polled` drives any number of cursor-based streams (v4 run events,
+v3 session messages) from one async generator instead of one task per
+stream. Scheduling is adaptive and fair:
+
+- a stream with more pages waiting is fetched again right away, but behind
+  every other stream that is already due, so one chatty run cannot starve
+  the rest;
+- a stream that just produced items is polled at the base ``interval``;
+- a quiet stream backs off exponentially up to ``max_interval``.
+
+Items of one scheduling round are interleaved round-robin across streams.
+A stream whose tick fails is dropped on its own and the others keep going.
+Failures are passed to ``on_error`` as they happen; without one, the first
+failure is raised only once every other stream has finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Tick(Generic[T]):
+    """Outcome of polling one stream once.
+
+    ``more`` means another page is already waiting (poll again without
+    delay); ``done`` means the stream has finished and is dropped.
+    """
+
+    __slots__ = ("items", "more", "done")
+
+    def __init__(self, items: list[T], *, more: bool = False, done: bool = False) -> None:
+        self.items = items
+        self.more = more
+        self.done = done
+
+
+async def merge_polled(
+    keys: Iterable[str],
+    tick: Callable[[str], Awaitable[Tick[T]]],
+    *,
+    interval: float = 2,
+    max_interval: float = 30,
+    concurrency: int = 10,
+    timeout: float = 14400,
+    label: str = "Stream",
+    on_error: Callable[[str, Exception], Any] | None = None,
+) -> AsyncIterator[tuple[str, T]]:
+    """Yield ``(key, item)`` pairs from every stream until all are done.
+
+    ``tick(key)`` fetches one page for ``key`` and owns its cursor. At most
+    ``concurrency`` ticks are in flight at once. A stream still running
+    after ``timeout`` seconds raises :class:`TimeoutError`. If ``tick``
+    raises for a key, that stream ends and ``on_error(key, error)`` (sync or
+    async) is called right away. Without ``on_error`` the rest are drained
+    before the first such error is re-raised, which can be long after it
+    happened.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    seq = itertools.count()
+    started = time.monotonic()
+    backoff: dict[str, float] = {}
+    heap: list[tuple[float, int, str]] = []
+    failure: BaseException | None = None
+    for key in dict.fromkeys(keys):
+        backoff[key] = interval
+        heapq.heappush(heap, (started, next(seq), key))
+
+    while heap:
+        wait = heap[0][0] - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        now = time.monotonic()
+        batch: list[str] = []
+        while heap and heap[0][0] <= now and len(batch) < concurrency:
+            batch.append(heapq.heappop(heap)[2])
+
+        outcomes = await asyncio.gather(*(tick(key) for key in batch), return_exceptions=True)
+
+        results: list[tuple[str, Tick[T]]] = []
+        for key, outcome in zip(batch, outcomes):
+            if isinstance(outcome, Tick):
+                results.append((key, outcome))
+            elif not isinstance(outcome, Exception):
+                raise outcome  # cancellation and the like stop everything
+            elif on_error is not None:
+                ret = on_error(key, outcome)
+                if inspect.isawaitable(ret):
+                    await ret
+            elif failure is None:
+                failure = outcome
+
+        per_stream = [[(key, item) for item in result.items] for key, result in results]
+        for pairs in itertools.zip_longest(*per_stream):
+            for pair in pairs:
+                if pair is not None:
+                    yield pair
+
+        now = time.monotonic()
+        for key, result in results:
+            if result.done:
+                continue
+            if now - started > timeout:
+                raise TimeoutError(f"{label} {key} did not complete within {timeout}s")
+            if result.more:
+                delay = 0.0
+            elif result.items:
+                backoff[key] = interval
+                delay = interval
+            else:
+                backoff[key] = min(backoff[key] * 2, max_interval)
+                delay = backoff[key]
+            heapq.heappush(heap, (now + delay, next(seq), key))
+
+    if failure is not None:
+        raise failure
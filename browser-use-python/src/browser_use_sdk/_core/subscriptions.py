@@ -0,0 +1,210 @@
+"""Fan-out of one upstream poll loop to many async subscribers.
+
+A :class:`SubscriptionHub` keeps exactly one poll loop (and so one upstream
+cursor) per key — a v3 session id or a v4 run id. Every subscriber gets its
+own bounded buffer; the overflow policy decides what happens when a
+subscriber falls behind:
+
+- ``"block"``: the shared poll loop waits for the slow subscriber (no loss,
+  but it also holds back every other subscriber on that key).
+- ``"drop_oldest"``: the oldest buffered item is discarded.
+- ``"drop_newest"``: the incoming item is discarded.
+
+Dropped items are counted on :attr:`Subscription.dropped`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Literal, TypeVar
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+Publish = Callable[[T], Awaitable[None]]
+"""Callback a poll loop awaits for every new upstream item."""
+
+
+class Subscription(Generic[T]):
+    """One subscriber's bounded view of a shared feed. Iterate with ``async for``.
+
+    Iteration ends when the upstream run/session reaches a terminal state, and
+    re-raises the poll loop's error if it failed. Call :meth:`close` (or use
+    ``async with``) to unsubscribe early; the upstream poll loop stops once
+    its last subscriber leaves.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        maxsize: int,
+        overflow: OverflowPolicy,
+        release: Callable[[Subscription[T]], None],
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {_OVERFLOW_POLICIES}, got {overflow!r}")
+        self.key = key
+        self.dropped = 0
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._release = release
+        self._buffer: deque[T] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._done = False
+        self._closed = False
+        self._error: BaseException | None = None
+
+    async def _put(self, item: T) -> None:
+        if self._closed:
+            return
+        if len(self._buffer) >= self._maxsize:
+            if self._overflow == "drop_newest":
+                self.dropped += 1
+                return
+            if self._overflow == "drop_oldest":
+                self._buffer.popleft()
+                self.dropped += 1
+            else:
+                while len(self._buffer) >= self._maxsize and not self._closed:
+                    self._writable.clear()
+                    await self._writable.wait()
+                if self._closed:
+                    return
+        self._buffer.append(item)
+        self._readable.set()
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        self._done = True
+        self._error = error
+        self._readable.set()
+
+    def __aiter__(self) -> Subscription[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._buffer:
+            if self._done or self._closed:
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+        item = self._buffer.popleft()
+        self._writable.set()
+        return item
+
+    def close(self) -> None:
+        """Unsubscribe. Buffered items are discarded."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        self._writable.set()
+        self._readable.set()
+        self._release(self)
+
+    async def __aenter__(self) -> Subscription[T]:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.close()
+
+
+class _Feed(Generic[T]):
+    """The single poll loop behind every subscription to one key."""
+
+    def __init__(self, key: str, poll: Callable[[str, Publish[T]], Awaitable[None]]) -> None:
+        self.key = key
+        self.subscribers: list[Subscription[T]] = []
+        self._poll = poll
+        self.task: asyncio.Future[None] | None = None
+
+    def start(self, on_done: Callable[[_Feed[T]], None]) -> None:
+        async def run() -> None:
+            error: BaseException | None = None
+            try:
+                await self._poll(self.key, self._publish)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+            finally:
+                on_done(self)
+                for sub in list(self.subscribers):
+                    sub._finish(error)
+
+        self.task = asyncio.ensure_future(run())
+
+    async def _publish(self, item: T) -> None:
+        for sub in list(self.subscribers):
+            await sub._put(item)
+
+
+class SubscriptionHub(Generic[T]):
+    """Keeps one upstream poll loop per key and fans items out to subscribers.
+
+    ``poll(key, publish)`` is the upstream loop: it awaits ``publish(item)``
+    for every new item and returns once the stream is finished.
+    """
+
+    def __init__(self, poll: Callable[[str, Publish[T]], Awaitable[None]]) -> None:
+        self._poll = poll
+        self._feeds: dict[str, _Feed[T]] = {}
+
+    def subscribe(
+        self,
+        key: str,
+        *,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+    ) -> Subscription[T]:
+        """Attach a subscriber to ``key``, starting its poll loop if needed.
+
+        Subscribers see items published after they join; the first subscriber
+        on a key starts the upstream cursor from the beginning.
+        """
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = _Feed(key, self._poll)
+            self._feeds[key] = feed
+            feed.start(self._forget)
+        sub: Subscription[T] = Subscription(key, maxsize=maxsize, overflow=overflow, release=self._unsubscribe)
+        feed.subscribers.append(sub)
+        return sub
+
+    def _unsubscribe(self, sub: Subscription[T]) -> None:
+        feed = self._feeds.get(sub.key)
+        if feed is None or sub not in feed.subscribers:
+            return
+        feed.subscribers.remove(sub)
+        if not feed.subscribers and feed.task is not None:
+            self._forget(feed)
+            feed.task.cancel()
+
+    def _forget(self, feed: _Feed[Any]) -> None:
+        if self._feeds.get(feed.key) is feed:
+            del self._feeds[feed.key]
+
+    def active_keys(self) -> list[str]:
+        """Keys that currently have a running poll loop."""
+        return list(self._feeds)
+
+    def close(self) -> None:
+        """Stop every poll loop and end all subscriptions."""
+        for feed in list(self._feeds.values()):
+            self._forget(feed)
+            if feed.task is not None:
+                feed.task.cancel()
+            for sub in list(feed.subscribers):
+                sub._finish()
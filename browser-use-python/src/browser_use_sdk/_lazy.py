@@ -0,0 +1,50 @@
+"""Module-level ``__getattr__`` exports for the public packages.
+
+``import browser_use_sdk.v4`` used to import every generated v2 model through
+the root package, and each package eagerly built the pydantic schemas of all
+the models it re-exports. Packages now list their exports here instead and
+import a name's module the first time the name is accessed. The real imports
+stay under ``TYPE_CHECKING`` for type checkers and IDEs.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Iterable
+from typing import Any, Callable
+
+
+def attach(
+    package: str,
+    exports: dict[str, Iterable[str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` for ``package``.
+
+    ``exports`` maps a module path relative to ``package`` to the names it
+    provides; ``"Alias=Name"`` exports ``Name`` under another name.
+
+    Usage::
+
+        __getattr__, __dir__ = attach(__name__, {".client": ["BrowserUse"]})
+    """
+    targets: dict[str, tuple[str, str]] = {}
+    for module, names in exports.items():
+        for name in names:
+            alias, _, attr = name.partition("=")
+            targets[alias] = (module, attr or alias)
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module, attr = targets[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module, package), attr)
+        # Cache on the package so later lookups skip __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(targets))
+
+    return __getattr__, __dir__
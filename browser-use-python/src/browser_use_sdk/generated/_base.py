@@ -0,0 +1,13 @@
+"""Base class for the generated models (``datamodel-codegen --base-class``)."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredBuildModel(BaseModel):
+    """Builds its validator on first use instead of when the module is imported.
+
+    The generated modules define hundreds of models and most processes touch
+    a handful, so building them all at import is wasted cold-start time.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -7,14 +7,16 @@ from enum import Enum
 from typing import Any, Dict, List, Literal
 from uuid import UUID
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, RootModel
+from pydantic import AwareDatetime, ConfigDict, Field, RootModel
 
+from .._base import DeferredBuildModel
 
-class AccountNotFoundError(BaseModel):
+
+class AccountNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Account not found', title='Detail')
 
 
-class BrowserDownloadFile(BaseModel):
+class BrowserDownloadFile(DeferredBuildModel):
     path: str = Field(
         ...,
         description='File name (basename relative to the session downloads prefix)',
@@ -34,7 +36,7 @@ class BrowserDownloadFile(BaseModel):
     )
 
 
-class BrowserDownloadListResponse(BaseModel):
+class BrowserDownloadListResponse(DeferredBuildModel):
     files: List[BrowserDownloadFile] = Field(
         ..., description='List of files downloaded by the browser', title='Files'
     )
@@ -61,7 +63,7 @@ class BrowserSessionUpdateAction(Enum):
     stop = 'stop'
 
 
-class BrowserSessionView(BaseModel):
+class BrowserSessionView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -136,20 +138,20 @@ class BrowserSessionView(BaseModel):
     )
 
 
-class CannotDeleteSkillWhileGeneratingError(BaseModel):
+class CannotDeleteSkillWhileGeneratingError(DeferredBuildModel):
     detail: str | None = Field(
         'Cannot delete skill while it is still generating', title='Detail'
     )
 
 
-class CannotRollbackPublicSkillError(BaseModel):
+class CannotRollbackPublicSkillError(DeferredBuildModel):
     detail: str | None = Field(
         'Cannot rollback a public skill. Please make the skill private first.',
         title='Detail',
     )
 
 
-class ConcurrentSkillCreationsError(BaseModel):
+class ConcurrentSkillCreationsError(DeferredBuildModel):
     detail: str | None = Field(
         'Concurrent skill creations are not allowed. Please wait for the current skill creation to finish or cancel it.',
         title='Detail',
@@ -194,7 +196,7 @@ class Description(RootModel[str]):
     )
 
 
-class CreateSkillRequest(BaseModel):
+class CreateSkillRequest(DeferredBuildModel):
     title: Title | None = Field(
         None,
         description='Optional title for the skill (will be generated if not provided)',
@@ -220,7 +222,7 @@ class CreateSkillRequest(BaseModel):
     )
 
 
-class CreateSkillResponse(BaseModel):
+class CreateSkillResponse(DeferredBuildModel):
     id: UUID = Field(
         ..., description='Unique identifier for the created skill', title='ID'
     )
@@ -255,7 +257,7 @@ class Password(RootModel[str]):
     )
 
 
-class CustomProxy(BaseModel):
+class CustomProxy(DeferredBuildModel):
     host: str = Field(
         ...,
         description='Host of the proxy.',
@@ -280,17 +282,17 @@ class CustomProxy(BaseModel):
     )
 
 
-class DownloadUrlGenerationError(BaseModel):
+class DownloadUrlGenerationError(DeferredBuildModel):
     detail: str | None = Field('Failed to generate download URL', title='Detail')
 
 
-class EnabledSkillsLimitExceededError(BaseModel):
+class EnabledSkillsLimitExceededError(DeferredBuildModel):
     detail: str | None = Field(
         'Enabled skills limit exceeded for your plan', title='Detail'
     )
 
 
-class ExecuteSkillRequest(BaseModel):
+class ExecuteSkillRequest(DeferredBuildModel):
     parameters: Dict[str, Any] | None = Field(
         None, description='Parameters to pass to the skill handler', title='Parameters'
     )
@@ -302,7 +304,7 @@ class ExecuteSkillRequest(BaseModel):
     )
 
 
-class ExecuteSkillResponse(BaseModel):
+class ExecuteSkillResponse(DeferredBuildModel):
     success: bool = Field(
         ..., description='Whether the skill execution was successful', title='Success'
     )
@@ -323,7 +325,7 @@ class ExecuteSkillResponse(BaseModel):
     )
 
 
-class FileView(BaseModel):
+class FileView(DeferredBuildModel):
     id: UUID = Field(
         ..., description='Unique identifier for the output file', title='ID'
     )
@@ -332,19 +334,19 @@ class FileView(BaseModel):
     )
 
 
-class GenerationNotCancellableError(BaseModel):
+class GenerationNotCancellableError(DeferredBuildModel):
     detail: str | None = Field('Generation is not cancellable', title='Detail')
 
 
-class InsufficientCreditsError(BaseModel):
+class InsufficientCreditsError(DeferredBuildModel):
     detail: str | None = Field('Insufficient credits', title='Detail')
 
 
-class InternalServerError(BaseModel):
+class InternalServerError(DeferredBuildModel):
     detail: str | None = Field('An internal server error occurred', title='Detail')
 
 
-class OutputFileNotFoundError(BaseModel):
+class OutputFileNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Output file not found', title='Detail')
 
 
@@ -357,7 +359,7 @@ class ParameterType(Enum):
     cookie = 'cookie'
 
 
-class PlanInfo(BaseModel):
+class PlanInfo(DeferredBuildModel):
     plan_name: str = Field(
         ..., alias='planName', description='The name of the plan', title='Plan Name'
     )
@@ -402,7 +404,7 @@ class UserId(RootModel[str]):
     )
 
 
-class ProfileCreateRequest(BaseModel):
+class ProfileCreateRequest(DeferredBuildModel):
     name: Name | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -414,11 +416,11 @@ class ProfileCreateRequest(BaseModel):
     )
 
 
-class ProfileNotFoundError(BaseModel):
+class ProfileNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Profile not found', title='Detail')
 
 
-class ProfileUpdateRequest(BaseModel):
+class ProfileUpdateRequest(DeferredBuildModel):
     name: Name | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -430,7 +432,7 @@ class ProfileUpdateRequest(BaseModel):
     )
 
 
-class ProfileView(BaseModel):
+class ProfileView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the profile', title='ID')
     user_id: str | None = Field(
         None,
@@ -717,7 +719,7 @@ class ProxyCountryCode(Enum):
     zw = 'zw'
 
 
-class RefineSkillRequest(BaseModel):
+class RefineSkillRequest(DeferredBuildModel):
     feedback: str = Field(
         ...,
         description='Feedback describing what to improve',
@@ -738,22 +740,22 @@ class RefineSkillRequest(BaseModel):
     )
 
 
-class RefineSkillResponse(BaseModel):
+class RefineSkillResponse(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the skill', title='ID')
 
 
-class SessionHasRunningTaskError(BaseModel):
+class SessionHasRunningTaskError(DeferredBuildModel):
     detail: str | None = Field(
         'Agent session already has a running task. Please wait for it to finish or stop it manually.',
         title='Detail',
     )
 
 
-class SessionNotFoundError(BaseModel):
+class SessionNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Session not found', title='Detail')
 
 
-class SessionSettings(BaseModel):
+class SessionSettings(DeferredBuildModel):
     model_config = ConfigDict(populate_by_name=True)
 
     profile_id: UUID | None = Field(
@@ -793,14 +795,14 @@ class SessionStatus(Enum):
     stopped = 'stopped'
 
 
-class SessionStoppedError(BaseModel):
+class SessionStoppedError(DeferredBuildModel):
     detail: str | None = Field(
         'Browser session is stopped. Please start a new session and try again.',
         title='Detail',
     )
 
 
-class SessionTimeoutLimitExceededError(BaseModel):
+class SessionTimeoutLimitExceededError(DeferredBuildModel):
     detail: str | None = Field(
         'Maximum session timeout is 4 hours (240 minutes).', title='Detail'
     )
@@ -810,11 +812,11 @@ class SessionUpdateAction(Enum):
     stop = 'stop'
 
 
-class ShareNotFoundError(BaseModel):
+class ShareNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Public share not found', title='Detail')
 
 
-class ShareView(BaseModel):
+class ShareView(DeferredBuildModel):
     share_token: str = Field(
         ...,
         alias='shareToken',
@@ -860,7 +862,7 @@ class SkillCategory(Enum):
     other = 'other'
 
 
-class SkillExecutionOutputResponse(BaseModel):
+class SkillExecutionOutputResponse(DeferredBuildModel):
     download_url: str = Field(
         ...,
         alias='downloadUrl',
@@ -869,7 +871,7 @@ class SkillExecutionOutputResponse(BaseModel):
     )
 
 
-class SkillExecutionView(BaseModel):
+class SkillExecutionView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the execution', title='Id')
     skill_id: UUID = Field(
         ...,
@@ -909,11 +911,11 @@ class SkillExecutionView(BaseModel):
     )
 
 
-class SkillNotFinishedError(BaseModel):
+class SkillNotFinishedError(DeferredBuildModel):
     detail: str | None = Field('Skill is not finished', title='Detail')
 
 
-class SkillNotFoundError(BaseModel):
+class SkillNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Skill not found', title='Detail')
 
 
@@ -948,7 +950,7 @@ class SupportedLLMs(Enum):
     claude_3_7_sonnet_20250219 = 'claude-3-7-sonnet-20250219'
 
 
-class TaskCreatedResponse(BaseModel):
+class TaskCreatedResponse(DeferredBuildModel):
     id: UUID = Field(
         ..., description='Unique identifier for the created task', title='ID'
     )
@@ -972,7 +974,7 @@ class Cost(RootModel[str]):
     )
 
 
-class TaskLogFileResponse(BaseModel):
+class TaskLogFileResponse(DeferredBuildModel):
     download_url: str = Field(
         ...,
         alias='downloadUrl',
@@ -981,11 +983,11 @@ class TaskLogFileResponse(BaseModel):
     )
 
 
-class TaskNotFoundError(BaseModel):
+class TaskNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Task not found', title='Detail')
 
 
-class TaskOutputFileResponse(BaseModel):
+class TaskOutputFileResponse(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the file', title='ID')
     file_name: str = Field(
         ..., alias='fileName', description='Name of the file', title='File Name'
@@ -1018,7 +1020,7 @@ class Cost1(RootModel[str]):
     )
 
 
-class TaskStatusView(BaseModel):
+class TaskStatusView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the task', title='ID')
     status: TaskStatus = Field(
         ..., description='Current status of the task', title='Status'
@@ -1045,7 +1047,7 @@ class TaskStatusView(BaseModel):
     )
 
 
-class TaskStepView(BaseModel):
+class TaskStepView(DeferredBuildModel):
     number: int = Field(
         ..., description='Sequential step number within the task', title='Number'
     )
@@ -1100,7 +1102,7 @@ class Cost2(RootModel[str]):
     )
 
 
-class TaskView(BaseModel):
+class TaskView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the task', title='ID')
     session_id: UUID = Field(..., alias='sessionId', title='Sessionid')
     llm: str = Field(
@@ -1177,24 +1179,24 @@ class TaskView(BaseModel):
     )
 
 
-class TooManyConcurrentActiveSessionsError(BaseModel):
+class TooManyConcurrentActiveSessionsError(DeferredBuildModel):
     detail: str | None = Field(
         'Too many concurrent active sessions. Please wait for one to finish, kill one, or upgrade your plan.',
         title='Detail',
     )
 
 
-class UnsupportedContentTypeError(BaseModel):
+class UnsupportedContentTypeError(DeferredBuildModel):
     detail: str | None = Field('Unsupported content type', title='Detail')
 
 
-class UpdateBrowserSessionRequest(BaseModel):
+class UpdateBrowserSessionRequest(DeferredBuildModel):
     action: BrowserSessionUpdateAction = Field(
         ..., description='The action to perform on the session', title='Action'
     )
 
 
-class UpdateSessionRequest(BaseModel):
+class UpdateSessionRequest(DeferredBuildModel):
     action: SessionUpdateAction = Field(
         ..., description='The action to perform on the session', title='Action'
     )
@@ -1218,7 +1220,7 @@ class Description1(RootModel[str]):
     )
 
 
-class UpdateSkillRequest(BaseModel):
+class UpdateSkillRequest(DeferredBuildModel):
     title: Title1 | None = Field(
         None,
         description='Display name for the skill (shows up in the public view)',
@@ -1243,13 +1245,13 @@ class UpdateSkillRequest(BaseModel):
     )
 
 
-class UpdateTaskRequest(BaseModel):
+class UpdateTaskRequest(DeferredBuildModel):
     action: TaskUpdateAction = Field(
         ..., description='The action to perform on the task', title='Action'
     )
 
 
-class UploadFilePresignedUrlResponse(BaseModel):
+class UploadFilePresignedUrlResponse(DeferredBuildModel):
     url: str = Field(..., description='The URL to upload the file to.', title='URL')
     method: Literal['POST'] = Field(
         ..., description='The HTTP method to use for the upload.', title='Method'
@@ -1294,7 +1296,7 @@ class ContentType(Enum):
     text_markdown = 'text/markdown'
 
 
-class UploadFileRequest(BaseModel):
+class UploadFileRequest(DeferredBuildModel):
     file_name: str = Field(
         ...,
         alias='fileName',
@@ -1314,13 +1316,13 @@ class UploadFileRequest(BaseModel):
     )
 
 
-class ValidationError(BaseModel):
+class ValidationError(DeferredBuildModel):
     loc: List[str | int] = Field(..., title='Location')
     msg: str = Field(..., title='Message')
     type: str = Field(..., title='Error Type')
 
 
-class AccountView(BaseModel):
+class AccountView(DeferredBuildModel):
     name: str | None = Field(None, description='The name of the user', title='Name')
     total_credits_balance_usd: float = Field(
         ...,
@@ -1360,7 +1362,7 @@ class AccountView(BaseModel):
     )
 
 
-class BrowserSessionItemView(BaseModel):
+class BrowserSessionItemView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -1435,7 +1437,7 @@ class BrowserSessionItemView(BaseModel):
     )
 
 
-class BrowserSessionListResponse(BaseModel):
+class BrowserSessionListResponse(DeferredBuildModel):
     items: List[BrowserSessionItemView] = Field(
         ...,
         description='List of browser session views for the current page',
@@ -1455,7 +1457,7 @@ class BrowserSessionListResponse(BaseModel):
     )
 
 
-class CreateBrowserSessionRequest(BaseModel):
+class CreateBrowserSessionRequest(DeferredBuildModel):
     profile_id: UUID | None = Field(
         None,
         alias='profileId',
@@ -1505,7 +1507,7 @@ class CreateBrowserSessionRequest(BaseModel):
     )
 
 
-class CreateSessionRequest(BaseModel):
+class CreateSessionRequest(DeferredBuildModel):
     profile_id: UUID | None = Field(
         None,
         alias='profileId',
@@ -1562,7 +1564,7 @@ class CreateSessionRequest(BaseModel):
     )
 
 
-class CreateTaskRequest(BaseModel):
+class CreateTaskRequest(DeferredBuildModel):
     task: str = Field(
         ...,
         description='The task prompt/instruction for the agent.',
@@ -1681,11 +1683,11 @@ class CreateTaskRequest(BaseModel):
     )
 
 
-class HTTPValidationError(BaseModel):
+class HTTPValidationError(DeferredBuildModel):
     detail: List[ValidationError] | None = Field(None, title='Detail')
 
 
-class ParameterSchema(BaseModel):
+class ParameterSchema(DeferredBuildModel):
     name: str = Field(..., title='Name')
     type: ParameterType
     required: bool | None = Field(True, title='Required')
@@ -1694,7 +1696,7 @@ class ParameterSchema(BaseModel):
     cookie_domain: str | None = Field(None, alias='cookieDomain', title='Cookiedomain')
 
 
-class ProfileListResponse(BaseModel):
+class ProfileListResponse(DeferredBuildModel):
     items: List[ProfileView] = Field(
         ..., description='List of profile views for the current page', title='Items'
     )
@@ -1712,7 +1714,7 @@ class ProfileListResponse(BaseModel):
     )
 
 
-class SessionItemView(BaseModel):
+class SessionItemView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -1774,7 +1776,7 @@ class SessionItemView(BaseModel):
     )
 
 
-class SessionListResponse(BaseModel):
+class SessionListResponse(DeferredBuildModel):
     items: List[SessionItemView] = Field(
         ..., description='List of session views for the current page', title='Items'
     )
@@ -1792,7 +1794,7 @@ class SessionListResponse(BaseModel):
     )
 
 
-class SkillExecutionListResponse(BaseModel):
+class SkillExecutionListResponse(DeferredBuildModel):
     items: List[SkillExecutionView] = Field(
         ..., description='List of executions', title='Items'
     )
@@ -1810,7 +1812,7 @@ class SkillExecutionListResponse(BaseModel):
     )
 
 
-class SkillResponse(BaseModel):
+class SkillResponse(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the skill', title='ID')
     slug: str | None = Field(
         None, description='URL-friendly slug for the skill', title='Slug'
@@ -1921,7 +1923,7 @@ class SkillResponse(BaseModel):
     )
 
 
-class TaskItemView(BaseModel):
+class TaskItemView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the task', title='ID')
     session_id: UUID = Field(
         ...,
@@ -1999,7 +2001,7 @@ class TaskItemView(BaseModel):
     )
 
 
-class TaskListResponse(BaseModel):
+class TaskListResponse(DeferredBuildModel):
     items: List[TaskItemView] = Field(
         ..., description='List of task views for the current page', title='Items'
     )
@@ -2017,7 +2019,7 @@ class TaskListResponse(BaseModel):
     )
 
 
-class MarketplaceSkillResponse(BaseModel):
+class MarketplaceSkillResponse(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the skill', title='ID')
     slug: str = Field(..., description='URL-friendly slug for the skill', title='Slug')
     title: str = Field(
@@ -2089,7 +2091,7 @@ class MarketplaceSkillResponse(BaseModel):
     )
 
 
-class SessionView(BaseModel):
+class SessionView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -2160,7 +2162,7 @@ class SessionView(BaseModel):
     )
 
 
-class SkillListResponse(BaseModel):
+class SkillListResponse(DeferredBuildModel):
     items: List[SkillResponse] = Field(..., description='List of skills', title='Items')
     total_items: int = Field(
         ...,
@@ -2176,7 +2178,7 @@ class SkillListResponse(BaseModel):
     )
 
 
-class MarketplaceSkillListResponse(BaseModel):
+class MarketplaceSkillListResponse(DeferredBuildModel):
     items: List[MarketplaceSkillResponse] = Field(
         ..., description='List of skills', title='Items'
     )
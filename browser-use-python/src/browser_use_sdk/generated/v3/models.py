@@ -7,10 +7,12 @@ from enum import Enum
 from typing import Any, Dict, List
 from uuid import UUID
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, RootModel
+from pydantic import AwareDatetime, ConfigDict, Field, RootModel
 
+from .._base import DeferredBuildModel
 
-class AccountNotFoundError(BaseModel):
+
+class AccountNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Account not found', title='Detail')
 
 
@@ -20,16 +22,16 @@ class Size(Enum):
     large = 'large'
 
 
-class BoxCreateRequest(BaseModel):
+class BoxCreateRequest(DeferredBuildModel):
     profile_id: UUID | None = Field(None, title='Profile Id')
     size: Size | None = Field(None, title='Size')
 
 
-class BoxPatchRequest(BaseModel):
+class BoxPatchRequest(DeferredBuildModel):
     dsp_enabled: bool | None = Field(None, title='Dsp Enabled')
 
 
-class BoxResizeRequest(BaseModel):
+class BoxResizeRequest(DeferredBuildModel):
     size: Size = Field(..., title='Size')
 
 
@@ -38,7 +40,7 @@ class BoxRestartMode(Enum):
     reboot = 'reboot'
 
 
-class BoxRestartRequest(BaseModel):
+class BoxRestartRequest(DeferredBuildModel):
     mode: BoxRestartMode | None = BoxRestartMode.service
 
 
@@ -54,7 +56,7 @@ class Name(Enum):
     large = 'large'
 
 
-class BoxSizeSpecView(BaseModel):
+class BoxSizeSpecView(DeferredBuildModel):
     name: Name = Field(..., title='Name')
     vcpu: int = Field(..., title='Vcpu')
     ram_gb: int = Field(..., title='Ram Gb')
@@ -73,7 +75,7 @@ class BoxStatus(Enum):
     destroyed = 'destroyed'
 
 
-class BoxView(BaseModel):
+class BoxView(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     project_id: UUID = Field(..., title='Project Id')
     profile_id: UUID | None = Field(..., title='Profile Id')
@@ -94,7 +96,7 @@ class BoxView(BaseModel):
     updated_at: AwareDatetime = Field(..., title='Updated At')
 
 
-class BrowserDownloadFile(BaseModel):
+class BrowserDownloadFile(DeferredBuildModel):
     path: str = Field(
         ...,
         description='File name (basename relative to the session downloads prefix)',
@@ -114,7 +116,7 @@ class BrowserDownloadFile(BaseModel):
     )
 
 
-class BrowserDownloadListResponse(BaseModel):
+class BrowserDownloadListResponse(DeferredBuildModel):
     files: List[BrowserDownloadFile] = Field(
         ..., description='List of files downloaded by the browser', title='Files'
     )
@@ -141,7 +143,7 @@ class BrowserSessionUpdateAction(Enum):
     stop = 'stop'
 
 
-class BrowserSessionView(BaseModel):
+class BrowserSessionView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -236,7 +238,7 @@ class BuModel(Enum):
     gpt_5_4_mini = 'gpt-5.4-mini'
 
 
-class ClaudeLoginCodeRequest(BaseModel):
+class ClaudeLoginCodeRequest(DeferredBuildModel):
     code: str = Field(..., title='Code')
 
 
@@ -280,7 +282,7 @@ class Password(RootModel[str]):
     )
 
 
-class CustomProxy(BaseModel):
+class CustomProxy(DeferredBuildModel):
     host: str = Field(
         ...,
         description='Host of the proxy.',
@@ -305,7 +307,7 @@ class CustomProxy(BaseModel):
     )
 
 
-class FileInfo(BaseModel):
+class FileInfo(DeferredBuildModel):
     path: str = Field(
         ...,
         description='File path relative to the session workspace root.',
@@ -325,7 +327,7 @@ class FileInfo(BaseModel):
     )
 
 
-class FileListResponse(BaseModel):
+class FileListResponse(DeferredBuildModel):
     files: List[FileInfo] = Field(..., title='Files')
     folders: List[str] | None = Field(
         None,
@@ -355,7 +357,7 @@ class Size3(RootModel[int]):
     )
 
 
-class FileUploadItem(BaseModel):
+class FileUploadItem(DeferredBuildModel):
     name: str = Field(
         ...,
         description='Filename, e.g. "data.csv"',
@@ -377,11 +379,11 @@ class FileUploadItem(BaseModel):
     )
 
 
-class FileUploadRequest(BaseModel):
+class FileUploadRequest(DeferredBuildModel):
     files: List[FileUploadItem] = Field(..., max_length=10, min_length=1, title='Files')
 
 
-class FileUploadResponseItem(BaseModel):
+class FileUploadResponseItem(DeferredBuildModel):
     name: str = Field(..., description='Original filename as requested.', title='Name')
     upload_url: str = Field(
         ...,
@@ -396,11 +398,11 @@ class FileUploadResponseItem(BaseModel):
     )
 
 
-class InsufficientCreditsError(BaseModel):
+class InsufficientCreditsError(DeferredBuildModel):
     detail: str | None = Field('Insufficient credits', title='Detail')
 
 
-class MessageResponse(BaseModel):
+class MessageResponse(DeferredBuildModel):
     id: UUID = Field(..., description='Unique message identifier.', title='Id')
     session_id: UUID = Field(
         ...,
@@ -447,7 +449,7 @@ class MessageResponse(BaseModel):
     )
 
 
-class PlanInfo(BaseModel):
+class PlanInfo(DeferredBuildModel):
     plan_name: str = Field(
         ..., alias='planName', description='The name of the plan', title='Plan Name'
     )
@@ -492,7 +494,7 @@ class UserId(RootModel[str]):
     )
 
 
-class ProfileCreateRequest(BaseModel):
+class ProfileCreateRequest(DeferredBuildModel):
     name: Name1 | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -504,11 +506,11 @@ class ProfileCreateRequest(BaseModel):
     )
 
 
-class ProfileNotFoundError(BaseModel):
+class ProfileNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Profile not found', title='Detail')
 
 
-class ProfileUpdateRequest(BaseModel):
+class ProfileUpdateRequest(DeferredBuildModel):
     name: Name1 | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -520,7 +522,7 @@ class ProfileUpdateRequest(BaseModel):
     )
 
 
-class ProfileView(BaseModel):
+class ProfileView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the profile', title='ID')
     user_id: str | None = Field(
         None,
@@ -807,11 +809,11 @@ class ProxyCountryCode(Enum):
     zw = 'zw'
 
 
-class RunTaskRequest(BaseModel):
+class RunTaskRequest(DeferredBuildModel):
     prompt: str = Field(..., title='Prompt')
 
 
-class SessionNotFoundError(BaseModel):
+class SessionNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Session not found', title='Detail')
 
 
@@ -827,7 +829,7 @@ class MaxCostUsd(RootModel[str]):
     )
 
 
-class SessionResponse(BaseModel):
+class SessionResponse(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -985,13 +987,13 @@ class SessionResponse(BaseModel):
     )
 
 
-class SessionTimeoutLimitExceededError(BaseModel):
+class SessionTimeoutLimitExceededError(DeferredBuildModel):
     detail: str | None = Field(
         'Maximum session timeout is 4 hours (240 minutes).', title='Detail'
     )
 
 
-class ShellResponse(BaseModel):
+class ShellResponse(DeferredBuildModel):
     url: str = Field(..., title='Url')
     expires_in_seconds: int | None = Field(900, title='Expires In Seconds')
 
@@ -1001,11 +1003,11 @@ class StopStrategy(Enum):
     session = 'session'
 
 
-class TelegramInstallRequest(BaseModel):
+class TelegramInstallRequest(DeferredBuildModel):
     bot_token: str = Field(..., title='Bot Token')
 
 
-class TelegramInstallResponse(BaseModel):
+class TelegramInstallResponse(DeferredBuildModel):
     installed: bool = Field(..., title='Installed')
     bot_username: str = Field(..., title='Bot Username')
     deeplink: str = Field(..., title='Deeplink')
@@ -1045,7 +1047,7 @@ class ErrorCode(Enum):
     internal = 'internal'
 
 
-class TgAutoSessionView(BaseModel):
+class TgAutoSessionView(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     state: State = Field(..., title='State')
     live_url: str | None = Field(..., title='Live Url')
@@ -1056,11 +1058,11 @@ class TgAutoSessionView(BaseModel):
     updated_at: AwareDatetime = Field(..., title='Updated At')
 
 
-class TgAutoStartResponse(BaseModel):
+class TgAutoStartResponse(DeferredBuildModel):
     session: TgAutoSessionView
 
 
-class TooManyConcurrentActiveSessionsError(BaseModel):
+class TooManyConcurrentActiveSessionsError(DeferredBuildModel):
     detail: str | None = Field(
         'Too many concurrent active sessions. Please wait for one to finish, kill one, or upgrade your plan.',
         title='Detail',
@@ -1072,33 +1074,33 @@ class Reason(Enum):
     no_owner = 'no_owner'
 
 
-class TrialEligibilityView(BaseModel):
+class TrialEligibilityView(DeferredBuildModel):
     eligible: bool = Field(..., title='Eligible')
     reason: Reason | None = Field(None, title='Reason')
     message: str | None = Field(None, title='Message')
 
 
-class UpdateBrowserSessionRequest(BaseModel):
+class UpdateBrowserSessionRequest(DeferredBuildModel):
     action: BrowserSessionUpdateAction = Field(
         ..., description='The action to perform on the session', title='Action'
     )
 
 
-class ValidationError(BaseModel):
+class ValidationError(DeferredBuildModel):
     loc: List[str | int] = Field(..., title='Location')
     msg: str = Field(..., title='Message')
     type: str = Field(..., title='Error Type')
 
 
-class WindowCreateRequest(BaseModel):
+class WindowCreateRequest(DeferredBuildModel):
     label: str | None = Field(None, title='Label')
 
 
-class WindowRenameRequest(BaseModel):
+class WindowRenameRequest(DeferredBuildModel):
     label: str = Field(..., title='Label')
 
 
-class WindowView(BaseModel):
+class WindowView(DeferredBuildModel):
     id: str = Field(..., title='Id')
     label: str | None = Field('', title='Label')
     attached: bool | None = Field(False, title='Attached')
@@ -1111,19 +1113,19 @@ class Name3(RootModel[str]):
     )
 
 
-class WorkspaceCreateRequest(BaseModel):
+class WorkspaceCreateRequest(DeferredBuildModel):
     name: Name3 | None = Field(
         None, description='Optional name for the workspace', title='Name'
     )
 
 
-class WorkspaceUpdateRequest(BaseModel):
+class WorkspaceUpdateRequest(DeferredBuildModel):
     name: Name3 | None = Field(
         None, description='Optional name for the workspace', title='Name'
     )
 
 
-class WorkspaceView(BaseModel):
+class WorkspaceView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the workspace', title='ID')
     name: str | None = Field(
         None, description='Optional name for the workspace', title='Name'
@@ -1154,7 +1156,7 @@ class MaxCostUsd1(RootModel[str]):
     )
 
 
-class AppEndpointsApiV3SessionsViewsRunTaskRequest(BaseModel):
+class AppEndpointsApiV3SessionsViewsRunTaskRequest(DeferredBuildModel):
     task: str | None = Field(
         None,
         description='The natural-language instruction for the agent to execute (e.g. "Go to amazon.com and find the best-rated wireless mouse under $50"). Required when dispatching to an existing session.',
@@ -1259,7 +1261,7 @@ class AppEndpointsApiV3SessionsViewsRunTaskRequest(BaseModel):
     )
 
 
-class AccountView(BaseModel):
+class AccountView(DeferredBuildModel):
     name: str | None = Field(None, description='The name of the user', title='Name')
     total_credits_balance_usd: float = Field(
         ...,
@@ -1299,16 +1301,16 @@ class AccountView(BaseModel):
     )
 
 
-class BoxCreateResponse(BaseModel):
+class BoxCreateResponse(DeferredBuildModel):
     box: BoxView
 
 
-class BoxSizeListResponse(BaseModel):
+class BoxSizeListResponse(DeferredBuildModel):
     sizes: List[BoxSizeSpecView] = Field(..., title='Sizes')
     default: Default = Field(..., title='Default')
 
 
-class BrowserSessionItemView(BaseModel):
+class BrowserSessionItemView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -1383,7 +1385,7 @@ class BrowserSessionItemView(BaseModel):
     )
 
 
-class BrowserSessionListResponse(BaseModel):
+class BrowserSessionListResponse(DeferredBuildModel):
     items: List[BrowserSessionItemView] = Field(
         ...,
         description='List of browser session views for the current page',
@@ -1403,7 +1405,7 @@ class BrowserSessionListResponse(BaseModel):
     )
 
 
-class CreateBrowserSessionRequest(BaseModel):
+class CreateBrowserSessionRequest(DeferredBuildModel):
     profile_id: UUID | None = Field(
         None,
         alias='profileId',
@@ -1453,15 +1455,15 @@ class CreateBrowserSessionRequest(BaseModel):
     )
 
 
-class FileUploadResponse(BaseModel):
+class FileUploadResponse(DeferredBuildModel):
     files: List[FileUploadResponseItem] = Field(..., title='Files')
 
 
-class HTTPValidationError(BaseModel):
+class HTTPValidationError(DeferredBuildModel):
     detail: List[ValidationError] | None = Field(None, title='Detail')
 
 
-class MessageListResponse(BaseModel):
+class MessageListResponse(DeferredBuildModel):
     messages: List[MessageResponse] = Field(
         ..., description='List of messages in chronological order.', title='Messages'
     )
@@ -1473,7 +1475,7 @@ class MessageListResponse(BaseModel):
     )
 
 
-class ProfileListResponse(BaseModel):
+class ProfileListResponse(DeferredBuildModel):
     items: List[ProfileView] = Field(
         ..., description='List of profile views for the current page', title='Items'
     )
@@ -1491,7 +1493,7 @@ class ProfileListResponse(BaseModel):
     )
 
 
-class SessionListResponse(BaseModel):
+class SessionListResponse(DeferredBuildModel):
     sessions: List[SessionResponse] = Field(
         ..., description='List of sessions.', title='Sessions'
     )
@@ -1507,18 +1509,18 @@ class SessionListResponse(BaseModel):
     )
 
 
-class StopSessionRequest(BaseModel):
+class StopSessionRequest(DeferredBuildModel):
     strategy: StopStrategy | None = Field(
         StopStrategy.session,
         description='How to stop the session. Use "task" to stop only the current task and keep the session alive, or "session" to destroy the sandbox entirely.',
     )
 
 
-class WindowListResponse(BaseModel):
+class WindowListResponse(DeferredBuildModel):
     windows: List[WindowView] = Field(..., title='Windows')
 
 
-class WorkspaceListResponse(BaseModel):
+class WorkspaceListResponse(DeferredBuildModel):
     items: List[WorkspaceView] = Field(
         ..., description='List of workspace views for the current page', title='Items'
     )
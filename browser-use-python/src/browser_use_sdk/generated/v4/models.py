@@ -7,10 +7,12 @@ from enum import Enum
 from typing import Any, Dict, List
 from uuid import UUID
 
-from pydantic import AnyUrl, AwareDatetime, BaseModel, ConfigDict, Field, RootModel
+from pydantic import AnyUrl, AwareDatetime, ConfigDict, Field, RootModel
 
+from .._base import DeferredBuildModel
 
-class BrowserDownloadFile(BaseModel):
+
+class BrowserDownloadFile(DeferredBuildModel):
     path: str = Field(
         ...,
         description='File name (basename relative to the session downloads prefix)',
@@ -30,7 +32,7 @@ class BrowserDownloadFile(BaseModel):
     )
 
 
-class BrowserDownloadListResponse(BaseModel):
+class BrowserDownloadListResponse(DeferredBuildModel):
     files: List[BrowserDownloadFile] = Field(
         ..., description='List of files downloaded by the browser', title='Files'
     )
@@ -57,7 +59,7 @@ class BrowserSessionUpdateAction(Enum):
     stop = 'stop'
 
 
-class BrowserSessionView(BaseModel):
+class BrowserSessionView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -172,7 +174,7 @@ class Password(RootModel[str]):
     )
 
 
-class CustomProxy(BaseModel):
+class CustomProxy(DeferredBuildModel):
     host: str = Field(
         ...,
         description='Host of the proxy.',
@@ -201,14 +203,14 @@ class LiveViewUrl(RootModel[AnyUrl]):
     root: AnyUrl = Field(..., title='Liveviewurl')
 
 
-class ExternalBrowserAttach(BaseModel):
+class ExternalBrowserAttach(DeferredBuildModel):
     cdp_url: AnyUrl = Field(..., alias='cdpUrl', title='Cdpurl')
     live_view_url: LiveViewUrl | None = Field(
         None, alias='liveViewUrl', title='Liveviewurl'
     )
 
 
-class InsufficientCreditsError(BaseModel):
+class InsufficientCreditsError(DeferredBuildModel):
     detail: str | None = Field('Insufficient credits', title='Detail')
 
 
@@ -227,7 +229,7 @@ class UserId(RootModel[str]):
     )
 
 
-class ProfileCreateRequest(BaseModel):
+class ProfileCreateRequest(DeferredBuildModel):
     name: Name | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -239,11 +241,11 @@ class ProfileCreateRequest(BaseModel):
     )
 
 
-class ProfileNotFoundError(BaseModel):
+class ProfileNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Profile not found', title='Detail')
 
 
-class ProfileUpdateRequest(BaseModel):
+class ProfileUpdateRequest(DeferredBuildModel):
     name: Name | None = Field(
         None, description='Optional name for the profile', title='Name'
     )
@@ -255,7 +257,7 @@ class ProfileUpdateRequest(BaseModel):
     )
 
 
-class ProfileView(BaseModel):
+class ProfileView(DeferredBuildModel):
     id: UUID = Field(..., description='Unique identifier for the profile', title='ID')
     user_id: str | None = Field(
         None,
@@ -547,7 +549,7 @@ class AttachedFileIds(RootModel[List[UUID]]):
     root: List[UUID] = Field(..., max_length=20, title='Attachedfileids')
 
 
-class QueueMessageRequest(BaseModel):
+class QueueMessageRequest(DeferredBuildModel):
     model_config = ConfigDict(
         extra='forbid',
     )
@@ -567,7 +569,7 @@ class Status(Enum):
     failed = 'failed'
 
 
-class QueuedMessage(BaseModel):
+class QueuedMessage(DeferredBuildModel):
     id: int = Field(..., title='Id')
     session_id: UUID = Field(..., alias='sessionId', title='Sessionid')
     run_id: UUID | None = Field(..., alias='runId', title='Runid')
@@ -584,7 +586,7 @@ class Status1(Enum):
     uploaded = 'uploaded'
 
 
-class RunAttachment(BaseModel):
+class RunAttachment(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     name: str = Field(
         ..., description='Filename shown to the user, e.g. "data.csv".', title='Name'
@@ -594,7 +596,7 @@ class RunAttachment(BaseModel):
     status: Status1 = Field(..., description='"pending" | "uploaded".', title='Status')
 
 
-class RunAttachmentsResponse(BaseModel):
+class RunAttachmentsResponse(DeferredBuildModel):
     attachments: List[RunAttachment] = Field(..., title='Attachments')
 
 
@@ -618,7 +620,7 @@ class ScreenHeight(RootModel[int]):
     )
 
 
-class RunBrowserSettings(BaseModel):
+class RunBrowserSettings(DeferredBuildModel):
     model_config = ConfigDict(
         extra='forbid',
     )
@@ -698,7 +700,7 @@ class Status2(Enum):
     cancelled = 'cancelled'
 
 
-class RunCreateResponse(BaseModel):
+class RunCreateResponse(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     status: Status2 = Field(..., title='Status')
     model: str = Field(..., title='Model')
@@ -710,7 +712,7 @@ class RunCreateResponse(BaseModel):
     )
 
 
-class RunEvent(BaseModel):
+class RunEvent(DeferredBuildModel):
     run_id: UUID = Field(..., alias='runId', title='Runid')
     id: int = Field(..., title='Id')
     ts: AwareDatetime = Field(..., title='Ts')
@@ -718,7 +720,7 @@ class RunEvent(BaseModel):
     data: Dict[str, Any] = Field(..., title='Data')
 
 
-class RunEventsResponse(BaseModel):
+class RunEventsResponse(DeferredBuildModel):
     events: List[RunEvent] = Field(..., title='Events')
     next_after: int | None = Field(None, alias='nextAfter', title='Nextafter')
     has_more: bool | None = Field(False, alias='hasMore', title='Hasmore')
@@ -728,18 +730,18 @@ class Context(RootModel[str]):
     root: str = Field(..., max_length=10000, title='Context')
 
 
-class RunJudgeSettings(BaseModel):
+class RunJudgeSettings(DeferredBuildModel):
     model_config = ConfigDict(
         extra='forbid',
     )
     context: Context | None = Field(None, title='Context')
 
 
-class RunStatusResponse(BaseModel):
+class RunStatusResponse(DeferredBuildModel):
     status: Status2 = Field(..., title='Status')
 
 
-class RunSummary(BaseModel):
+class RunSummary(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     task: str = Field(..., title='Task')
     title: str | None = Field(..., title='Title')
@@ -765,7 +767,7 @@ class RunSummary(BaseModel):
     updated_at: AwareDatetime = Field(..., alias='updatedAt', title='Updatedat')
 
 
-class SessionInfo(BaseModel):
+class SessionInfo(DeferredBuildModel):
     session_id: UUID = Field(..., alias='sessionId', title='Sessionid')
     workspace_id: UUID | None = Field(..., alias='workspaceId', title='Workspaceid')
     latest_run_id: UUID = Field(..., alias='latestRunId', title='Latestrunid')
@@ -776,36 +778,36 @@ class SessionInfo(BaseModel):
     updated_at: AwareDatetime = Field(..., alias='updatedAt', title='Updatedat')
 
 
-class SessionListResponse(BaseModel):
+class SessionListResponse(DeferredBuildModel):
     sessions: List[SessionInfo] = Field(..., title='Sessions')
     next_cursor: str | None = Field(None, alias='nextCursor', title='Nextcursor')
     has_more: bool | None = Field(False, alias='hasMore', title='Hasmore')
 
 
-class SessionNotFoundError(BaseModel):
+class SessionNotFoundError(DeferredBuildModel):
     detail: str | None = Field('Session not found', title='Detail')
 
 
-class SessionTimeoutLimitExceededError(BaseModel):
+class SessionTimeoutLimitExceededError(DeferredBuildModel):
     detail: str | None = Field(
         'Maximum session timeout is 4 hours (240 minutes).', title='Detail'
     )
 
 
-class TooManyConcurrentActiveSessionsError(BaseModel):
+class TooManyConcurrentActiveSessionsError(DeferredBuildModel):
     detail: str | None = Field(
         'Too many concurrent active sessions. Please wait for one to finish, kill one, or upgrade your plan.',
         title='Detail',
     )
 
 
-class UpdateBrowserSessionRequest(BaseModel):
+class UpdateBrowserSessionRequest(DeferredBuildModel):
     action: BrowserSessionUpdateAction = Field(
         ..., description='The action to perform on the session', title='Action'
     )
 
 
-class ValidationError(BaseModel):
+class ValidationError(DeferredBuildModel):
     loc: List[str | int] = Field(..., title='Location')
     msg: str = Field(..., title='Message')
     type: str = Field(..., title='Error Type')
@@ -815,11 +817,11 @@ class Name2(RootModel[str]):
     root: str = Field(..., max_length=255, title='Name')
 
 
-class WorkspaceCreateRequest(BaseModel):
+class WorkspaceCreateRequest(DeferredBuildModel):
     name: Name2 | None = Field(None, title='Name')
 
 
-class WorkspaceFileInfo(BaseModel):
+class WorkspaceFileInfo(DeferredBuildModel):
     path: str = Field(
         ..., description='File path relative to the workspace root', title='Path'
     )
@@ -837,13 +839,13 @@ class WorkspaceFileInfo(BaseModel):
     )
 
 
-class WorkspaceFileListResponse(BaseModel):
+class WorkspaceFileListResponse(DeferredBuildModel):
     files: List[WorkspaceFileInfo] = Field(..., title='Files')
     next_cursor: str | None = Field(None, alias='nextCursor', title='Nextcursor')
     has_more: bool | None = Field(False, alias='hasMore', title='Hasmore')
 
 
-class WorkspaceFileUploadItem(BaseModel):
+class WorkspaceFileUploadItem(DeferredBuildModel):
     name: str = Field(
         ...,
         description='Filename, e.g. "data.csv"',
@@ -867,13 +869,13 @@ class WorkspaceFileUploadItem(BaseModel):
     )
 
 
-class WorkspaceFileUploadRequest(BaseModel):
+class WorkspaceFileUploadRequest(DeferredBuildModel):
     files: List[WorkspaceFileUploadItem] = Field(
         ..., max_length=10, min_length=1, title='Files'
     )
 
 
-class WorkspaceFileUploadResponseItem(BaseModel):
+class WorkspaceFileUploadResponseItem(DeferredBuildModel):
     id: UUID = Field(
         ...,
         description='Upload id. Pass THIS in RunCreateRequest.attachedFileIds to attach the file to a run.',
@@ -907,7 +909,7 @@ class WorkspaceFileUploadResponseItem(BaseModel):
     )
 
 
-class WorkspaceInfo(BaseModel):
+class WorkspaceInfo(DeferredBuildModel):
     id: UUID = Field(..., title='Id')
     name: str | None = Field(None, title='Name')
     archived: bool = Field(..., title='Archived')
@@ -915,7 +917,7 @@ class WorkspaceInfo(BaseModel):
     updated_at: AwareDatetime = Field(..., alias='updatedAt', title='Updatedat')
 
 
-class BrowserSessionItemView(BaseModel):
+class BrowserSessionItemView(DeferredBuildModel):
     model_config = ConfigDict(
         regex_engine="python-re",
     )
@@ -990,7 +992,7 @@ class BrowserSessionItemView(BaseModel):
     )
 
 
-class BrowserSessionListResponse(BaseModel):
+class BrowserSessionListResponse(DeferredBuildModel):
     items: List[BrowserSessionItemView] = Field(
         ...,
         description='List of browser session views for the current page',
@@ -1010,7 +1012,7 @@ class BrowserSessionListResponse(BaseModel):
     )
 
 
-class CreateBrowserSessionRequest(BaseModel):
+class CreateBrowserSessionRequest(DeferredBuildModel):
     profile_id: UUID | None = Field(
         None,
         alias='profileId',
@@ -1060,11 +1062,11 @@ class CreateBrowserSessionRequest(BaseModel):
     )
 
 
-class HTTPValidationError(BaseModel):
+class HTTPValidationError(DeferredBuildModel):
     detail: List[ValidationError] | None = Field(None, title='Detail')
 
 
-class ProfileListResponse(BaseModel):
+class ProfileListResponse(DeferredBuildModel):
     items: List[ProfileView] = Field(
         ..., description='List of profile views for the current page', title='Items'
     )
@@ -1082,11 +1084,11 @@ class ProfileListResponse(BaseModel):
     )
 
 
-class QueueListResponse(BaseModel):
+class QueueListResponse(DeferredBuildModel):
     queue: List[QueuedMessage] = Field(..., title='Queue')
 
 
-class RunCreateRequest(BaseModel):
+class RunCreateRequest(DeferredBuildModel):
     model_config = ConfigDict(
         extra='forbid',
     )
@@ -1104,11 +1106,11 @@ class RunCreateRequest(BaseModel):
     )
 
 
-class RunListResponse(BaseModel):
+class RunListResponse(DeferredBuildModel):
     runs: List[RunSummary] = Field(..., title='Runs')
     next_cursor: str | None = Field(None, alias='nextCursor', title='Nextcursor')
     has_more: bool | None = Field(False, alias='hasMore', title='Hasmore')
 
 
-class WorkspaceFileUploadResponse(BaseModel):
+class WorkspaceFileUploadResponse(DeferredBuildModel):
     files: List[WorkspaceFileUploadResponseItem] = Field(..., title='Files')
@@ -1,4 +1,9 @@
 from .client import AsyncBrowserUse, BrowserUse
-from .helpers import AsyncTaskRun, TaskResult, TaskStream
+from .._core.browser_pool import BrowserPool
+from .._core.cache import ResultCache
+from .._core.http import HedgePolicy
+from .._core.request_template import RequestTemplate
+from .._core.schema import schema_sizes
+from .helpers import AsyncTaskRun, SlimTaskResult, TaskResult, TaskStream, parse_actions
 
-__all__ = ["BrowserUse", "AsyncBrowserUse", "TaskStream", "AsyncTaskRun", "TaskResult"]
+__all__ = ["BrowserUse", "AsyncBrowserUse", "TaskStream", "AsyncTaskRun", "TaskResult", "SlimTaskResult", "parse_actions", "HedgePolicy", "BrowserPool", "ResultCache", "RequestTemplate", "schema_sizes"]
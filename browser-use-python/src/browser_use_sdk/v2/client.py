@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
 import os
 from collections.abc import Awaitable
 from typing import Any, TypeVar, overload
 
 from pydantic import BaseModel
 
-from .._core.http import AsyncHttpClient, SyncHttpClient
+from .._core import OnTimeout
+from .._core.browser_pool import BrowserPool
+from .._core.cache import ResultCache
+from .._core.http import AsyncHttpClient, HedgePolicy, SyncHttpClient
+from .._core.schema import json_schema_str
 from .._core.x402 import X402_BASE_URL_DEFAULT_V2, x402_client_from_private_key
 from ..generated.v2.models import SessionSettings, TaskCreatedResponse
 from .resources.billing import AsyncBilling, Billing
@@ -17,8 +20,8 @@ from .resources.marketplace import AsyncMarketplace, Marketplace
 from .resources.profiles import AsyncProfiles, Profiles
 from .resources.sessions import AsyncSessions, Sessions
 from .resources.skills import AsyncSkills, Skills
-from .resources.tasks import AsyncTasks, Tasks
-from .helpers import AsyncTaskRun, TaskResult, TaskStream, _poll_output
+from .resources.tasks import AsyncTasks, Tasks, _build_create_body
+from .helpers import AsyncTaskRun, TaskResult, TaskStream, _decode_result, _encode_result, _poll_output
 
 _V2_BASE_URL = "https://api.browser-use.com/api/v2"
 
@@ -40,6 +43,16 @@ class BrowserUse:
 
     For x402 (pay-per-request) authentication, use :class:`AsyncBrowserUse` —
     x402 settlement is async-only.
+
+    ``on_timeout="cancel"`` stops the remote run when ``run``/``stream`` time
+    out, so it stops billing and frees its concurrency slot.
+
+    Pass ``result_cache=ResultCache()`` to return the stored result of an
+    identical earlier ``run`` instead of creating a new task.
+
+    ``compact_schemas=True`` sends a minimized structured-output schema
+    (no generated titles, small ``$defs`` inlined) that accepts the same
+    output; see :func:`schema_sizes` for the saving.
     """
 
     def __init__(
@@ -49,6 +62,9 @@ class BrowserUse:
         base_url: str | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        on_timeout: OnTimeout = "raise",
+        result_cache: ResultCache | None = None,
+        compact_schemas: bool = False,
         x402: Any | None = None,
         x402_private_key: str | None = None,
     ) -> None:
@@ -68,6 +84,9 @@ class BrowserUse:
             timeout=timeout,
             max_retries=max_retries,
         )
+        self._on_timeout = on_timeout
+        self._result_cache = result_cache
+        self._compact_schemas = compact_schemas
         self.billing = Billing(self._http)
         self.tasks = Tasks(self._http)
         self.sessions = Sessions(self._http)
@@ -186,10 +205,9 @@ class BrowserUse:
         """Run an AI agent task. Blocks until complete, returns a TaskResult."""
         resolved_schema = schema or output_schema
         if resolved_schema is not None and issubclass(resolved_schema, BaseModel):
-            extra["structured_output"] = json.dumps(resolved_schema.model_json_schema())
+            extra["structured_output"] = json_schema_str(resolved_schema, compact=self._compact_schemas)
 
-        data = self.tasks.create(
-            task,
+        create_kwargs: dict[str, Any] = dict(
             session_id=session_id,
             llm=llm,
             start_url=start_url,
@@ -210,7 +228,19 @@ class BrowserUse:
             session_settings=session_settings,
             **extra,
         )
-        return _poll_output(self.tasks, str(data.id), resolved_schema)
+
+        def run_task() -> TaskResult[Any]:
+            data = self.tasks.create(task, **create_kwargs)
+            return _poll_output(self.tasks, str(data.id), resolved_schema, on_timeout=self._on_timeout)
+
+        if self._result_cache is None or session_id is not None:
+            return run_task()
+        return self._result_cache.get_or_run(
+            self._result_cache.key("v2", _build_create_body(task, **create_kwargs)),
+            run_task,
+            _encode_result,
+            lambda raw: _decode_result(raw, resolved_schema),
+        )
 
     @overload
     def stream(
@@ -321,7 +351,7 @@ class BrowserUse:
         """Run a task and yield steps as they happen."""
         resolved_schema = schema or output_schema
         if resolved_schema is not None and issubclass(resolved_schema, BaseModel):
-            extra["structured_output"] = json.dumps(resolved_schema.model_json_schema())
+            extra["structured_output"] = json_schema_str(resolved_schema, compact=self._compact_schemas)
 
         data = self.tasks.create(
             task,
@@ -345,7 +375,7 @@ class BrowserUse:
             session_settings=session_settings,
             **extra,
         )
-        return TaskStream(data, self.tasks, resolved_schema)
+        return TaskStream(data, self.tasks, resolved_schema, on_timeout=self._on_timeout)
 
     def close(self) -> None:
         self._http.close()
@@ -366,6 +396,20 @@ class AsyncBrowserUse:
     "top-up" mode — the API key is forwarded as a header so the backend
     credits the existing project (instead of auto-creating a wallet-keyed one).
     x402 mode requires the optional extra: ``pip install "browser-use-sdk[x402]"``.
+
+    ``on_timeout="cancel"`` stops the remote run when a ``run`` handle times
+    out, or when its last awaiting consumer is cancelled.
+
+    Pass ``hedge=HedgePolicy()`` to race a duplicate of GETs that are slower
+    than the recent p95, trimming tail latency on status polls.
+
+    Pass ``result_cache=ResultCache()`` to memoize ``await client.run(...)``:
+    an identical earlier run's result is returned without creating a task,
+    and concurrent identical runs share one remote task.
+
+    ``compact_schemas=True`` sends a minimized structured-output schema
+    (no generated titles, small ``$defs`` inlined) that accepts the same
+    output; see :func:`schema_sizes` for the saving.
     """
 
     def __init__(
@@ -375,6 +419,10 @@ class AsyncBrowserUse:
         base_url: str | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        on_timeout: OnTimeout = "raise",
+        hedge: HedgePolicy | None = None,
+        result_cache: ResultCache | None = None,
+        compact_schemas: bool = False,
         x402: Any | None = None,
         x402_private_key: str | None = None,
     ) -> None:
@@ -387,6 +435,7 @@ class AsyncBrowserUse:
                 timeout=timeout,
                 max_retries=max_retries,
                 x402_client=x402_client,
+                hedge=hedge,
             )
         else:
             resolved_key = api_key or os.environ.get("BROWSER_USE_API_KEY") or ""
@@ -401,12 +450,17 @@ class AsyncBrowserUse:
                 api_key=resolved_key,
                 timeout=timeout,
                 max_retries=max_retries,
+                hedge=hedge,
             )
+        self._on_timeout = on_timeout
+        self._result_cache = result_cache
+        self._compact_schemas = compact_schemas
         self.billing = AsyncBilling(self._http)
         self.tasks = AsyncTasks(self._http)
         self.sessions = AsyncSessions(self._http)
         self.files = AsyncFiles(self._http)
         self.profiles = AsyncProfiles(self._http)
+        self._browser_pools: list[BrowserPool] = []
         self.browsers = AsyncBrowsers(self._http)
         self.skills = AsyncSkills(self._http)
         self.marketplace = AsyncMarketplace(self._http)
@@ -520,35 +574,64 @@ class AsyncBrowserUse:
         """Run an AI agent task. ``await`` for a TaskResult, or ``async for`` for steps."""
         resolved_schema = schema or output_schema
         if resolved_schema is not None and issubclass(resolved_schema, BaseModel):
-            extra["structured_output"] = json.dumps(resolved_schema.model_json_schema())
+            extra["structured_output"] = json_schema_str(resolved_schema, compact=self._compact_schemas)
+
+        create_kwargs: dict[str, Any] = dict(
+            session_id=session_id,
+            llm=llm,
+            start_url=start_url,
+            max_steps=max_steps,
+            metadata=metadata,
+            secrets=secrets,
+            allowed_domains=allowed_domains,
+            highlight_elements=highlight_elements,
+            flash_mode=flash_mode,
+            thinking=thinking,
+            vision=vision,
+            system_prompt_extension=system_prompt_extension,
+            judge=judge,
+            judge_ground_truth=judge_ground_truth,
+            judge_llm=judge_llm,
+            skill_ids=skill_ids,
+            op_vault_id=op_vault_id,
+            session_settings=session_settings,
+            **extra,
+        )
 
         def create_fn() -> Awaitable[TaskCreatedResponse]:
-            return self.tasks.create(
-                task,
-                session_id=session_id,
-                llm=llm,
-                start_url=start_url,
-                max_steps=max_steps,
-                metadata=metadata,
-                secrets=secrets,
-                allowed_domains=allowed_domains,
-                highlight_elements=highlight_elements,
-                flash_mode=flash_mode,
-                thinking=thinking,
-                vision=vision,
-                system_prompt_extension=system_prompt_extension,
-                judge=judge,
-                judge_ground_truth=judge_ground_truth,
-                judge_llm=judge_llm,
-                skill_ids=skill_ids,
-                op_vault_id=op_vault_id,
-                session_settings=session_settings,
-                **extra,
-            )
+            return self.tasks.create(task, **create_kwargs)
+
+        cache = None
+        if self._result_cache is not None and session_id is None:
+            cache = (self._result_cache, self._result_cache.key("v2", _build_create_body(task, **create_kwargs)))
+        return AsyncTaskRun(create_fn, self.tasks, resolved_schema, on_timeout=self._on_timeout, _cache=cache)
 
-        return AsyncTaskRun(create_fn, self.tasks, resolved_schema)
+    def browser_pool(
+        self,
+        *,
+        max_size: int = 10,
+        timeout: int | None = None,
+        recycle_before: float = 60,
+    ) -> BrowserPool:
+        """Create a pool of standalone browsers that this client stops on close.
+
+        ``timeout`` is the per-browser session timeout (minutes) passed to
+        ``browsers.create``; browsers within ``recycle_before`` seconds of it
+        are replaced rather than leased.
+
+        Usage::
+
+            pool = client.browser_pool(max_size=4)
+            async with pool.lease(proxy_country_code="us") as browser:
+                await scrape(browser.cdp_url)
+        """
+        pool = BrowserPool(self.browsers, max_size=max_size, timeout=timeout, recycle_before=recycle_before)
+        self._browser_pools.append(pool)
+        return pool
 
     async def close(self) -> None:
+        for pool in self._browser_pools:
+            await pool.close()
         await self._http.close()
 
     async def __aenter__(self) -> AsyncBrowserUse:
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import time
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
-from ..generated.v2.models import TaskCreatedResponse, TaskStepView, TaskView
+from .._core import OnTimeout
+from .._core.cache import ResultCache
+from .._core.errors import BrowserUseError
+from .._core.payloads import _cached, _loads_or_text
+from ..generated.v2.models import TaskCreatedResponse, TaskStatus, TaskStepView, TaskView
 from .resources.tasks import AsyncTasks, Tasks
 
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
 TERMINAL_STATUSES = {"finished", "stopped"}
 
 T = TypeVar("T")
@@ -31,6 +40,78 @@ class TaskResult(Generic[T]):
     def __repr__(self) -> str:
         return f"TaskResult(id={self.task.id}, status={self.task.status.value}, output={self.output!r})"
 
+    def slim(self) -> SlimTaskResult[T]:
+        """Copy the summary fields into a :class:`SlimTaskResult`, dropping steps and files."""
+        t = self.task
+        return SlimTaskResult(
+            t.id,
+            t.session_id,
+            t.status,
+            self.output,
+            t.is_success,
+            t.cost.root if t.cost is not None else None,
+            t.created_at,
+            t.started_at,
+            t.finished_at,
+        )
+
+
+class SlimTaskResult(Generic[T]):
+    """Memory-lean task result for large batches.
+
+    Keeps only the ids, status, typed output, success flag, cost and
+    timestamps in ``__slots__``; steps, output files and the rest of the
+    ``TaskView`` are dropped. Returned by :meth:`TaskResult.slim`.
+    """
+
+    __slots__ = (
+        "id",
+        "session_id",
+        "status",
+        "output",
+        "is_success",
+        "cost",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        session_id: UUID,
+        status: TaskStatus,
+        output: T,
+        is_success: bool | None,
+        cost: str | None,
+        created_at: datetime,
+        started_at: datetime | None,
+        finished_at: datetime | None,
+    ) -> None:
+        self.id = id
+        self.session_id = session_id
+        self.status = status
+        self.output = output
+        self.is_success = is_success
+        self.cost = cost
+        self.created_at = created_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    def __repr__(self) -> str:
+        return f"SlimTaskResult(id={self.id}, status={self.status.value}, output={self.output!r})"
+
+
+def parse_actions(step: TaskStepView) -> list[Any]:
+    """The step's stringified JSON actions, decoded once and cached on the step.
+
+    Usage::
+
+        for step in client.tasks.get(task_id).steps:
+            print(parse_actions(step))
+    """
+    return _cached(step, "_parsed_actions", step.actions, lambda: [_loads_or_text(a) for a in step.actions])
+
 
 def _parse_output(output: str | None, output_schema: type[Any] | None) -> Any:
     """Parse raw output string into the target type."""
@@ -41,6 +122,34 @@ def _parse_output(output: str | None, output_schema: type[Any] | None) -> Any:
     return output
 
 
+def _encode_result(result: TaskResult[Any]) -> str | None:
+    """Serialize a result for :class:`ResultCache`; unsuccessful runs are not cached."""
+    if result.task.status.value != "finished" or result.task.is_success is False:
+        return None
+    return result.task.model_dump_json(by_alias=True)
+
+
+def _decode_result(raw: str, output_schema: type[Any] | None) -> TaskResult[Any]:
+    task = TaskView.model_validate_json(raw)
+    return TaskResult(task, _parse_output(task.output, output_schema))
+
+
+def _stop_task(tasks: Tasks, task_id: str) -> None:
+    """Best-effort stop of an abandoned task and its session."""
+    try:
+        tasks.stop_task_and_session(task_id)
+    except BrowserUseError:
+        pass  # finished or gone in the meantime
+
+
+async def _async_stop_task(tasks: AsyncTasks, task_id: str) -> None:
+    """Best-effort stop of an abandoned task and its session."""
+    try:
+        await tasks.stop_task_and_session(task_id)
+    except BrowserUseError:
+        pass  # finished or gone in the meantime
+
+
 def _poll_output(
     tasks: Tasks,
     task_id: str,
@@ -48,6 +157,7 @@ def _poll_output(
     *,
     timeout: float = 300,
     interval: float = 2,
+    on_timeout: OnTimeout = "raise",
 ) -> TaskResult[Any]:
     """Poll lightweight status endpoint until terminal, return TaskResult."""
     deadline = time.monotonic() + timeout
@@ -57,6 +167,8 @@ def _poll_output(
             result = tasks.get(task_id)
             return TaskResult(result, _parse_output(result.output, output_schema))
         time.sleep(interval)
+    if on_timeout == "cancel":
+        _stop_task(tasks, task_id)
     raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
 
@@ -67,6 +179,7 @@ async def _async_poll_output(
     *,
     timeout: float = 300,
     interval: float = 2,
+    on_timeout: OnTimeout = "raise",
 ) -> TaskResult[Any]:
     """Poll lightweight status endpoint until terminal, return TaskResult."""
     deadline = time.monotonic() + timeout
@@ -76,6 +189,8 @@ async def _async_poll_output(
             result = await tasks.get(task_id)
             return TaskResult(result, _parse_output(result.output, output_schema))
         await asyncio.sleep(interval)
+    if on_timeout == "cancel":
+        await _async_stop_task(tasks, task_id)
     raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
 
@@ -98,12 +213,14 @@ class TaskStream(Generic[T]):
         *,
         timeout: float = 300,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
     ) -> None:
         self.task_id = str(data.id)
         self._tasks = tasks
         self._output_schema = output_schema
         self._timeout = timeout
         self._interval = interval
+        self._on_timeout = on_timeout
         self.result: TaskResult[T] | None = None
 
     @property
@@ -128,6 +245,8 @@ class TaskStream(Generic[T]):
 
             time.sleep(self._interval)
 
+        if self._on_timeout == "cancel":
+            _stop_task(self._tasks, self.task_id)
         raise TimeoutError(
             f"Task {self.task_id} did not complete within {self._timeout}s"
         )
@@ -139,6 +258,10 @@ class AsyncTaskRun(Generic[T]):
     - ``await client.run(...)`` polls the lightweight status endpoint, returns a ``TaskResult``.
     - ``async for step in client.run(...)`` polls the full task, yields new steps.
 
+    The task is created once no matter how many consumers share the handle,
+    and a single poll loop feeds all of them (awaiters, iterators and
+    :meth:`on_step` callbacks).
+
     Usage::
 
         # Simple
@@ -158,13 +281,24 @@ class AsyncTaskRun(Generic[T]):
         *,
         timeout: float = 300,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
+        _cache: tuple[ResultCache, str] | None = None,
     ) -> None:
         self._create_fn = create_fn
         self._tasks = tasks
+        self._cache = _cache
         self._output_schema = output_schema
         self._timeout = timeout
         self._interval = interval
+        self._on_timeout = on_timeout
+        self._consumers = 0
         self._task_id: str | None = None
+        self._created: asyncio.Future[TaskCreatedResponse] | None = None
+        self._poller: asyncio.Future[TaskResult[T]] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._want_steps = False
+        self._steps: list[TaskStepView] = []
+        self._callbacks: list[Callable[[TaskStepView], Any]] = []
         self.result: TaskResult[T] | None = None
 
     @property
@@ -177,45 +311,139 @@ class AsyncTaskRun(Generic[T]):
         """Final typed output (available after awaiting or iterating to completion)."""
         return self.result.output if self.result else None
 
-    async def _ensure_task_id(self) -> str:
-        if self._task_id is None:
-            data: TaskCreatedResponse = await self._create_fn()
-            self._task_id = str(data.id)
-        return self._task_id
+    def on_step(self, callback: Callable[[TaskStepView], Any]) -> None:
+        """Call ``callback`` (sync or async) for each new step.
 
-    def __await__(self):  # type: ignore[override]
-        return self._wait_for_output().__await__()
+        Register before awaiting the handle to see every step.
+        """
+        self._callbacks.append(callback)
+        self._want_steps = True
 
-    async def _wait_for_output(self) -> TaskResult[T]:
-        task_id = await self._ensure_task_id()
-        result = await _async_poll_output(
-            self._tasks,
-            task_id,
-            self._output_schema,
-            timeout=self._timeout,
-            interval=self._interval,
-        )
-        self.result = result
-        return result
+    async def _ensure_task_id(self) -> str:
+        if self._created is None:
+            self._created = asyncio.ensure_future(self._create_fn())
+        data = await asyncio.shield(self._created)
+        self._task_id = str(data.id)
+        return self._task_id
 
-    async def __aiter__(self) -> AsyncIterator[TaskStepView]:
+    def _ensure_poller(self) -> asyncio.Future[TaskResult[T]]:
+        if self._poller is None:
+            self._wakeup = asyncio.Event()
+            self._poller = asyncio.ensure_future(self._poll())
+        return self._poller
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = asyncio.Event()
+
+    async def _publish(self, steps: list[TaskStepView]) -> None:
+        for step in steps[len(self._steps):]:
+            self._steps.append(step)
+            for callback in self._callbacks:
+                ret = callback(step)
+                if inspect.isawaitable(ret):
+                    await ret
+            self._notify()
+
+    async def _poll(self) -> TaskResult[T]:
         task_id = await self._ensure_task_id()
-        seen = 0
         deadline = time.monotonic() + self._timeout
 
-        while time.monotonic() < deadline:
-            task = await self._tasks.get(task_id)
+        try:
+            while time.monotonic() < deadline:
+                task: TaskView | None = None
+                if self._want_steps:
+                    task = await self._tasks.get(task_id)
+                    await self._publish(task.steps)
+                    terminal = task.status.value in TERMINAL_STATUSES
+                else:
+                    status = await self._tasks.status(task_id)
+                    terminal = status.status.value in TERMINAL_STATUSES
+
+                if terminal:
+                    if task is None:
+                        task = await self._tasks.get(task_id)
+                    # Steps are only published here if nobody asked for them mid-run.
+                    await self._publish(task.steps)
+                    self.result = TaskResult(task, _parse_output(task.output, self._output_schema))
+                    return self.result
+
+                await asyncio.sleep(self._interval)
+
+            if self._on_timeout == "cancel":
+                await _async_stop_task(self._tasks, task_id)
+            raise TimeoutError(
+                f"Task {task_id} did not complete within {self._timeout}s"
+            )
+        finally:
+            self._notify()
+
+    async def cancel(self) -> None:
+        """Stop polling and stop the remote task and its session."""
+        if self._poller is not None and not self._poller.done():
+            self._poller.cancel()
+        if self._created is not None:
+            await _async_stop_task(self._tasks, await self._ensure_task_id())
+
+    async def _abandon(self) -> None:
+        # The last consumer was cancelled or stopped iterating: the local poll
+        # loop always stops, and with on_timeout="cancel" the remote task is
+        # stopped too. An in-flight create is left to finish so cancel() can
+        # still learn its id. Nothing happens once the poll loop has finished.
+        if self._consumers != 1 or self._poller is None or self._poller.done():
+            return
+        if self._on_timeout == "cancel":
+            await asyncio.shield(self.cancel())
+        else:
+            self._poller.cancel()
 
-            for i in range(seen, len(task.steps)):
-                yield task.steps[i]
-            seen = len(task.steps)
+    def __await__(self):  # type: ignore[override]
+        if self._cache is not None:
+            return self._cached_output().__await__()
+        return self._wait_for_output().__await__()
 
-            if task.status.value in TERMINAL_STATUSES:
-                self.result = TaskResult(task, _parse_output(task.output, self._output_schema))
-                return
+    async def _cached_output(self) -> TaskResult[T]:
+        assert self._cache is not None
+        cache, key = self._cache
+        self.result = await cache.aget_or_run(
+            key,
+            self._wait_for_output,
+            _encode_result,
+            lambda raw: _decode_result(raw, self._output_schema),
+        )
+        return self.result
 
-            await asyncio.sleep(self._interval)
+    async def _wait_for_output(self) -> TaskResult[T]:
+        self._consumers += 1
+        try:
+            # Shielded so one cancelled consumer does not stop the shared poll loop.
+            return await asyncio.shield(self._ensure_poller())
+        except asyncio.CancelledError:
+            await self._abandon()
+            raise
+        finally:
+            self._consumers -= 1
 
-        raise TimeoutError(
-            f"Task {task_id} did not complete within {self._timeout}s"
-        )
+    async def __aiter__(self) -> AsyncIterator[TaskStepView]:
+        self._want_steps = True
+        poller = self._ensure_poller()
+        index = 0
+
+        self._consumers += 1
+        try:
+            while True:
+                while index < len(self._steps):
+                    yield self._steps[index]
+                    index += 1
+                if poller.done():
+                    poller.result()  # re-raise poll errors
+                    return
+                assert self._wakeup is not None
+                await self._wakeup.wait()
+        except (asyncio.CancelledError, GeneratorExit):
+            # GeneratorExit: the consumer broke out of the loop or closed it.
+            await self._abandon()
+            raise
+        finally:
+            self._consumers -= 1
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..._core import _UNSET
-from ..._core.http import AsyncHttpClient, SyncHttpClient
+from ..._core.http import AsyncHttpClient, SyncHttpClient, _IdempotentCreate, _idempotency_key, _validate_created
 from ...generated.v2.models import (
     BrowserDownloadListResponse,
     BrowserSessionItemView,
@@ -14,6 +14,10 @@ from ...generated.v2.models import (
 )
 
 
+class CreatedBrowser(BrowserSessionItemView, _IdempotentCreate):
+    """``BrowserSessionItemView`` plus the ``idempotency_key`` the browser session was created with."""
+
+
 def _build_create_body(
     *,
     profile_id: str | None = None,
@@ -58,8 +62,9 @@ class Browsers:
         browser_screen_height: int | None = None,
         allow_resizing: bool | None = None,
         custom_proxy: CustomProxy | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> BrowserSessionItemView:
+    ) -> CreatedBrowser:
         """Create a new standalone browser session."""
         body = _build_create_body(
             profile_id=profile_id,
@@ -71,8 +76,11 @@ class Browsers:
             custom_proxy=custom_proxy,
             **extra,
         )
-        return BrowserSessionItemView.model_validate(
-            self._http.request("POST", "/browsers", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedBrowser,
+            self._http.request("POST", "/browsers", json=body, idempotency_key=key),
+            key,
         )
 
     def list(
@@ -148,8 +156,9 @@ class AsyncBrowsers:
         browser_screen_height: int | None = None,
         allow_resizing: bool | None = None,
         custom_proxy: CustomProxy | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> BrowserSessionItemView:
+    ) -> CreatedBrowser:
         """Create a new standalone browser session."""
         body = _build_create_body(
             profile_id=profile_id,
@@ -161,8 +170,11 @@ class AsyncBrowsers:
             custom_proxy=custom_proxy,
             **extra,
         )
-        return BrowserSessionItemView.model_validate(
-            await self._http.request("POST", "/browsers", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedBrowser,
+            await self._http.request("POST", "/browsers", json=body, idempotency_key=key),
+            key,
         )
 
     async def list(
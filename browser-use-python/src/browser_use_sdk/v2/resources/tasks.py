@@ -4,7 +4,10 @@ import asyncio
 import time
 from typing import Any
 
-from ..._core.http import AsyncHttpClient, SyncHttpClient
+from ..._core import OnTimeout
+from ..._core.errors import BrowserUseError
+from ..._core.http import AsyncHttpClient, SyncHttpClient, _IdempotentCreate, _idempotency_key, _validate_created
+from ..._core.request_template import RequestTemplate, _render
 from ...generated.v2.models import (
     SessionSettings,
     TaskCreatedResponse,
@@ -18,6 +21,10 @@ from ...generated.v2.models import (
 _TERMINAL_STATUSES = {"finished", "stopped"}
 
 
+class CreatedTask(TaskCreatedResponse, _IdempotentCreate):
+    """``TaskCreatedResponse`` plus the ``idempotency_key`` the task was created with."""
+
+
 def _build_create_body(
     task: str,
     *,
@@ -89,6 +96,63 @@ class Tasks:
     def __init__(self, http: SyncHttpClient) -> None:
         self._http = http
 
+    def template(
+        self,
+        *,
+        session_id: str | None = None,
+        llm: str | None = None,
+        start_url: str | None = None,
+        max_steps: int | None = None,
+        structured_output: str | None = None,
+        metadata: dict[str, str] | None = None,
+        secrets: dict[str, str] | None = None,
+        allowed_domains: list[str] | None = None,
+        highlight_elements: bool | None = None,
+        flash_mode: bool | None = None,
+        thinking: bool | None = None,
+        vision: bool | str | None = None,
+        system_prompt_extension: str | None = None,
+        judge: bool | None = None,
+        judge_ground_truth: str | None = None,
+        judge_llm: str | None = None,
+        skill_ids: list[str] | None = None,
+        op_vault_id: str | None = None,
+        session_settings: SessionSettings | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many tasks.
+
+        Usage::
+
+            template = client.tasks.template(llm="gpt-4.1", session_settings=settings)
+            client.tasks.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            "",
+            session_id=session_id,
+            llm=llm,
+            start_url=start_url,
+            max_steps=max_steps,
+            structured_output=structured_output,
+            metadata=metadata,
+            secrets=secrets,
+            allowed_domains=allowed_domains,
+            highlight_elements=highlight_elements,
+            flash_mode=flash_mode,
+            thinking=thinking,
+            vision=vision,
+            system_prompt_extension=system_prompt_extension,
+            judge=judge,
+            judge_ground_truth=judge_ground_truth,
+            judge_llm=judge_llm,
+            skill_ids=skill_ids,
+            op_vault_id=op_vault_id,
+            session_settings=session_settings,
+            **extra,
+        )
+        del body["task"]
+        return RequestTemplate(body)
+
     def create(
         self,
         task: str,
@@ -112,9 +176,18 @@ class Tasks:
         skill_ids: list[str] | None = None,
         op_vault_id: str | None = None,
         session_settings: SessionSettings | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> TaskCreatedResponse:
-        """Create and start a new AI agent task."""
+    ) -> CreatedTask:
+        """Create and start a new AI agent task.
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
         body = _build_create_body(
             task,
             session_id=session_id,
@@ -138,8 +211,11 @@ class Tasks:
             session_settings=session_settings,
             **extra,
         )
-        return TaskCreatedResponse.model_validate(
-            self._http.request("POST", "/tasks", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedTask,
+            self._http.request("POST", "/tasks", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     def list(
@@ -170,9 +246,7 @@ class Tasks:
 
     def get(self, task_id: str) -> TaskView:
         """Get detailed task information."""
-        return TaskView.model_validate(
-            self._http.request("GET", f"/tasks/{task_id}")
-        )
+        return self._http.request_model(TaskView, "GET", f"/tasks/{task_id}")
 
     def update(self, task_id: str, *, action: TaskUpdateAction | str, **extra: Any) -> TaskView:
         """Update a task (generic PATCH)."""
@@ -191,9 +265,7 @@ class Tasks:
 
     def status(self, task_id: str) -> TaskStatusView:
         """Get lightweight task status (optimized for polling)."""
-        return TaskStatusView.model_validate(
-            self._http.request("GET", f"/tasks/{task_id}/status")
-        )
+        return self._http.request_model(TaskStatusView, "GET", f"/tasks/{task_id}/status")
 
     def logs(self, task_id: str) -> TaskLogFileResponse:
         """Get secure download URL for task execution logs."""
@@ -201,14 +273,30 @@ class Tasks:
             self._http.request("GET", f"/tasks/{task_id}/logs")
         )
 
-    def wait(self, task_id: str, *, timeout: float = 300, interval: float = 2) -> TaskView:
-        """Poll until a task reaches a terminal status, then return the full TaskView."""
+    def wait(
+        self,
+        task_id: str,
+        *,
+        timeout: float = 300,
+        interval: float = 2,
+        on_timeout: OnTimeout = "raise",
+    ) -> TaskView:
+        """Poll until a task reaches a terminal status, then return the full TaskView.
+
+        With ``on_timeout="cancel"`` the task and its session are stopped
+        before ``TimeoutError`` is raised.
+        """
         deadline = time.monotonic() + timeout
         while time.monotonic() < deadline:
             status = self.status(task_id)
             if status.status.value in _TERMINAL_STATUSES:
                 return self.get(task_id)
             time.sleep(interval)
+        if on_timeout == "cancel":
+            try:
+                self.stop_task_and_session(task_id)
+            except BrowserUseError:
+                pass  # finished or gone in the meantime
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
     # Deprecated aliases for older browser-use versions (<=0.11.x)
@@ -223,6 +311,63 @@ class AsyncTasks:
     def __init__(self, http: AsyncHttpClient) -> None:
         self._http = http
 
+    def template(
+        self,
+        *,
+        session_id: str | None = None,
+        llm: str | None = None,
+        start_url: str | None = None,
+        max_steps: int | None = None,
+        structured_output: str | None = None,
+        metadata: dict[str, str] | None = None,
+        secrets: dict[str, str] | None = None,
+        allowed_domains: list[str] | None = None,
+        highlight_elements: bool | None = None,
+        flash_mode: bool | None = None,
+        thinking: bool | None = None,
+        vision: bool | str | None = None,
+        system_prompt_extension: str | None = None,
+        judge: bool | None = None,
+        judge_ground_truth: str | None = None,
+        judge_llm: str | None = None,
+        skill_ids: list[str] | None = None,
+        op_vault_id: str | None = None,
+        session_settings: SessionSettings | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many tasks.
+
+        Usage::
+
+            template = client.tasks.template(llm="gpt-4.1", session_settings=settings)
+            await client.tasks.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            "",
+            session_id=session_id,
+            llm=llm,
+            start_url=start_url,
+            max_steps=max_steps,
+            structured_output=structured_output,
+            metadata=metadata,
+            secrets=secrets,
+            allowed_domains=allowed_domains,
+            highlight_elements=highlight_elements,
+            flash_mode=flash_mode,
+            thinking=thinking,
+            vision=vision,
+            system_prompt_extension=system_prompt_extension,
+            judge=judge,
+            judge_ground_truth=judge_ground_truth,
+            judge_llm=judge_llm,
+            skill_ids=skill_ids,
+            op_vault_id=op_vault_id,
+            session_settings=session_settings,
+            **extra,
+        )
+        del body["task"]
+        return RequestTemplate(body)
+
     async def create(
         self,
         task: str,
@@ -246,9 +391,18 @@ class AsyncTasks:
         skill_ids: list[str] | None = None,
         op_vault_id: str | None = None,
         session_settings: SessionSettings | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> TaskCreatedResponse:
-        """Create and start a new AI agent task."""
+    ) -> CreatedTask:
+        """Create and start a new AI agent task.
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
         body = _build_create_body(
             task,
             session_id=session_id,
@@ -272,8 +426,11 @@ class AsyncTasks:
             session_settings=session_settings,
             **extra,
         )
-        return TaskCreatedResponse.model_validate(
-            await self._http.request("POST", "/tasks", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedTask,
+            await self._http.request("POST", "/tasks", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     async def list(
@@ -304,9 +461,7 @@ class AsyncTasks:
 
     async def get(self, task_id: str) -> TaskView:
         """Get detailed task information."""
-        return TaskView.model_validate(
-            await self._http.request("GET", f"/tasks/{task_id}")
-        )
+        return await self._http.request_model(TaskView, "GET", f"/tasks/{task_id}")
 
     async def update(self, task_id: str, *, action: TaskUpdateAction | str, **extra: Any) -> TaskView:
         """Update a task (generic PATCH)."""
@@ -325,9 +480,7 @@ class AsyncTasks:
 
     async def status(self, task_id: str) -> TaskStatusView:
         """Get lightweight task status (optimized for polling)."""
-        return TaskStatusView.model_validate(
-            await self._http.request("GET", f"/tasks/{task_id}/status")
-        )
+        return await self._http.request_model(TaskStatusView, "GET", f"/tasks/{task_id}/status")
 
     async def logs(self, task_id: str) -> TaskLogFileResponse:
         """Get secure download URL for task execution logs."""
@@ -335,14 +488,30 @@ class AsyncTasks:
             await self._http.request("GET", f"/tasks/{task_id}/logs")
         )
 
-    async def wait(self, task_id: str, *, timeout: float = 300, interval: float = 2) -> TaskView:
-        """Poll until a task reaches a terminal status, then return the full TaskView."""
+    async def wait(
+        self,
+        task_id: str,
+        *,
+        timeout: float = 300,
+        interval: float = 2,
+        on_timeout: OnTimeout = "raise",
+    ) -> TaskView:
+        """Poll until a task reaches a terminal status, then return the full TaskView.
+
+        With ``on_timeout="cancel"`` the task and its session are stopped
+        before ``TimeoutError`` is raised.
+        """
         deadline = time.monotonic() + timeout
         while time.monotonic() < deadline:
             status = await self.status(task_id)
             if status.status.value in _TERMINAL_STATUSES:
                 return await self.get(task_id)
             await asyncio.sleep(interval)
+        if on_timeout == "cancel":
+            try:
+                await self.stop_task_and_session(task_id)
+            except BrowserUseError:
+                pass  # finished or gone in the meantime
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
     # Deprecated aliases for older browser-use versions (<=0.11.x)
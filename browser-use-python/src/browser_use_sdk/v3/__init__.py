@@ -1,51 +1,113 @@
-from .client import AsyncBrowserUse, BrowserUse
-from .helpers import AsyncSessionRun, SessionResult
-from .._core.errors import BrowserUseError
-from .._core.x402 import get_wallet_balance
+from typing import TYPE_CHECKING
 
-from ..generated.v3.models import (
-    AccountView,
-    BrowserDownloadFile,
-    BrowserDownloadListResponse,
-    BrowserSessionItemView,
-    BrowserSessionListResponse,
-    BrowserSessionStatus,
-    BrowserSessionUpdateAction,
-    BrowserSessionView,
-    BuAgentSessionStatus,
-    BuModel,
-    PlanInfo,
-    ProfileCreateRequest,
-    ProfileListResponse,
-    ProfileUpdateRequest,
-    ProfileView,
-    FileInfo,
-    FileListResponse,
-    FileUploadItem,
-    FileUploadRequest,
-    FileUploadResponse,
-    FileUploadResponseItem,
-    MessageListResponse,
-    MessageResponse,
-    ProxyCountryCode,
-    AppEndpointsApiV3SessionsViewsRunTaskRequest as RunTaskRequest,
-    SessionListResponse,
-    SessionResponse,
-    StopSessionRequest,
-    StopStrategy,
-    WorkspaceCreateRequest,
-    WorkspaceListResponse,
-    WorkspaceUpdateRequest,
-    WorkspaceView,
+from .._lazy import attach
+
+# Names are imported on first access; see _lazy.py.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        ".client": ["AsyncBrowserUse", "BrowserUse"],
+        ".helpers": ["AsyncSessionRun", "SessionResult", "SlimSessionResult", "parse_message"],
+        ".pool": ["SessionPool"],
+        ".template": ["TemplateReport", "render_template"],
+        ".._core.batch": ["StragglerPolicy"],
+        ".._core.browser_pool": ["BrowserPool"],
+        ".._core.cache": ["ResultCache"],
+        ".._core.errors": ["BrowserUseError"],
+        ".._core.http": ["HedgePolicy"],
+        ".._core.journal": ["Journal"],
+        ".._core.request_template": ["RequestTemplate"],
+        ".._core.schema": ["schema_sizes"],
+        ".._core.subscriptions": ["OverflowPolicy", "Subscription"],
+        ".._core.x402": ["get_wallet_balance"],
+        "..generated.v3.models": [
+            "AccountView", "BrowserDownloadFile", "BrowserDownloadListResponse",
+            "BrowserSessionItemView", "BrowserSessionListResponse", "BrowserSessionStatus",
+            "BrowserSessionUpdateAction", "BrowserSessionView", "BuAgentSessionStatus", "BuModel",
+            "PlanInfo", "ProfileCreateRequest", "ProfileListResponse", "ProfileUpdateRequest",
+            "ProfileView", "FileInfo", "FileListResponse", "FileUploadItem", "FileUploadRequest",
+            "FileUploadResponse", "FileUploadResponseItem", "MessageListResponse",
+            "MessageResponse", "ProxyCountryCode",
+            "RunTaskRequest=AppEndpointsApiV3SessionsViewsRunTaskRequest", "SessionListResponse",
+            "SessionResponse", "StopSessionRequest", "StopStrategy", "WorkspaceCreateRequest",
+            "WorkspaceListResponse", "WorkspaceUpdateRequest", "WorkspaceView",
+        ],
+    },
 )
 
+if TYPE_CHECKING:
+    from .client import AsyncBrowserUse, BrowserUse
+    from .helpers import AsyncSessionRun, SessionResult, SlimSessionResult, parse_message
+    from .pool import SessionPool
+    from .template import TemplateReport, render_template
+    from .._core.batch import StragglerPolicy
+    from .._core.browser_pool import BrowserPool
+    from .._core.cache import ResultCache
+    from .._core.errors import BrowserUseError
+    from .._core.http import HedgePolicy
+    from .._core.journal import Journal
+    from .._core.request_template import RequestTemplate
+    from .._core.schema import schema_sizes
+    from .._core.subscriptions import OverflowPolicy, Subscription
+    from .._core.x402 import get_wallet_balance
+
+    from ..generated.v3.models import (
+        AccountView,
+        BrowserDownloadFile,
+        BrowserDownloadListResponse,
+        BrowserSessionItemView,
+        BrowserSessionListResponse,
+        BrowserSessionStatus,
+        BrowserSessionUpdateAction,
+        BrowserSessionView,
+        BuAgentSessionStatus,
+        BuModel,
+        PlanInfo,
+        ProfileCreateRequest,
+        ProfileListResponse,
+        ProfileUpdateRequest,
+        ProfileView,
+        FileInfo,
+        FileListResponse,
+        FileUploadItem,
+        FileUploadRequest,
+        FileUploadResponse,
+        FileUploadResponseItem,
+        MessageListResponse,
+        MessageResponse,
+        ProxyCountryCode,
+        AppEndpointsApiV3SessionsViewsRunTaskRequest as RunTaskRequest,
+        SessionListResponse,
+        SessionResponse,
+        StopSessionRequest,
+        StopStrategy,
+        WorkspaceCreateRequest,
+        WorkspaceListResponse,
+        WorkspaceUpdateRequest,
+        WorkspaceView,
+    )
+
 __all__ = [
     # Client
     "BrowserUse",
     "AsyncBrowserUse",
     "AsyncSessionRun",
     "SessionResult",
+    "SlimSessionResult",
+    "parse_message",
+    "SessionPool",
+    "TemplateReport",
+    "render_template",
+    "BrowserPool",
     "BrowserUseError",
+    "Subscription",
+    "OverflowPolicy",
+    "StragglerPolicy",
+    "HedgePolicy",
+    "Journal",
+    "ResultCache",
+    "RequestTemplate",
+    "schema_sizes",
     # x402
     "get_wallet_balance",
     # Billing models
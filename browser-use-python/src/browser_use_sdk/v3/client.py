@@ -1,22 +1,39 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable, Mapping
 from typing import Any, TypeVar, overload
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from .._core import _UNSET
-from .._core.http import AsyncHttpClient, SyncHttpClient
+from .._core import _UNSET, OnTimeout
+from .._core.batch import StragglerPolicy, run_batch
+from .._core.browser_pool import BrowserPool
+from .._core.cache import ResultCache
+from .._core.http import AsyncHttpClient, HedgePolicy, SyncHttpClient, _idempotency_key
+from .._core.journal import Journal, JournalEntry
+from .._core.schema import json_schema
+from .._core.subscriptions import OverflowPolicy, Subscription, SubscriptionHub
 from .._core.x402 import X402_BASE_URL_DEFAULT, x402_client_from_private_key
 from .resources.billing import AsyncBilling, Billing as BillingResource
 from .resources.browsers import AsyncBrowsers, Browsers as BrowsersResource
 from .resources.profiles import AsyncProfiles, Profiles as ProfilesResource
-from .resources.sessions import AsyncSessions, Sessions
+from .resources.sessions import AsyncSessions, Sessions, _build_create_body
 from .resources.workspaces import AsyncWorkspaces, Workspaces
-from .helpers import AsyncSessionRun, SessionResult, SessionStream, _poll_output
-from ..generated.v3.models import SessionResponse
+from .helpers import (
+    AsyncSessionRun,
+    SessionResult,
+    SessionStream,
+    _async_message_feed,
+    _decode_result,
+    _encode_result,
+    _parse_output,
+    _poll_output,
+)
+from .template import TemplateReport, render_template
+from ..generated.v3.models import MessageResponse, SessionResponse
 
 _V3_BASE_URL = "https://api.browser-use.com/api/v3"
 
@@ -33,11 +50,26 @@ def _resolve_x402(x402: Any | None, x402_private_key: str | None) -> Any | None:
     return None
 
 
+async def _slimmed(pending: Awaitable[SessionResult[Any]], slim: bool) -> Any:
+    result = await pending
+    return result.slim() if slim else result
+
+
 class BrowserUse:
     """Synchronous Browser Use v3 client.
 
     For x402 (pay-per-request) authentication, use :class:`AsyncBrowserUse` —
     x402 settlement is async-only.
+
+    ``on_timeout="cancel"`` stops the remote run when ``run``/``stream`` time
+    out, so it stops billing and frees its concurrency slot.
+
+    Pass ``result_cache=ResultCache()`` to return the stored result of an
+    identical earlier ``run`` instead of creating a new session.
+
+    ``compact_schemas=True`` sends a minimized structured-output schema
+    (no generated titles, small ``$defs`` inlined) that accepts the same
+    output; see :func:`schema_sizes` for the saving.
     """
 
     def __init__(
@@ -47,6 +79,9 @@ class BrowserUse:
         base_url: str | None = None,
         timeout: float = 30.0,
         use_own_key: bool | None = None,
+        on_timeout: OnTimeout = "raise",
+        result_cache: ResultCache | None = None,
+        compact_schemas: bool = False,
         x402: Any | None = None,
         x402_private_key: str | None = None,
     ) -> None:
@@ -65,6 +100,9 @@ class BrowserUse:
             api_key=resolved_key,
             timeout=timeout,
         )
+        self._on_timeout = on_timeout
+        self._result_cache = result_cache
+        self._compact_schemas = compact_schemas
         self.billing = BillingResource(self._http)
         self.browsers = BrowsersResource(self._http)
         self.profiles = ProfilesResource(self._http)
@@ -175,14 +213,13 @@ class BrowserUse:
                     "output_schema must be a Pydantic BaseModel subclass, "
                     f"got {resolved_schema!r}"
                 )
-            schema_dict = resolved_schema.model_json_schema()
+            schema_dict = json_schema(resolved_schema, compact=self._compact_schemas)
 
         # Auto keep_alive when dispatching to an existing session
         if session_id is not None and keep_alive is None:
             keep_alive = True
 
-        data = self.sessions.create(
-            task,
+        create_kwargs: dict[str, Any] = dict(
             model=model,
             session_id=session_id,
             keep_alive=keep_alive,
@@ -198,7 +235,19 @@ class BrowserUse:
             use_own_key=use_own_key,
             **extra,
         )
-        return _poll_output(self.sessions, str(data.id), resolved_schema)
+
+        def run_task() -> SessionResult[Any]:
+            data = self.sessions.create(task, **create_kwargs)
+            return _poll_output(self.sessions, str(data.id), resolved_schema, on_timeout=self._on_timeout)
+
+        if self._result_cache is None or session_id is not None or keep_alive:
+            return run_task()
+        return self._result_cache.get_or_run(
+            self._result_cache.key("v3", _build_create_body(task, **create_kwargs)),
+            run_task,
+            _encode_result,
+            lambda raw: _decode_result(raw, resolved_schema),
+        )
 
     def stream(
         self,
@@ -240,7 +289,7 @@ class BrowserUse:
                     "output_schema must be a Pydantic BaseModel subclass, "
                     f"got {resolved_schema!r}"
                 )
-            schema_dict = resolved_schema.model_json_schema()
+            schema_dict = json_schema(resolved_schema, compact=self._compact_schemas)
 
         if session_id is not None and keep_alive is None:
             keep_alive = True
@@ -270,7 +319,9 @@ class BrowserUse:
             use_own_key=use_own_key,
             **extra,
         )
-        return SessionStream(data, self.sessions, resolved_schema, _start_cursor=start_cursor)
+        return SessionStream(
+            data, self.sessions, resolved_schema, on_timeout=self._on_timeout, _start_cursor=start_cursor
+        )
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -292,6 +343,20 @@ class AsyncBrowserUse:
     "top-up" mode — the API key is forwarded as a header so the backend
     credits the existing project (instead of auto-creating a wallet-keyed one).
     x402 mode requires the optional extra: ``pip install "browser-use-sdk[x402]"``.
+
+    ``on_timeout="cancel"`` stops the remote run when a ``run`` handle times
+    out, or when its last awaiting consumer is cancelled.
+
+    Pass ``hedge=HedgePolicy()`` to race a duplicate of GETs that are slower
+    than the recent p95, trimming tail latency on status polls.
+
+    Pass ``result_cache=ResultCache()`` to memoize ``await client.run(...)``:
+    an identical earlier run's result is returned without creating a session,
+    and concurrent identical runs share one remote session.
+
+    ``compact_schemas=True`` sends a minimized structured-output schema
+    (no generated titles, small ``$defs`` inlined) that accepts the same
+    output; see :func:`schema_sizes` for the saving.
     """
 
     def __init__(
@@ -301,6 +366,10 @@ class AsyncBrowserUse:
         base_url: str | None = None,
         timeout: float = 30.0,
         use_own_key: bool | None = None,
+        on_timeout: OnTimeout = "raise",
+        hedge: HedgePolicy | None = None,
+        result_cache: ResultCache | None = None,
+        compact_schemas: bool = False,
         x402: Any | None = None,
         x402_private_key: str | None = None,
     ) -> None:
@@ -312,6 +381,7 @@ class AsyncBrowserUse:
                 api_key=topup_key,
                 timeout=timeout,
                 x402_client=x402_client,
+                hedge=hedge,
             )
         else:
             resolved_key = api_key or os.environ.get("BROWSER_USE_API_KEY") or ""
@@ -325,12 +395,20 @@ class AsyncBrowserUse:
                 base_url=base_url or _V3_BASE_URL,
                 api_key=resolved_key,
                 timeout=timeout,
+                hedge=hedge,
             )
+        self._on_timeout = on_timeout
+        self._result_cache = result_cache
+        self._compact_schemas = compact_schemas
         self.billing = AsyncBilling(self._http)
         self.browsers = AsyncBrowsers(self._http)
         self.profiles = AsyncProfiles(self._http)
         self.sessions = AsyncSessions(self._http, use_own_key=use_own_key)
         self.workspaces = AsyncWorkspaces(self._http)
+        self._browser_pools: list[BrowserPool] = []
+        self._hub: SubscriptionHub[MessageResponse] = SubscriptionHub(
+            lambda session_id, publish: _async_message_feed(self.sessions, session_id, publish)
+        )
 
     @overload
     def run(
@@ -436,7 +514,7 @@ class AsyncBrowserUse:
                     "output_schema must be a Pydantic BaseModel subclass, "
                     f"got {resolved_schema!r}"
                 )
-            schema_dict = resolved_schema.model_json_schema()
+            schema_dict = json_schema(resolved_schema, compact=self._compact_schemas)
 
         # Auto keep_alive when dispatching to an existing session
         effective_keep_alive = keep_alive
@@ -471,8 +549,270 @@ class AsyncBrowserUse:
                 **extra,
             )
 
-        return AsyncSessionRun(create_fn, self.sessions, resolved_schema, _start_cursor_ref=lambda: start_cursor)
+        cache = None
+        if self._result_cache is not None and session_id is None and not keep_alive:
+            body = _build_create_body(
+                task,
+                model=model,
+                max_cost_usd=max_cost_usd,
+                profile_id=profile_id,
+                proxy_country_code=proxy_country_code,
+                output_schema=schema_dict,
+                workspace_id=workspace_id,
+                sensitive_data=sensitive_data,
+                enable_recording=enable_recording,
+                cache_script=cache_script,
+                code_mode=code_mode,
+                use_own_key=use_own_key,
+                **extra,
+            )
+            cache = (self._result_cache, self._result_cache.key("v3", body))
+        return AsyncSessionRun(
+            create_fn,
+            self.sessions,
+            resolved_schema,
+            on_timeout=self._on_timeout,
+            _start_cursor_ref=lambda: start_cursor,
+            _cache=cache,
+        )
+
+    async def run_many(
+        self,
+        tasks: Iterable[str],
+        *,
+        concurrency: int = 10,
+        straggler: StragglerPolicy | None = None,
+        journal: Journal | None = None,
+        return_exceptions: bool = False,
+        slim: bool = False,
+        **run_kwargs: Any,
+    ) -> list[Any]:
+        """Run many tasks, at most ``concurrency`` at a time. Results keep input order.
+
+        ``run_kwargs`` are passed to :meth:`run` for every task. Pass a
+        :class:`StragglerPolicy` to re-submit sessions that take much longer
+        than their finished peers; the first copy to finish wins and the
+        other session is stopped.
+
+        With a :class:`Journal`, every task is recorded before it is created
+        and its session id and result as they arrive, so :meth:`resume` can
+        finish the batch after a crash. Journaling and hedging are exclusive.
+
+        ``slim=True`` returns :class:`SlimSessionResult` records: each full
+        response is dropped as soon as its session finishes, so memory grows
+        with the number of tasks rather than with how verbose the agent was.
+
+        Usage::
+
+            policy = StragglerPolicy(max_hedges=5)
+            results = await client.run_many(tasks, straggler=policy)
+        """
+        if journal is not None:
+            if straggler is not None:
+                raise ValueError("journal and straggler cannot be combined")
+            # Both are popped so neither is journaled; ``schema`` wins, as in run().
+            schema = run_kwargs.pop("schema", None)
+            output_schema = run_kwargs.pop("output_schema", None)
+            schema = schema or output_schema
+            entries = []
+            for task in tasks:
+                key = _idempotency_key(None)
+                payload = {"task": task, **run_kwargs}
+                journal.submitted(key, payload)
+                entries.append((key, payload))
+            return await run_batch(
+                entries,
+                lambda entry: _slimmed(self._run_journaled(journal, *entry, None, schema), slim),
+                concurrency=concurrency,
+                return_exceptions=return_exceptions,
+            )
+
+        async def run_one(task: str) -> Any:
+            handle = self.run(task, **run_kwargs)
+            try:
+                result = await handle
+            except asyncio.CancelledError:
+                await asyncio.shield(handle.cancel())
+                raise
+            return result.slim() if slim else result
+
+        return await run_batch(
+            tasks,
+            run_one,
+            concurrency=concurrency,
+            straggler=straggler,
+            return_exceptions=return_exceptions,
+        )
+
+    async def resume(
+        self,
+        journal: Journal,
+        *,
+        schema: type[Any] | None = None,
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+        slim: bool = False,
+    ) -> list[Any]:
+        """Finish a journaled :meth:`run_many` batch after a restart.
+
+        Finished entries are returned from the journal without a request,
+        created sessions are polled again, and entries that never got a
+        session id are re-created with their original idempotency key.
+        Pass the batch's ``schema`` again to get typed outputs, and ``slim``
+        as for :meth:`run_many`.
+
+        Usage::
+
+            results = await client.resume(Journal("batch.sqlite"))
+        """
+
+        async def resume_one(entry: JournalEntry) -> Any:
+            if entry.result is not None:
+                session = SessionResponse.model_validate_json(entry.result)
+                result = SessionResult(session, _parse_output(session.output, schema))
+            else:
+                result = await self._run_journaled(journal, entry.key, entry.payload, entry.remote_id, schema)
+            return result.slim() if slim else result
+
+        return await run_batch(
+            journal.entries(),
+            resume_one,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    async def run_template(
+        self,
+        template: str,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        workspace_id: str,
+        concurrency: int = 10,
+        warm_attempts: int = 3,
+        return_exceptions: bool = False,
+        slim: bool = False,
+        **run_kwargs: Any,
+    ) -> TemplateReport[Any]:
+        """Run one ``@{{name}}`` template over many rows with script caching.
+
+        Launched all at once, every row would miss the script cache and run
+        the full agent. Instead rows run one at a time until one succeeds
+        (at most ``warm_attempts``), which saves the script; the remaining
+        rows then fan out through :meth:`run_many` with ``concurrency`` and
+        run the cached script. The report counts cache hits and full agent
+        runs. ``slim=True`` keeps :class:`SlimSessionResult` records, as for
+        :meth:`run_many`.
+
+        Usage::
+
+            report = await client.run_template(
+                "Get the price of @{{product}} on @{{site}}",
+                [{"product": "iPhone 16", "site": "amazon.com"}, ...],
+                workspace_id=workspace_id,
+            )
+            print(report.cache_hits, report.agent_runs)
+        """
+        tasks = [render_template(template, row) for row in rows]
+        run_kwargs.update(cache_script=True, workspace_id=workspace_id)
+        results: list[Any] = []
+        while len(results) < min(warm_attempts, len(tasks)):
+            handle = self.run(tasks[len(results)], **run_kwargs)
+            try:
+                result = await handle
+            except asyncio.CancelledError:
+                await asyncio.shield(handle.cancel())
+                raise
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+                continue
+            results.append(result.slim() if slim else result)
+            if result.session.status.value != "error" and result.session.is_task_successful is not False:
+                break
+        results.extend(
+            await self.run_many(
+                tasks[len(results):],
+                concurrency=concurrency,
+                return_exceptions=return_exceptions,
+                slim=slim,
+                **run_kwargs,
+            )
+        )
+        return TemplateReport(results)
+
+    async def _run_journaled(
+        self,
+        journal: Journal,
+        key: str,
+        payload: dict[str, Any],
+        session_id: str | None,
+        schema: type[Any] | None,
+    ) -> SessionResult[Any]:
+        if session_id is None:
+            handle = self.run(**payload, output_schema=schema, idempotency_key=key)
+            journal.created(key, await handle._ensure_created())
+        else:
+            existing = session_id
+            handle = AsyncSessionRun(
+                lambda: self.sessions.get(existing), self.sessions, schema, on_timeout=self._on_timeout
+            )
+        try:
+            result = await handle
+        except asyncio.CancelledError:
+            await asyncio.shield(handle.cancel())
+            raise
+        journal.finished(key, result.session.model_dump_json(by_alias=True))
+        return result
+
+    def subscribe(
+        self,
+        session_id: str | UUID,
+        *,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+    ) -> Subscription[MessageResponse]:
+        """Subscribe to a session's messages.
+
+        All subscribers on the same session share one upstream poll loop, so
+        adding observers does not add API requests. Each subscriber has its
+        own buffer of ``maxsize`` messages; ``overflow`` picks what happens
+        when it falls behind (``"block"``, ``"drop_oldest"``, ``"drop_newest"``).
+
+        Usage::
+
+            async with client.subscribe(session_id) as sub:
+                async for msg in sub:
+                    print(f"[{msg.role}] {msg.summary}")
+        """
+        return self._hub.subscribe(str(session_id), maxsize=maxsize, overflow=overflow)
+
+    def browser_pool(
+        self,
+        *,
+        max_size: int = 10,
+        timeout: int | None = None,
+        recycle_before: float = 60,
+    ) -> BrowserPool:
+        """Create a pool of standalone browsers that this client stops on close.
+
+        ``timeout`` is the per-browser session timeout (minutes) passed to
+        ``browsers.create``; browsers within ``recycle_before`` seconds of it
+        are replaced rather than leased.
+
+        Usage::
+
+            pool = client.browser_pool(max_size=4)
+            async with pool.lease(proxy_country_code="us") as browser:
+                await scrape(browser.cdp_url)
+        """
+        pool = BrowserPool(self.browsers, max_size=max_size, timeout=timeout, recycle_before=recycle_before)
+        self._browser_pools.append(pool)
+        return pool
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Stop pooled browsers and close the underlying HTTP client."""
+        self._hub.close()
+        for pool in self._browser_pools:
+            await pool.close()
         await self._http.close()
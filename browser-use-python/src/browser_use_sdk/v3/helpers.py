@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import time
 import asyncio
+import inspect
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
-from ..generated.v3.models import MessageResponse, SessionResponse
+from .._core import OnTimeout
+from .._core.cache import ResultCache
+from .._core.errors import BrowserUseError
+from .._core.payloads import _cached, _loads_or_text
+from ..generated.v3.models import BuAgentSessionStatus, MessageResponse, SessionResponse
 from .resources.sessions import AsyncSessions, Sessions
 
 _TERMINAL_STATUSES = {"idle", "stopped", "timed_out", "error"}
 
+# Message types after which the session is likely to go terminal, so the
+# streamer checks status instead of waiting for an empty messages page.
+_COMPLETION_MESSAGE_TYPES = {"completion"}
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
 T = TypeVar("T")
 
 
@@ -31,6 +44,85 @@ class SessionResult(Generic[T]):
     def __repr__(self) -> str:
         return f"SessionResult(id={self.session.id}, status={self.session.status.value}, output={self.output!r})"
 
+    def slim(self) -> SlimSessionResult[T]:
+        """Copy the summary fields into a :class:`SlimSessionResult`, dropping the full response."""
+        s = self.session
+        return SlimSessionResult(
+            s.id,
+            s.status,
+            self.output,
+            s.is_task_successful,
+            s.total_input_tokens,
+            s.total_output_tokens,
+            s.llm_cost_usd,
+            s.total_cost_usd,
+            s.created_at,
+            s.updated_at,
+        )
+
+
+class SlimSessionResult(Generic[T]):
+    """Memory-lean session result for large batches.
+
+    Keeps only the id, status, typed output, success flag, token and cost
+    fields and timestamps in ``__slots__``; the rest of the
+    ``SessionResponse`` is dropped. Returned by ``run_many(..., slim=True)``
+    or :meth:`SessionResult.slim`.
+    """
+
+    __slots__ = (
+        "id",
+        "status",
+        "output",
+        "is_task_successful",
+        "total_input_tokens",
+        "total_output_tokens",
+        "llm_cost_usd",
+        "total_cost_usd",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: UUID,
+        status: BuAgentSessionStatus,
+        output: T,
+        is_task_successful: bool | None,
+        total_input_tokens: int | None,
+        total_output_tokens: int | None,
+        llm_cost_usd: str | None,
+        total_cost_usd: str | None,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> None:
+        self.id = id
+        self.status = status
+        self.output = output
+        self.is_task_successful = is_task_successful
+        self.total_input_tokens = total_input_tokens
+        self.total_output_tokens = total_output_tokens
+        self.llm_cost_usd = llm_cost_usd
+        self.total_cost_usd = total_cost_usd
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"SlimSessionResult(id={self.id}, status={self.status.value}, output={self.output!r})"
+
+
+def parse_message(message: MessageResponse) -> Any:
+    """The message's data decoded from JSON, or the text itself if it is not JSON.
+
+    Decoded once and cached on the message.
+
+    Usage::
+
+        for msg in client.sessions.messages(session_id).messages:
+            print(msg.type, parse_message(msg))
+    """
+    return _cached(message, "_parsed_data", message.data, lambda: _loads_or_text(message.data))
+
 
 def _parse_output(output: Any, output_schema: type[Any] | None) -> Any:
     """Parse raw output into the target type."""
@@ -43,6 +135,47 @@ def _parse_output(output: Any, output_schema: type[Any] | None) -> Any:
     return output
 
 
+def _encode_result(result: SessionResult[Any]) -> str | None:
+    """Serialize a result for :class:`ResultCache`; unsuccessful runs are not cached."""
+    session = result.session
+    if session.status.value not in ("idle", "stopped") or session.is_task_successful is False:
+        return None
+    return session.model_dump_json(by_alias=True)
+
+
+def _decode_result(raw: str, output_schema: type[Any] | None) -> SessionResult[Any]:
+    session = SessionResponse.model_validate_json(raw)
+    return SessionResult(session, _parse_output(session.output, output_schema))
+
+
+def _needs_status_check(messages: list[MessageResponse]) -> bool:
+    """Whether a stream tick should call ``sessions.get()``.
+
+    While new messages keep arriving the session is still working, so the
+    status request is skipped. It only runs on an empty page or one that
+    carries a completion-type message.
+    """
+    if not messages:
+        return True
+    return any(msg.type in _COMPLETION_MESSAGE_TYPES for msg in messages)
+
+
+def _stop_session(sessions: Sessions, session_id: str) -> None:
+    """Best-effort stop of an abandoned session."""
+    try:
+        sessions.stop(session_id)
+    except BrowserUseError:
+        pass  # finished or gone in the meantime
+
+
+async def _async_stop_session(sessions: AsyncSessions, session_id: str) -> None:
+    """Best-effort stop of an abandoned session."""
+    try:
+        await sessions.stop(session_id)
+    except BrowserUseError:
+        pass  # finished or gone in the meantime
+
+
 def _poll_output(
     sessions: Sessions,
     session_id: str,
@@ -50,6 +183,7 @@ def _poll_output(
     *,
     timeout: float = 14400,
     interval: float = 2,
+    on_timeout: OnTimeout = "raise",
 ) -> SessionResult[Any]:
     """Poll session status until terminal, return SessionResult."""
     deadline = time.monotonic() + timeout
@@ -58,6 +192,8 @@ def _poll_output(
         if session.status.value in _TERMINAL_STATUSES:
             return SessionResult(session, _parse_output(session.output, output_schema))
         time.sleep(interval)
+    if on_timeout == "cancel":
+        _stop_session(sessions, session_id)
     raise TimeoutError(f"Session {session_id} did not complete within {timeout}s")
 
 
@@ -68,6 +204,7 @@ async def _async_poll_output(
     *,
     timeout: float = 14400,
     interval: float = 2,
+    on_timeout: OnTimeout = "raise",
 ) -> SessionResult[Any]:
     """Async poll session status until terminal, return SessionResult."""
     deadline = time.monotonic() + timeout
@@ -76,11 +213,51 @@ async def _async_poll_output(
         if session.status.value in _TERMINAL_STATUSES:
             return SessionResult(session, _parse_output(session.output, output_schema))
         await asyncio.sleep(interval)
+    if on_timeout == "cancel":
+        await _async_stop_session(sessions, session_id)
+    raise TimeoutError(f"Session {session_id} did not complete within {timeout}s")
+
+
+async def _async_message_feed(
+    sessions: AsyncSessions,
+    session_id: str,
+    publish: Callable[[MessageResponse], Awaitable[None]],
+    *,
+    timeout: float = 14400,
+    interval: float = 2,
+) -> None:
+    """Publish a session's messages until it is terminal (subscription poll loop)."""
+    cursor: str | None = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        resp = await sessions.messages(session_id, after=cursor, limit=100)
+        for msg in resp.messages:
+            await publish(msg)
+            cursor = str(msg.id)
+
+        if _needs_status_check(resp.messages):
+            session = await sessions.get(session_id)
+            if session.status.value in _TERMINAL_STATUSES:
+                while True:
+                    resp = await sessions.messages(session_id, after=cursor, limit=100)
+                    if not resp.messages:
+                        return
+                    for msg in resp.messages:
+                        await publish(msg)
+                        cursor = str(msg.id)
+
+        await asyncio.sleep(interval)
     raise TimeoutError(f"Session {session_id} did not complete within {timeout}s")
 
 
 class AsyncSessionRun(Generic[T]):
-    """Lazy async session handle — awaitable, returns SessionResult on await."""
+    """Lazy async session handle — awaitable, returns SessionResult on await.
+
+    The session is created once no matter how many consumers share the
+    handle, and a single poll loop feeds all of them: awaiters, ``async for``
+    iterators and :meth:`on_message` callbacks. Messages are only fetched
+    once something asks for them; a plain ``await`` polls session status.
+    """
 
     def __init__(
         self,
@@ -90,16 +267,29 @@ class AsyncSessionRun(Generic[T]):
         *,
         timeout: float = 14400,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
         _start_cursor: str | None = None,
         _start_cursor_ref: Callable[[], str | None] | None = None,
+        _cache: tuple[ResultCache, str] | None = None,
     ) -> None:
         self._create_fn = create_fn
         self._sessions = sessions
+        self._cache = _cache
         self._output_schema = output_schema
         self._timeout = timeout
         self._interval = interval
+        self._on_timeout = on_timeout
+        self._consumers = 0
         self._start_cursor = _start_cursor
         self._start_cursor_ref = _start_cursor_ref
+        self._created: asyncio.Future[SessionResponse] | None = None
+        self._poller: asyncio.Future[SessionResult[T]] | None = None
+        self._backfill: asyncio.Future[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._want_messages = False
+        self._messages: list[MessageResponse] = []
+        self._messages_done = False
+        self._callbacks: list[Callable[[MessageResponse], Any]] = []
         self.session_id: str | None = None
         self.result: SessionResult[T] | None = None
 
@@ -108,25 +298,148 @@ class AsyncSessionRun(Generic[T]):
         """Final typed output (available after awaiting)."""
         return self.result.output if self.result else None
 
-    async def _wait_for_output(self) -> SessionResult[T]:
-        data = await self._create_fn()
+    def on_message(self, callback: Callable[[MessageResponse], Any]) -> None:
+        """Call ``callback`` (sync or async) for each new message.
+
+        Register before awaiting the handle to see every message.
+        """
+        self._callbacks.append(callback)
+        self._want_messages = True
+
+    async def _ensure_created(self) -> str:
+        if self._created is None:
+            self._created = asyncio.ensure_future(self._create_fn())
+        data = await asyncio.shield(self._created)
         self.session_id = str(data.id)
-        result = await _async_poll_output(
-            self._sessions,
-            self.session_id,
-            self._output_schema,
-            timeout=self._timeout,
-            interval=self._interval,
-        )
-        self.result = result
-        return result
+        return self.session_id
+
+    def _ensure_poller(self) -> asyncio.Future[SessionResult[T]]:
+        if self._poller is None:
+            self._wakeup = asyncio.Event()
+            self._poller = asyncio.ensure_future(self._poll())
+        return self._poller
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = asyncio.Event()
+
+    def _cursor(self) -> str | None:
+        if self._messages:
+            return str(self._messages[-1].id)
+        # Prefer the ref callback (set during create_fn) over the static value
+        return self._start_cursor_ref() if self._start_cursor_ref else self._start_cursor
+
+    async def _publish(self, msg: MessageResponse) -> None:
+        self._messages.append(msg)
+        for callback in self._callbacks:
+            ret = callback(msg)
+            if inspect.isawaitable(ret):
+                await ret
+        self._notify()
+
+    async def _drain(self, session_id: str) -> None:
+        """Fetch all remaining message pages (may be multiple)."""
+        while True:
+            resp = await self._sessions.messages(session_id, after=self._cursor(), limit=100)
+            if not resp.messages:
+                break
+            for msg in resp.messages:
+                await self._publish(msg)
+        self._messages_done = True
+
+    async def _poll(self) -> SessionResult[T]:
+        session_id = await self._ensure_created()
+        deadline = time.monotonic() + self._timeout
+        # After a quiet tick the next one will likely need a status check too,
+        # so both requests are pipelined instead of issued back to back.
+        quiet = False
+
+        try:
+            while time.monotonic() < deadline:
+                session: SessionResponse | None = None
+                if not self._want_messages:
+                    session = await self._sessions.get(session_id)
+                else:
+                    if quiet:
+                        resp, session = await asyncio.gather(
+                            self._sessions.messages(session_id, after=self._cursor(), limit=100),
+                            self._sessions.get(session_id),
+                        )
+                    else:
+                        resp = await self._sessions.messages(session_id, after=self._cursor(), limit=100)
+                    for msg in resp.messages:
+                        await self._publish(msg)
+                    quiet = not resp.messages
+                    if session is None and _needs_status_check(resp.messages):
+                        session = await self._sessions.get(session_id)
+
+                if session is not None and session.status.value in _TERMINAL_STATUSES:
+                    if self._want_messages:
+                        await self._drain(session_id)
+                    self.result = SessionResult(session, _parse_output(session.output, self._output_schema))
+                    return self.result
+
+                await asyncio.sleep(self._interval)
+
+            if self._on_timeout == "cancel":
+                await _async_stop_session(self._sessions, session_id)
+            raise TimeoutError(f"Session {session_id} did not complete within {self._timeout}s")
+        finally:
+            self._notify()
+
+    async def cancel(self) -> None:
+        """Stop polling and stop the remote session."""
+        if self._poller is not None and not self._poller.done():
+            self._poller.cancel()
+        if self._created is not None:
+            await _async_stop_session(self._sessions, await self._ensure_created())
+
+    async def _abandon(self) -> None:
+        # The last consumer was cancelled or stopped iterating: the local poll
+        # loop always stops, and with on_timeout="cancel" the remote session is
+        # stopped too. An in-flight create is left to finish so cancel() can
+        # still learn its id. Nothing happens once the poll loop has finished.
+        if self._consumers != 1 or self._poller is None or self._poller.done():
+            return
+        if self._on_timeout == "cancel":
+            await asyncio.shield(self.cancel())
+        else:
+            self._poller.cancel()
+
+    async def _wait_for_output(self) -> SessionResult[T]:
+        self._consumers += 1
+        try:
+            # Shielded so one cancelled consumer does not stop the shared poll loop.
+            return await asyncio.shield(self._ensure_poller())
+        except asyncio.CancelledError:
+            await self._abandon()
+            raise
+        finally:
+            self._consumers -= 1
 
     def __await__(self):
+        if self._cache is not None:
+            return self._cached_output().__await__()
         return self._wait_for_output().__await__()
 
+    async def _cached_output(self) -> SessionResult[T]:
+        assert self._cache is not None
+        cache, key = self._cache
+        self.result = await cache.aget_or_run(
+            key,
+            self._wait_for_output,
+            _encode_result,
+            lambda raw: _decode_result(raw, self._output_schema),
+        )
+        return self.result
+
     async def __aiter__(self) -> AsyncIterator[MessageResponse]:
         """Yield new messages as they appear, then set .result when done.
 
+        Every iterator replays the session's messages from the start, so
+        several consumers can iterate the same handle.
+
         Usage::
 
             run = client.run("Find the top story on HN")
@@ -134,34 +447,33 @@ class AsyncSessionRun(Generic[T]):
                 print(f"[{msg.role}] {msg.summary}")
             print(run.result.output)
         """
-        data = await self._create_fn()
-        self.session_id = str(data.id)
-        # Resolve cursor: prefer the ref callback (set during create_fn) over static value
-        cursor: str | None = self._start_cursor_ref() if self._start_cursor_ref else self._start_cursor
-        deadline = time.monotonic() + self._timeout
-
-        while time.monotonic() < deadline:
-            resp = await self._sessions.messages(self.session_id, after=cursor, limit=100)
-            for msg in resp.messages:
-                yield msg
-                cursor = str(msg.id)
-
-            session = await self._sessions.get(self.session_id)
-            if session.status.value in _TERMINAL_STATUSES:
-                # Drain all remaining messages (may be multiple pages)
-                while True:
-                    resp = await self._sessions.messages(self.session_id, after=cursor, limit=100)
-                    if not resp.messages:
-                        break
-                    for msg in resp.messages:
-                        yield msg
-                        cursor = str(msg.id)
-                self.result = SessionResult(session, _parse_output(session.output, self._output_schema))
-                return
-
-            await asyncio.sleep(self._interval)
-
-        raise TimeoutError(f"Session {self.session_id} did not complete within {self._timeout}s")
+        self._want_messages = True
+        poller = self._ensure_poller()
+        index = 0
+
+        self._consumers += 1
+        try:
+            while True:
+                while index < len(self._messages):
+                    yield self._messages[index]
+                    index += 1
+                if poller.done():
+                    poller.result()  # re-raise poll errors
+                    if self._messages_done:
+                        return
+                    # The poll loop finished before anyone asked for messages.
+                    if self._backfill is None:
+                        self._backfill = asyncio.ensure_future(self._drain(await self._ensure_created()))
+                    await asyncio.shield(self._backfill)
+                    continue
+                assert self._wakeup is not None
+                await self._wakeup.wait()
+        except (asyncio.CancelledError, GeneratorExit):
+            # GeneratorExit: the consumer broke out of the loop or closed it.
+            await self._abandon()
+            raise
+        finally:
+            self._consumers -= 1
 
 
 class SessionStream(Generic[T]):
@@ -183,6 +495,7 @@ class SessionStream(Generic[T]):
         *,
         timeout: float = 14400,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
         _start_cursor: str | None = None,
     ) -> None:
         self.session_id = str(session.id)
@@ -190,6 +503,7 @@ class SessionStream(Generic[T]):
         self._output_schema = output_schema
         self._timeout = timeout
         self._interval = interval
+        self._on_timeout = on_timeout
         self._start_cursor = _start_cursor
         self.result: SessionResult[T] | None = None
 
@@ -208,6 +522,10 @@ class SessionStream(Generic[T]):
                 yield msg
                 cursor = str(msg.id)
 
+            if not _needs_status_check(resp.messages):
+                time.sleep(self._interval)
+                continue
+
             session = self._sessions.get(self.session_id)
             if session.status.value in _TERMINAL_STATUSES:
                 while True:
@@ -222,4 +540,6 @@ class SessionStream(Generic[T]):
 
             time.sleep(self._interval)
 
+        if self._on_timeout == "cancel":
+            _stop_session(self._sessions, self.session_id)
         raise TimeoutError(f"Session {self.session_id} did not complete within {self._timeout}s")
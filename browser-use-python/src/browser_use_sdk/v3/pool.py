@@ -0,0 +1,249 @@
+"""Pool of warm keep-alive v3 sessions for low-latency task dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from .._core import _UNSET
+from .._core.errors import BrowserUseError
+from .helpers import SessionResult, _async_stop_session
+
+if TYPE_CHECKING:
+    from .client import AsyncBrowserUse
+
+# (model, profile_id, proxy_country_code) — sessions are only reused for
+# tasks that asked for the same browser identity and model tier.
+PoolKey = Tuple[Optional[str], Optional[str], Any]
+
+_HEALTHY_STATUSES = {"created", "idle"}
+
+
+class _PooledSession:
+    __slots__ = ("id", "key", "last_used")
+
+    def __init__(self, session_id: str, key: PoolKey) -> None:
+        self.id = session_id
+        self.key = key
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """Keeps keep-alive v3 sessions warm and leases them out per task.
+
+    Sessions are grouped by ``(model, profile_id, proxy_country_code)``.
+    :meth:`run` takes an idle session from the matching group (creating one
+    if needed and ``max_size`` allows), checks that it is still alive, runs
+    the task on it and returns it to the pool. Sessions idle for longer than
+    ``idle_timeout`` seconds are stopped on the next pool operation.
+
+    Usage::
+
+        async with SessionPool(client, max_size=8) as pool:
+            await pool.warm(4, model="bu-mini")
+            result = await pool.run("Find the top HN post", model="bu-mini")
+    """
+
+    def __init__(
+        self,
+        client: AsyncBrowserUse,
+        *,
+        max_size: int = 10,
+        idle_timeout: float = 300,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._client = client
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle: dict[PoolKey, list[_PooledSession]] = {}
+        self._leased: dict[str, _PooledSession] = {}
+        self._creating = 0
+        self._condition: asyncio.Condition | None = None
+        self._closed = False
+
+    @property
+    def _changed(self) -> asyncio.Condition:
+        # Created lazily so the pool can be built outside a running loop.
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @property
+    def size(self) -> int:
+        """Sessions owned by the pool, leased or idle."""
+        return len(self._leased) + sum(len(s) for s in self._idle.values()) + self._creating
+
+    async def warm(
+        self,
+        count: int,
+        *,
+        model: str | None = None,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+    ) -> None:
+        """Create sessions until the group has ``count`` idle ones (within ``max_size``)."""
+        key: PoolKey = (model, profile_id, proxy_country_code)
+        missing = min(count - len(self._idle.get(key, [])), self._max_size - self.size)
+        if missing <= 0:
+            return
+        self._creating += missing
+        results = await asyncio.gather(
+            *(self._create(key, leased=False) for _ in range(missing)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def run(
+        self,
+        task: str,
+        *,
+        model: str | None = None,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+        **run_kwargs: Any,
+    ) -> SessionResult[Any]:
+        """Run ``task`` on a warm session from the matching group."""
+        key: PoolKey = (model, profile_id, proxy_country_code)
+        pooled = await self._lease(key)
+        try:
+            result = await self._client.run(
+                task,
+                session_id=pooled.id,
+                keep_alive=True,
+                model=model,
+                **run_kwargs,
+            )
+        except BaseException:
+            # State of the session is unknown — do not hand it to the next task.
+            await self._discard(pooled)
+            raise
+        if result.session.status.value in _HEALTHY_STATUSES:
+            await self._release(pooled)
+        else:
+            await self._discard(pooled)
+        return result
+
+    async def reap(self) -> int:
+        """Stop sessions idle for longer than ``idle_timeout``. Returns how many."""
+        cutoff = time.monotonic() - self._idle_timeout
+        stale: list[_PooledSession] = []
+        async with self._changed:
+            for key, sessions in self._idle.items():
+                stale.extend(s for s in sessions if s.last_used < cutoff)
+                sessions[:] = [s for s in sessions if s.last_used >= cutoff]
+            if stale:
+                self._changed.notify_all()
+        await asyncio.gather(*(_async_stop_session(self._client.sessions, s.id) for s in stale))
+        return len(stale)
+
+    async def close(self) -> None:
+        """Stop every idle session. Leased sessions are stopped when returned."""
+        self._closed = True
+        idle = [s for sessions in self._idle.values() for s in sessions]
+        self._idle.clear()
+        await asyncio.gather(*(_async_stop_session(self._client.sessions, s.id) for s in idle))
+
+    async def __aenter__(self) -> SessionPool:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def _create(self, key: PoolKey, *, leased: bool) -> _PooledSession:
+        model, profile_id, proxy_country_code = key
+        pooled: _PooledSession | None = None
+        try:
+            session = await self._client.sessions.create(
+                model=model,
+                keep_alive=True,
+                profile_id=profile_id,
+                proxy_country_code=proxy_country_code,
+            )
+            pooled = _PooledSession(str(session.id), key)
+            return pooled
+        finally:
+            # Filed in the same step as the decrement so size never dips, and
+            # waiters are woken so a failed create frees its slot.
+            async with self._changed:
+                self._creating -= 1
+                if pooled is not None and leased:
+                    self._leased[pooled.id] = pooled
+                elif pooled is not None:
+                    self._idle.setdefault(key, []).append(pooled)
+                self._changed.notify_all()
+
+    async def _lease(self, key: PoolKey) -> _PooledSession:
+        if self._closed:
+            raise RuntimeError("SessionPool is closed")
+        await self.reap()
+        while True:
+            victim: _PooledSession | None = None
+            async with self._changed:
+                candidate = self._take_idle(key)
+                if candidate is None and self.size >= self._max_size:
+                    victim = self._take_any_idle()
+                    if victim is None:
+                        await self._changed.wait()
+                        continue
+                if candidate is None:
+                    self._creating += 1
+                else:
+                    self._leased[candidate.id] = candidate
+            if victim is not None:
+                # Full, but another group had a spare: trade it for ours.
+                await _async_stop_session(self._client.sessions, victim.id)
+            if candidate is None:
+                return await self._create(key, leased=True)
+            try:
+                if await self._healthy(candidate):
+                    return candidate
+            except BaseException as exc:
+                # State unknown: stop it rather than leak a live session.
+                await self._discard(candidate)
+                if not isinstance(exc, BrowserUseError):
+                    raise
+                continue
+            async with self._changed:
+                self._leased.pop(candidate.id, None)
+                self._changed.notify_all()
+
+    def _take_idle(self, key: PoolKey) -> _PooledSession | None:
+        sessions = self._idle.get(key)
+        if sessions:
+            return sessions.pop()  # most recently used is the least likely to have expired
+        return None
+
+    def _take_any_idle(self) -> _PooledSession | None:
+        oldest: _PooledSession | None = None
+        for sessions in self._idle.values():
+            for s in sessions:
+                if oldest is None or s.last_used < oldest.last_used:
+                    oldest = s
+        if oldest is not None:
+            self._idle[oldest.key].remove(oldest)
+        return oldest
+
+    async def _healthy(self, pooled: _PooledSession) -> bool:
+        session = await self._client.sessions.get(pooled.id)
+        return session.status.value in _HEALTHY_STATUSES
+
+    async def _release(self, pooled: _PooledSession) -> None:
+        self._leased.pop(pooled.id, None)
+        if self._closed:
+            await _async_stop_session(self._client.sessions, pooled.id)
+            return
+        pooled.last_used = time.monotonic()
+        async with self._changed:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+            self._changed.notify_all()
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        self._leased.pop(pooled.id, None)
+        with contextlib.suppress(Exception):
+            await asyncio.shield(_async_stop_session(self._client.sessions, pooled.id))
+        async with self._changed:
+            self._changed.notify_all()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from ..._core import _UNSET
-from ..._core.http import AsyncHttpClient, SyncHttpClient
+from ..._core.http import AsyncHttpClient, SyncHttpClient, _IdempotentCreate, _idempotency_key, _validate_created
 from ...generated.v3.models import (
     BrowserDownloadListResponse,
     BrowserSessionItemView,
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
     from uuid import UUID
 
 
+class CreatedBrowser(BrowserSessionItemView, _IdempotentCreate):
+    """``BrowserSessionItemView`` plus the ``idempotency_key`` the browser session was created with."""
+
+
 class Browsers:
     def __init__(self, http: SyncHttpClient) -> None:
         self._http = http
@@ -29,8 +33,9 @@ class Browsers:
         browser_screen_height: int | None = None,
         allow_resizing: bool | None = None,
         enable_recording: bool | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> BrowserSessionItemView:
+    ) -> CreatedBrowser:
         """Create a standalone browser session."""
         body: dict[str, Any] = {}
         if profile_id is not None:
@@ -48,8 +53,11 @@ class Browsers:
         if enable_recording is not None:
             body["enableRecording"] = enable_recording
         body.update(extra)
-        return BrowserSessionItemView.model_validate(
-            self._http.request("POST", "/browsers", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedBrowser,
+            self._http.request("POST", "/browsers", json=body, idempotency_key=key),
+            key,
         )
 
     def list(
@@ -121,8 +129,9 @@ class AsyncBrowsers:
         browser_screen_height: int | None = None,
         allow_resizing: bool | None = None,
         enable_recording: bool | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> BrowserSessionItemView:
+    ) -> CreatedBrowser:
         """Create a standalone browser session."""
         body: dict[str, Any] = {}
         if profile_id is not None:
@@ -140,8 +149,11 @@ class AsyncBrowsers:
         if enable_recording is not None:
             body["enableRecording"] = enable_recording
         body.update(extra)
-        return BrowserSessionItemView.model_validate(
-            await self._http.request("POST", "/browsers", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedBrowser,
+            await self._http.request("POST", "/browsers", json=body, idempotency_key=key),
+            key,
         )
 
     async def list(
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from ..._core import _UNSET
-from ..._core.http import AsyncHttpClient, SyncHttpClient
+from ..._core.http import AsyncHttpClient, SyncHttpClient, _IdempotentCreate, _idempotency_key, _validate_created
+from ..._core.request_template import RequestTemplate, _render
+from ..._core.streams import Tick, merge_polled
 from ...generated.v3.models import (
     BrowserDownloadListResponse,
     MessageListResponse,
+    MessageResponse,
     SessionListResponse,
     SessionResponse,
 )
@@ -17,6 +21,64 @@ if TYPE_CHECKING:
     from uuid import UUID
 
 
+class CreatedSession(SessionResponse, _IdempotentCreate):
+    """``SessionResponse`` plus the ``idempotency_key`` the session was created with."""
+
+
+def _build_create_body(
+    task: str | None = None,
+    *,
+    model: str | None = None,
+    session_id: str | UUID | None = None,
+    keep_alive: bool | None = None,
+    max_cost_usd: float | None = None,
+    profile_id: str | None = None,
+    proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+    output_schema: dict[str, Any] | None = None,
+    workspace_id: str | None = None,
+    enable_scheduled_tasks: bool | None = None,
+    sensitive_data: dict[str, str] | None = None,
+    enable_recording: bool | None = None,
+    cache_script: bool | None = None,
+    code_mode: bool | None = None,
+    use_own_key: bool | None = None,
+    **extra: Any,
+) -> dict[str, Any]:
+    body: dict[str, Any] = {}
+    if task is not None:
+        body["task"] = task
+    if model is not None:
+        body["model"] = model
+    if session_id is not None:
+        body["sessionId"] = str(session_id)
+    if keep_alive is not None:
+        body["keepAlive"] = keep_alive
+    if max_cost_usd is not None:
+        body["maxCostUsd"] = max_cost_usd
+    if profile_id is not None:
+        body["profileId"] = profile_id
+    if proxy_country_code is not _UNSET:
+        body["proxyCountryCode"] = proxy_country_code.lower() if isinstance(proxy_country_code, str) else proxy_country_code
+    if output_schema is not None:
+        body["outputSchema"] = output_schema
+    if workspace_id is not None:
+        body["workspaceId"] = workspace_id
+    if enable_scheduled_tasks is not None:
+        body["enableScheduledTasks"] = enable_scheduled_tasks
+    if sensitive_data is not None:
+        body["sensitiveData"] = sensitive_data
+    if enable_recording is not None:
+        body["enableRecording"] = enable_recording
+    if cache_script is not None:
+        body["cacheScript"] = cache_script
+    if code_mode is not None:
+        body["codeMode"] = code_mode
+    if use_own_key is not None:
+        body["useOwnKey"] = use_own_key
+    body.update(extra)
+    return body
+
+
 class Sessions:
     def __init__(
         self,
@@ -27,6 +89,52 @@ class Sessions:
         self._http = http
         self._use_own_key = use_own_key
 
+    def template(
+        self,
+        *,
+        model: str | None = None,
+        session_id: str | UUID | None = None,
+        keep_alive: bool | None = None,
+        max_cost_usd: float | None = None,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+        output_schema: dict[str, Any] | None = None,
+        workspace_id: str | None = None,
+        enable_scheduled_tasks: bool | None = None,
+        sensitive_data: dict[str, str] | None = None,
+        enable_recording: bool | None = None,
+        cache_script: bool | None = None,
+        code_mode: bool | None = None,
+        use_own_key: bool | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many sessions.
+
+        Usage::
+
+            template = client.sessions.template(model="bu-mini", output_schema=schema)
+            client.sessions.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            None,
+            model=model,
+            session_id=session_id,
+            keep_alive=keep_alive,
+            max_cost_usd=max_cost_usd,
+            profile_id=profile_id,
+            proxy_country_code=proxy_country_code,
+            output_schema=output_schema,
+            workspace_id=workspace_id,
+            enable_scheduled_tasks=enable_scheduled_tasks,
+            sensitive_data=sensitive_data,
+            enable_recording=enable_recording,
+            cache_script=cache_script,
+            code_mode=code_mode,
+            use_own_key=self._use_own_key if use_own_key is None else use_own_key,
+            **extra,
+        )
+        return RequestTemplate(body)
+
     def create(
         self,
         task: str | None = None,
@@ -45,46 +153,42 @@ class Sessions:
         cache_script: bool | None = None,
         code_mode: bool | None = None,
         use_own_key: bool | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> SessionResponse:
-        """Create a session and optionally dispatch a task."""
-        body: dict[str, Any] = {}
-        if task is not None:
-            body["task"] = task
-        if model is not None:
-            body["model"] = model
-        if session_id is not None:
-            body["sessionId"] = str(session_id)
-        if keep_alive is not None:
-            body["keepAlive"] = keep_alive
-        if max_cost_usd is not None:
-            body["maxCostUsd"] = max_cost_usd
-        if profile_id is not None:
-            body["profileId"] = profile_id
-        if proxy_country_code is not _UNSET:
-            body["proxyCountryCode"] = proxy_country_code.lower() if isinstance(proxy_country_code, str) else proxy_country_code
-        if output_schema is not None:
-            body["outputSchema"] = output_schema
-        if workspace_id is not None:
-            body["workspaceId"] = workspace_id
-        if enable_scheduled_tasks is not None:
-            body["enableScheduledTasks"] = enable_scheduled_tasks
-        if sensitive_data is not None:
-            body["sensitiveData"] = sensitive_data
-        if enable_recording is not None:
-            body["enableRecording"] = enable_recording
-        if cache_script is not None:
-            body["cacheScript"] = cache_script
-        if code_mode is not None:
-            body["codeMode"] = code_mode
-        effective_use_own_key = (
-            self._use_own_key if use_own_key is None else use_own_key
+    ) -> CreatedSession:
+        """Create a session and optionally dispatch a task.
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
+        body = _build_create_body(
+            task,
+            model=model,
+            session_id=session_id,
+            keep_alive=keep_alive,
+            max_cost_usd=max_cost_usd,
+            profile_id=profile_id,
+            proxy_country_code=proxy_country_code,
+            output_schema=output_schema,
+            workspace_id=workspace_id,
+            enable_scheduled_tasks=enable_scheduled_tasks,
+            sensitive_data=sensitive_data,
+            enable_recording=enable_recording,
+            cache_script=cache_script,
+            code_mode=code_mode,
+            # A template already carries the resource default.
+            use_own_key=self._use_own_key if use_own_key is None and template is None else use_own_key,
+            **extra,
         )
-        if effective_use_own_key is not None:
-            body["useOwnKey"] = effective_use_own_key
-        body.update(extra)
-        return SessionResponse.model_validate(
-            self._http.request("POST", "/sessions", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedSession,
+            self._http.request("POST", "/sessions", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     def list(
@@ -107,9 +211,7 @@ class Sessions:
 
     def get(self, session_id: str | UUID) -> SessionResponse:
         """Get session details."""
-        return SessionResponse.model_validate(
-            self._http.request("GET", f"/sessions/{session_id}")
-        )
+        return self._http.request_model(SessionResponse, "GET", f"/sessions/{session_id}")
 
     def stop(self, session_id: str | UUID, *, strategy: str | None = None, **extra: Any) -> SessionResponse:
         """Stop a session or the running task."""
@@ -136,16 +238,15 @@ class Sessions:
         limit: int | None = None,
     ) -> MessageListResponse:
         """List messages for a session with cursor-based pagination."""
-        return MessageListResponse.model_validate(
-            self._http.request(
-                "GET",
-                f"/sessions/{session_id}/messages",
-                params={
-                    "after": after,
-                    "before": before,
-                    "limit": limit,
-                },
-            )
+        return self._http.request_model(
+            MessageListResponse,
+            "GET",
+            f"/sessions/{session_id}/messages",
+            params={
+                "after": after,
+                "before": before,
+                "limit": limit,
+            },
         )
 
     def wait_for_recording(
@@ -182,6 +283,52 @@ class AsyncSessions:
         self._http = http
         self._use_own_key = use_own_key
 
+    def template(
+        self,
+        *,
+        model: str | None = None,
+        session_id: str | UUID | None = None,
+        keep_alive: bool | None = None,
+        max_cost_usd: float | None = None,
+        profile_id: str | None = None,
+        proxy_country_code: str | None = _UNSET,  # type: ignore[assignment]
+        output_schema: dict[str, Any] | None = None,
+        workspace_id: str | None = None,
+        enable_scheduled_tasks: bool | None = None,
+        sensitive_data: dict[str, str] | None = None,
+        enable_recording: bool | None = None,
+        cache_script: bool | None = None,
+        code_mode: bool | None = None,
+        use_own_key: bool | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many sessions.
+
+        Usage::
+
+            template = client.sessions.template(model="bu-mini", output_schema=schema)
+            await client.sessions.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            None,
+            model=model,
+            session_id=session_id,
+            keep_alive=keep_alive,
+            max_cost_usd=max_cost_usd,
+            profile_id=profile_id,
+            proxy_country_code=proxy_country_code,
+            output_schema=output_schema,
+            workspace_id=workspace_id,
+            enable_scheduled_tasks=enable_scheduled_tasks,
+            sensitive_data=sensitive_data,
+            enable_recording=enable_recording,
+            cache_script=cache_script,
+            code_mode=code_mode,
+            use_own_key=self._use_own_key if use_own_key is None else use_own_key,
+            **extra,
+        )
+        return RequestTemplate(body)
+
     async def create(
         self,
         task: str | None = None,
@@ -200,46 +347,42 @@ class AsyncSessions:
         cache_script: bool | None = None,
         code_mode: bool | None = None,
         use_own_key: bool | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> SessionResponse:
-        """Create a session and optionally dispatch a task."""
-        body: dict[str, Any] = {}
-        if task is not None:
-            body["task"] = task
-        if model is not None:
-            body["model"] = model
-        if session_id is not None:
-            body["sessionId"] = str(session_id)
-        if keep_alive is not None:
-            body["keepAlive"] = keep_alive
-        if max_cost_usd is not None:
-            body["maxCostUsd"] = max_cost_usd
-        if profile_id is not None:
-            body["profileId"] = profile_id
-        if proxy_country_code is not _UNSET:
-            body["proxyCountryCode"] = proxy_country_code.lower() if isinstance(proxy_country_code, str) else proxy_country_code
-        if output_schema is not None:
-            body["outputSchema"] = output_schema
-        if workspace_id is not None:
-            body["workspaceId"] = workspace_id
-        if enable_scheduled_tasks is not None:
-            body["enableScheduledTasks"] = enable_scheduled_tasks
-        if sensitive_data is not None:
-            body["sensitiveData"] = sensitive_data
-        if enable_recording is not None:
-            body["enableRecording"] = enable_recording
-        if cache_script is not None:
-            body["cacheScript"] = cache_script
-        if code_mode is not None:
-            body["codeMode"] = code_mode
-        effective_use_own_key = (
-            self._use_own_key if use_own_key is None else use_own_key
+    ) -> CreatedSession:
+        """Create a session and optionally dispatch a task.
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
+        body = _build_create_body(
+            task,
+            model=model,
+            session_id=session_id,
+            keep_alive=keep_alive,
+            max_cost_usd=max_cost_usd,
+            profile_id=profile_id,
+            proxy_country_code=proxy_country_code,
+            output_schema=output_schema,
+            workspace_id=workspace_id,
+            enable_scheduled_tasks=enable_scheduled_tasks,
+            sensitive_data=sensitive_data,
+            enable_recording=enable_recording,
+            cache_script=cache_script,
+            code_mode=code_mode,
+            # A template already carries the resource default.
+            use_own_key=self._use_own_key if use_own_key is None and template is None else use_own_key,
+            **extra,
         )
-        if effective_use_own_key is not None:
-            body["useOwnKey"] = effective_use_own_key
-        body.update(extra)
-        return SessionResponse.model_validate(
-            await self._http.request("POST", "/sessions", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedSession,
+            await self._http.request("POST", "/sessions", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     async def list(
@@ -262,9 +405,7 @@ class AsyncSessions:
 
     async def get(self, session_id: str | UUID) -> SessionResponse:
         """Get session details."""
-        return SessionResponse.model_validate(
-            await self._http.request("GET", f"/sessions/{session_id}")
-        )
+        return await self._http.request_model(SessionResponse, "GET", f"/sessions/{session_id}")
 
     async def stop(self, session_id: str | UUID, *, strategy: str | None = None, **extra: Any) -> SessionResponse:
         """Stop a session or the running task."""
@@ -291,16 +432,15 @@ class AsyncSessions:
         limit: int | None = None,
     ) -> MessageListResponse:
         """List messages for a session with cursor-based pagination."""
-        return MessageListResponse.model_validate(
-            await self._http.request(
-                "GET",
-                f"/sessions/{session_id}/messages",
-                params={
-                    "after": after,
-                    "before": before,
-                    "limit": limit,
-                },
-            )
+        return await self._http.request_model(
+            MessageListResponse,
+            "GET",
+            f"/sessions/{session_id}/messages",
+            params={
+                "after": after,
+                "before": before,
+                "limit": limit,
+            },
         )
 
     async def wait_for_recording(
@@ -325,3 +465,59 @@ class AsyncSessions:
                 break
             await asyncio.sleep(min(interval, remaining))
         return []
+
+    async def stream_many(
+        self,
+        session_ids: Iterable[str | UUID],
+        *,
+        interval: float = 2,
+        max_interval: float = 30,
+        concurrency: int = 10,
+        timeout: float = 14400,
+        on_error: Callable[[str, Exception], Any] | None = None,
+    ) -> AsyncIterator[tuple[str, MessageResponse]]:
+        """Interleave the messages of many sessions from a single async iterator.
+
+        Each session keeps its own cursor and finishes independently once it
+        is terminal and drained. Busy sessions are polled every ``interval``
+        seconds; quiet ones back off up to ``max_interval``. A session whose
+        polling fails ends on its own and the others keep going. Pass
+        ``on_error(session_id, error)`` to see each failure as it happens;
+        without it, the first failure is raised only once every other
+        session has finished, which can be hours later.
+
+        Usage::
+
+            async for session_id, msg in client.sessions.stream_many(ids):
+                print(session_id, msg.summary)
+        """
+        from ..helpers import _TERMINAL_STATUSES, _needs_status_check
+
+        cursors: dict[str, str | None] = {}
+        finishing: set[str] = set()
+
+        async def tick(session_id: str) -> Tick[MessageResponse]:
+            resp = await self.messages(session_id, after=cursors.get(session_id), limit=100)
+            if resp.messages:
+                cursors[session_id] = str(resp.messages[-1].id)
+            if session_id in finishing:
+                return Tick(resp.messages, more=bool(resp.messages), done=not resp.messages)
+            if not _needs_status_check(resp.messages):
+                return Tick(resp.messages)
+            session = await self.get(session_id)
+            if session.status.value in _TERMINAL_STATUSES:
+                finishing.add(session_id)
+                return Tick(resp.messages, more=True)
+            return Tick(resp.messages)
+
+        async for pair in merge_polled(
+            (str(s) for s in session_ids),
+            tick,
+            interval=interval,
+            max_interval=max_interval,
+            concurrency=concurrency,
+            timeout=timeout,
+            label="Session",
+            on_error=on_error,
+        ):
+            yield pair
@@ -0,0 +1,80 @@
+"""Fill ``@{{name}}`` task templates and summarize script-cached batch runs."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from decimal import Decimal, InvalidOperation
+from typing import Any, Generic, TypeVar, Union
+
+from .helpers import SessionResult, SlimSessionResult
+
+T = TypeVar("T")
+
+_PLACEHOLDER = re.compile(r"@\{\{\s*(\w+)\s*\}\}")
+
+
+def render_template(template: str, row: Mapping[str, Any]) -> str:
+    """Replace each ``@{{name}}`` in ``template`` with ``@{{<row[name]>}}``.
+
+    The value stays inside brackets so the backend recognizes every row as
+    the same script-cache template.
+
+    Usage::
+
+        render_template("Price of @{{product}}", {"product": "iPhone 16"})
+        # "Price of @{{iPhone 16}}"
+    """
+
+    def fill(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name not in row:
+            raise KeyError(f"template placeholder {name!r} missing from row {dict(row)!r}")
+        return "@{{" + str(row[name]) + "}}"
+
+    return _PLACEHOLDER.sub(fill, template)
+
+
+def _ran_cached_script(result: SessionResult[Any] | SlimSessionResult[Any]) -> bool:
+    """Whether a session succeeded on a cached script (no LLM spend) rather than the agent."""
+    if result.status.value not in ("idle", "stopped") or result.is_task_successful is False:
+        return False
+    cost = result.llm_cost_usd
+    if cost is None:
+        return False
+    try:
+        return Decimal(cost) == 0
+    except InvalidOperation:
+        return False
+
+
+class TemplateReport(Generic[T]):
+    """Results of ``client.run_template()`` in row order, with cache counts.
+
+    With ``return_exceptions=True`` failed rows hold their exception.
+    """
+
+    results: list[Union[SessionResult[T], SlimSessionResult[T], BaseException]]
+
+    def __init__(self, results: list[Union[SessionResult[T], SlimSessionResult[T], BaseException]]) -> None:
+        self.results = results
+
+    @property
+    def cache_hits(self) -> int:
+        """Rows that finished successfully on the cached script at $0 LLM cost."""
+        return sum(1 for r in self.results if not isinstance(r, BaseException) and _ran_cached_script(r))
+
+    @property
+    def agent_runs(self) -> int:
+        """Rows that ran the full agent, or finished unsuccessfully."""
+        return sum(1 for r in self.results if not isinstance(r, BaseException) and not _ran_cached_script(r))
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if isinstance(r, BaseException))
+
+    def __repr__(self) -> str:
+        return (
+            f"TemplateReport(rows={len(self.results)}, cache_hits={self.cache_hits}, "
+            f"agent_runs={self.agent_runs}, failed={self.failed})"
+        )
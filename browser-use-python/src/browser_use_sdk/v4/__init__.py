@@ -1,45 +1,98 @@
-from .client import AsyncBrowserUse, BrowserUse
-from .._core.errors import BrowserUseError
+from typing import TYPE_CHECKING
 
-from ..generated.v4.models import (
-    CustomProxy,
-    Model as RunModel,
-    ProxyCountryCode,
-    QueuedMessage,
-    QueueListResponse,
-    QueueMessageRequest,
-    RunAttachment,
-    RunAttachmentsResponse,
-    RunBrowserSettings,
-    RunCreateRequest,
-    RunCreateResponse,
-    RunEvent,
-    RunEventsResponse,
-    RunJudgeSettings,
-    RunListResponse,
-    RunStatusResponse,
-    RunSummary,
-    SessionInfo,
-    SessionListResponse,
-    Status as QueuedMessageStatus,
-    Status1 as RunAttachmentStatus,
-    Status2 as RunStatus,
-    WorkspaceCreateRequest,
-    WorkspaceFileInfo,
-    WorkspaceFileListResponse,
-    WorkspaceFileUploadItem,
-    WorkspaceFileUploadRequest,
-    WorkspaceFileUploadResponse,
-    WorkspaceFileUploadResponseItem,
-    WorkspaceInfo,
+from .._lazy import attach
+
+# Names are imported on first access; see _lazy.py.
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        ".client": ["AsyncBrowserUse", "BrowserUse"],
+        ".helpers": ["as_typed"],
+        ".multiplexer": ["SessionMultiplexer"],
+        ".resources.sessions": ["QueueMirror"],
+        ".._core.batch": ["StragglerPolicy"],
+        ".._core.errors": ["BrowserUseError"],
+        ".._core.http": ["HedgePolicy"],
+        ".._core.journal": ["Journal"],
+        ".._core.payloads": ["BrowserReady"],
+        ".._core.request_template": ["RequestTemplate"],
+        ".._core.subscriptions": ["OverflowPolicy", "Subscription"],
+        "..generated.v4.models": [
+            "CustomProxy", "RunModel=Model", "ProxyCountryCode", "QueuedMessage",
+            "QueueListResponse", "QueueMessageRequest", "RunAttachment", "RunAttachmentsResponse",
+            "RunBrowserSettings", "RunCreateRequest", "RunCreateResponse", "RunEvent",
+            "RunEventsResponse", "RunJudgeSettings", "RunListResponse", "RunStatusResponse",
+            "RunSummary", "SessionInfo", "SessionListResponse", "QueuedMessageStatus=Status",
+            "RunAttachmentStatus=Status1", "RunStatus=Status2", "WorkspaceCreateRequest",
+            "WorkspaceFileInfo", "WorkspaceFileListResponse", "WorkspaceFileUploadItem",
+            "WorkspaceFileUploadRequest", "WorkspaceFileUploadResponse",
+            "WorkspaceFileUploadResponseItem", "WorkspaceInfo",
+        ],
+    },
 )
 
+if TYPE_CHECKING:
+    from .client import AsyncBrowserUse, BrowserUse
+    from .helpers import as_typed
+    from .multiplexer import SessionMultiplexer
+    from .resources.sessions import QueueMirror
+    from .._core.batch import StragglerPolicy
+    from .._core.errors import BrowserUseError
+    from .._core.http import HedgePolicy
+    from .._core.journal import Journal
+    from .._core.payloads import BrowserReady
+    from .._core.request_template import RequestTemplate
+    from .._core.subscriptions import OverflowPolicy, Subscription
+
+    from ..generated.v4.models import (
+        CustomProxy,
+        Model as RunModel,
+        ProxyCountryCode,
+        QueuedMessage,
+        QueueListResponse,
+        QueueMessageRequest,
+        RunAttachment,
+        RunAttachmentsResponse,
+        RunBrowserSettings,
+        RunCreateRequest,
+        RunCreateResponse,
+        RunEvent,
+        RunEventsResponse,
+        RunJudgeSettings,
+        RunListResponse,
+        RunStatusResponse,
+        RunSummary,
+        SessionInfo,
+        SessionListResponse,
+        Status as QueuedMessageStatus,
+        Status1 as RunAttachmentStatus,
+        Status2 as RunStatus,
+        WorkspaceCreateRequest,
+        WorkspaceFileInfo,
+        WorkspaceFileListResponse,
+        WorkspaceFileUploadItem,
+        WorkspaceFileUploadRequest,
+        WorkspaceFileUploadResponse,
+        WorkspaceFileUploadResponseItem,
+        WorkspaceInfo,
+    )
+
 __all__ = [
     # Client
     "BrowserUse",
     "AsyncBrowserUse",
     "BrowserUseError",
+    "SessionMultiplexer",
+    "QueueMirror",
+    "Subscription",
+    "OverflowPolicy",
+    "StragglerPolicy",
+    "HedgePolicy",
+    "Journal",
+    "RequestTemplate",
+    "as_typed",
     # Run models
+    "BrowserReady",
     "RunCreateRequest",
     "RunCreateResponse",
     "RunSummary",
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import os
-
-from .._core.http import AsyncHttpClient, SyncHttpClient
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from .._core.http import AsyncHttpClient, HedgePolicy, SyncHttpClient
+from .._core.subscriptions import OverflowPolicy, Subscription, SubscriptionHub
+from ..generated.v4.models import RunEvent
+from .helpers import _async_event_feed
+from .multiplexer import SessionMultiplexer
 from .resources.runs import AsyncRuns, Runs
 from .resources.sessions import AsyncSessions, Sessions
 from .resources.workspaces import AsyncWorkspaces, Workspaces
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
 _V4_BASE_URL = "https://api.browser-use.com/api/v4"
 
 
@@ -56,6 +65,9 @@ class AsyncBrowserUse:
     The v4 API is polling-first: create a run, then
     ``await runs.wait_for_completion(run.id)`` polls the cheap status endpoint
     until the run is terminal and returns the full run summary.
+
+    Pass ``hedge=HedgePolicy()`` to race a duplicate of GETs that are slower
+    than the recent p95, trimming tail latency on status polls.
     """
 
     def __init__(
@@ -64,6 +76,7 @@ class AsyncBrowserUse:
         *,
         base_url: str | None = None,
         timeout: float = 30.0,
+        hedge: HedgePolicy | None = None,
     ) -> None:
         resolved_key = api_key or os.environ.get("BROWSER_USE_API_KEY") or ""
         if not resolved_key:
@@ -74,13 +87,59 @@ class AsyncBrowserUse:
             base_url=base_url or _V4_BASE_URL,
             api_key=resolved_key,
             timeout=timeout,
+            hedge=hedge,
         )
         self.runs = AsyncRuns(self._http)
         self.sessions = AsyncSessions(self._http)
         self.workspaces = AsyncWorkspaces(self._http)
+        self._hub: SubscriptionHub[RunEvent] = SubscriptionHub(
+            lambda run_id, publish: _async_event_feed(self.runs, run_id, publish)
+        )
+
+    def subscribe(
+        self,
+        run_id: str | UUID,
+        *,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+    ) -> Subscription[RunEvent]:
+        """Subscribe to a run's events.
+
+        All subscribers on the same run share one upstream events cursor, so
+        adding observers does not add API requests. Each subscriber has its
+        own buffer of ``maxsize`` events; ``overflow`` picks what happens
+        when it falls behind (``"block"``, ``"drop_oldest"``, ``"drop_newest"``).
+
+        Usage::
+
+            async with client.subscribe(run.id) as sub:
+                async for event in sub:
+                    print(event.type, event.data)
+        """
+        return self._hub.subscribe(str(run_id), maxsize=maxsize, overflow=overflow)
+
+    def multiplexer(
+        self,
+        size: int = 4,
+        *,
+        session_ids: Iterable[str | UUID] = (),
+        **create_kwargs: Any,
+    ) -> SessionMultiplexer:
+        """Spread tasks across ``size`` warm sessions, least-loaded first.
+
+        ``session_ids`` adopts existing sessions; the rest are created by the
+        first task routed to them. ``create_kwargs`` apply to every run.
+
+        Usage::
+
+            async with client.multiplexer(size=4) as mux:
+                results = await mux.map(tasks)
+        """
+        return SessionMultiplexer(self.runs, self.sessions, size=size, session_ids=session_ids, **create_kwargs)
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
+        self._hub.close()
         await self._http.close()
 
     async def __aenter__(self) -> AsyncBrowserUse:
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from .._core.payloads import _EVENT_MODELS
+from ..generated.v4.models import RunEvent
+from .resources.runs import _TERMINAL_STATUSES, AsyncRuns
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@overload
+def as_typed(event: RunEvent) -> Any: ...
+
+@overload
+def as_typed(event: RunEvent, model: type[M]) -> M: ...
+
+def as_typed(event: RunEvent, model: type[BaseModel] | None = None) -> Any:
+    """The event's ``data`` validated into ``model`` (default: by event type).
+
+    Events of a type without a known model (see :class:`BrowserReady`) return
+    ``data`` unchanged. The result is cached on the event.
+
+    Usage::
+
+        for event in client.runs.events(run_id).events:
+            if event.type == "browser.ready":
+                print(as_typed(event).live_view_url)
+    """
+    model = model or _EVENT_MODELS.get(event.type)
+    if model is None:
+        return event.data
+    cached = event.__dict__.get("_typed_data")
+    if cached is not None and cached[0] is event.data and cached[1] is model:
+        return cached[2]
+    value = model.model_validate(event.data)
+    # Not a model field: stored directly so it never reaches model_dump().
+    event.__dict__["_typed_data"] = (event.data, model, value)
+    return value
+
+
+async def _async_event_feed(
+    runs: AsyncRuns,
+    run_id: str,
+    publish: Callable[[RunEvent], Awaitable[None]],
+    *,
+    timeout: float = 14400,
+    interval: float = 2,
+) -> None:
+    """Publish a run's events until it is terminal (subscription poll loop).
+
+    The status endpoint is only polled when an events page comes back empty,
+    so a busy run costs one request per tick.
+    """
+    after: int | None = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        page = await runs.events(run_id, after=after, limit=100)
+        for event in page.events:
+            await publish(event)
+        if page.next_after is not None:
+            after = page.next_after
+        elif page.events:
+            after = page.events[-1].id
+        if page.has_more:
+            continue
+
+        if not page.events:
+            status = await runs.status(run_id)
+            if status.status.value in _TERMINAL_STATUSES:
+                # Events may land between the empty page and the status read.
+                while True:
+                    page = await runs.events(run_id, after=after, limit=100)
+                    for event in page.events:
+                        await publish(event)
+                    if page.next_after is not None:
+                        after = page.next_after
+                    elif page.events:
+                        after = page.events[-1].id
+                    if not page.has_more:
+                        return
+
+        await asyncio.sleep(interval)
+    raise TimeoutError(f"Run {run_id} did not complete within {timeout}s")
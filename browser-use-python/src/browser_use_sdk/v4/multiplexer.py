@@ -0,0 +1,173 @@
+"""Spread a stream of related tasks across a fixed set of warm v4 sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from ..generated.v4.models import RunSummary
+from .resources.runs import _TERMINAL_STATUSES, AsyncRuns
+from .resources.sessions import AsyncSessions
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+class _Slot:
+    """One session owned by the multiplexer and its local queue of turns."""
+
+    def __init__(self, session_id: str | None) -> None:
+        self.session_id = session_id
+        self.queue: deque[tuple[str, dict[str, Any], asyncio.Future[RunSummary]]] = deque()
+        self.busy = False
+        self.adopted = session_id is not None
+        self.worker: asyncio.Future[None] | None = None
+        self.wakeup: asyncio.Event | None = None
+
+    @property
+    def load(self) -> int:
+        return len(self.queue) + int(self.busy)
+
+
+class SessionMultiplexer:
+    """Dispatches tasks to the least-loaded of ``size`` long-lived sessions.
+
+    Each task becomes the next turn (``runs.create(session_id=...)``) of one
+    session, so cookies, tabs and logins carry over between tasks on that
+    session. Every session runs one turn at a time from its own local queue;
+    a new task goes to the session with the fewest queued plus running
+    turns. Sessions passed in ``session_ids`` are adopted as-is: if one is
+    still busy (per ``SessionInfo.status``) the multiplexer waits for it to
+    settle before its first turn. One that is still busy after ``timeout``
+    seconds fails that turn with ``TimeoutError`` and is dropped, so the next
+    turn on its slot starts a new session. Missing sessions are created by
+    the first task routed to them.
+
+    Usage::
+
+        async with client.multiplexer(size=4) as mux:
+            results = await mux.map(tasks)
+    """
+
+    def __init__(
+        self,
+        runs: AsyncRuns,
+        sessions: AsyncSessions,
+        *,
+        size: int = 4,
+        session_ids: Iterable[str | UUID] = (),
+        timeout: float = 14400,
+        interval: float = 2,
+        **create_kwargs: Any,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._runs = runs
+        self._sessions = sessions
+        self._timeout = timeout
+        self._interval = interval
+        self._create_kwargs = create_kwargs
+        adopted = [str(s) for s in session_ids][:size]
+        self._slots = [_Slot(s) for s in adopted] + [_Slot(None) for _ in range(size - len(adopted))]
+        self._closed = False
+
+    @property
+    def session_ids(self) -> list[str]:
+        """Ids of the sessions created or adopted so far."""
+        return [s.session_id for s in self._slots if s.session_id is not None]
+
+    def loads(self) -> dict[str, int]:
+        """Queued plus running turns per session id."""
+        return {s.session_id: s.load for s in self._slots if s.session_id is not None}
+
+    async def submit(self, task: str, **create_kwargs: Any) -> RunSummary:
+        """Run ``task`` as the next turn of the least-loaded session."""
+        if self._closed:
+            raise RuntimeError("SessionMultiplexer is closed")
+        slot = min(self._slots, key=lambda s: s.load)
+        future: asyncio.Future[RunSummary] = asyncio.get_running_loop().create_future()
+        slot.queue.append((task, {**self._create_kwargs, **create_kwargs}, future))
+        self._ensure_worker(slot)
+        return await future
+
+    async def map(self, tasks: Iterable[str], **create_kwargs: Any) -> list[RunSummary]:
+        """Submit every task and return their run summaries in input order."""
+        return list(await asyncio.gather(*(self.submit(t, **create_kwargs) for t in tasks)))
+
+    async def close(self) -> None:
+        """Stop dispatching. Queued turns fail with ``CancelledError``; sessions are left running."""
+        self._closed = True
+        for slot in self._slots:
+            while slot.queue:
+                slot.queue.popleft()[2].cancel()
+            if slot.worker is not None:
+                slot.worker.cancel()
+        workers = [s.worker for s in self._slots if s.worker is not None]
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def __aenter__(self) -> SessionMultiplexer:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def _ensure_worker(self, slot: _Slot) -> None:
+        if slot.wakeup is None:
+            slot.wakeup = asyncio.Event()
+        slot.wakeup.set()
+        if slot.worker is None or slot.worker.done():
+            slot.worker = asyncio.ensure_future(self._work(slot))
+
+    async def _work(self, slot: _Slot) -> None:
+        assert slot.wakeup is not None
+        while True:
+            if not slot.queue:
+                slot.wakeup.clear()
+                await slot.wakeup.wait()
+                continue
+            task, kwargs, future = slot.queue.popleft()
+            if future.cancelled():
+                continue
+            slot.busy = True
+            try:
+                result = await self._turn(slot, task, kwargs)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                slot.busy = False
+
+    async def _turn(self, slot: _Slot, task: str, kwargs: dict[str, Any]) -> RunSummary:
+        if slot.adopted:
+            try:
+                await self._wait_until_settled(slot.session_id)  # type: ignore[arg-type]
+            except TimeoutError:
+                slot.session_id, slot.adopted = None, False
+                raise
+            slot.adopted = False
+        created = await self._runs.create(task, session_id=slot.session_id, **kwargs)
+        if slot.session_id is None:
+            slot.session_id = str(created.session_id)
+        return await self._runs.wait_for_completion(created.id, timeout=self._timeout, interval=self._interval)
+
+    async def _wait_until_settled(self, session_id: str) -> None:
+        deadline = time.monotonic() + self._timeout
+        while True:
+            info = await self._sessions.get(session_id)
+            if info.status.value in _TERMINAL_STATUSES:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Session {session_id} did not settle within {self._timeout}s")
+            await asyncio.sleep(min(self._interval, remaining))
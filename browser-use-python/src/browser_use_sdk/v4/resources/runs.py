@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
-from ..._core.http import AsyncHttpClient, SyncHttpClient
+from ..._core import OnTimeout
+from ..._core.batch import StragglerPolicy, run_batch
+from ..._core.errors import BrowserUseError
+from ..._core.http import AsyncHttpClient, SyncHttpClient, _IdempotentCreate, _idempotency_key, _validate_created
+from ..._core.request_template import RequestTemplate, _render
+from ..._core.journal import Journal, JournalEntry
+from ..._core.streams import Tick, merge_polled
 from ...generated.v4.models import (
     RunAttachmentsResponse,
     RunBrowserSettings,
     RunCreateResponse,
+    RunEvent,
     RunEventsResponse,
     RunJudgeSettings,
     RunListResponse,
@@ -23,6 +32,10 @@ if TYPE_CHECKING:
 _TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
 
 
+class CreatedRun(RunCreateResponse, _IdempotentCreate):
+    """``RunCreateResponse`` plus the ``idempotency_key`` the run was created with."""
+
+
 def _build_create_body(
     task: str,
     model: str | None,
@@ -60,6 +73,30 @@ class Runs:
     def __init__(self, http: SyncHttpClient) -> None:
         self._http = http
 
+    def template(
+        self,
+        *,
+        model: str | None = None,
+        session_id: str | UUID | None = None,
+        workspace_id: str | UUID | None = None,
+        browser_settings: RunBrowserSettings | dict[str, Any] | None = None,
+        attached_file_ids: list[str | UUID] | None = None,
+        judge: RunJudgeSettings | dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many runs.
+
+        Usage::
+
+            template = client.runs.template(model="bu-mini", browser_settings=settings)
+            client.runs.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            "", model, session_id, workspace_id, browser_settings, attached_file_ids, judge, extra
+        )
+        del body["task"]
+        return RequestTemplate(body)
+
     def create(
         self,
         task: str,
@@ -70,14 +107,26 @@ class Runs:
         browser_settings: RunBrowserSettings | dict[str, Any] | None = None,
         attached_file_ids: list[str | UUID] | None = None,
         judge: RunJudgeSettings | dict[str, Any] | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> RunCreateResponse:
-        """Create a run (a new session, or a follow-up turn when session_id is set)."""
+    ) -> CreatedRun:
+        """Create a run (a new session, or a follow-up turn when session_id is set).
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
         body = _build_create_body(
             task, model, session_id, workspace_id, browser_settings, attached_file_ids, judge, extra
         )
-        return RunCreateResponse.model_validate(
-            self._http.request("POST", "/runs", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedRun,
+            self._http.request("POST", "/runs", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     def list(
@@ -102,15 +151,11 @@ class Runs:
 
     def get(self, run_id: str | UUID) -> RunSummary:
         """Get the full run summary."""
-        return RunSummary.model_validate(
-            self._http.request("GET", f"/runs/{run_id}")
-        )
+        return self._http.request_model(RunSummary, "GET", f"/runs/{run_id}")
 
     def status(self, run_id: str | UUID) -> RunStatusResponse:
         """Get just the run's status — the cheap poll target."""
-        return RunStatusResponse.model_validate(
-            self._http.request("GET", f"/runs/{run_id}/status")
-        )
+        return self._http.request_model(RunStatusResponse, "GET", f"/runs/{run_id}/status")
 
     def events(
         self,
@@ -120,15 +165,14 @@ class Runs:
         limit: int | None = None,
     ) -> RunEventsResponse:
         """List run events incrementally — pass ``after`` from the previous page's next_after."""
-        return RunEventsResponse.model_validate(
-            self._http.request(
-                "GET",
-                f"/runs/{run_id}/events",
-                params={
-                    "after": after,
-                    "limit": limit,
-                },
-            )
+        return self._http.request_model(
+            RunEventsResponse,
+            "GET",
+            f"/runs/{run_id}/events",
+            params={
+                "after": after,
+                "limit": limit,
+            },
         )
 
     def cancel(self, run_id: str | UUID) -> RunSummary:
@@ -149,6 +193,7 @@ class Runs:
         *,
         timeout: float = 14400,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
     ) -> RunSummary:
         """Poll the run's status until terminal, then return the full run summary.
 
@@ -156,6 +201,9 @@ class Runs:
         completed, failed, or cancelled, then fetches the full RunSummary once.
         This is the loop the v4 API was designed for.
 
+        With ``on_timeout="cancel"`` the run is cancelled before
+        ``TimeoutError`` is raised, so it stops billing and frees its slot.
+
         Usage::
 
             created = client.runs.create("Find the top HN post")
@@ -172,6 +220,11 @@ class Runs:
                 return self.get(run_id)
             remaining = deadline - time.monotonic()
             if remaining <= 0:
+                if on_timeout == "cancel":
+                    try:
+                        self.cancel(run_id)
+                    except BrowserUseError:
+                        pass  # finished or gone in the meantime
                 raise TimeoutError(f"Run {run_id} did not complete within {timeout}s")
             time.sleep(min(interval, remaining))
 
@@ -180,6 +233,30 @@ class AsyncRuns:
     def __init__(self, http: AsyncHttpClient) -> None:
         self._http = http
 
+    def template(
+        self,
+        *,
+        model: str | None = None,
+        session_id: str | UUID | None = None,
+        workspace_id: str | UUID | None = None,
+        browser_settings: RunBrowserSettings | dict[str, Any] | None = None,
+        attached_file_ids: list[str | UUID] | None = None,
+        judge: RunJudgeSettings | dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> RequestTemplate:
+        """Pre-serialize ``create`` arguments shared by many runs.
+
+        Usage::
+
+            template = client.runs.template(model="bu-mini", browser_settings=settings)
+            await client.runs.create("Find the top HN post", template=template)
+        """
+        body = _build_create_body(
+            "", model, session_id, workspace_id, browser_settings, attached_file_ids, judge, extra
+        )
+        del body["task"]
+        return RequestTemplate(body)
+
     async def create(
         self,
         task: str,
@@ -190,14 +267,26 @@ class AsyncRuns:
         browser_settings: RunBrowserSettings | dict[str, Any] | None = None,
         attached_file_ids: list[str | UUID] | None = None,
         judge: RunJudgeSettings | dict[str, Any] | None = None,
+        template: RequestTemplate | None = None,
+        idempotency_key: str | None = None,
         **extra: Any,
-    ) -> RunCreateResponse:
-        """Create a run (a new session, or a follow-up turn when session_id is set)."""
+    ) -> CreatedRun:
+        """Create a run (a new session, or a follow-up turn when session_id is set).
+
+        Sent with ``idempotency_key`` (random when omitted) so retries after a
+        timeout cannot create twice; the key is echoed as ``.idempotency_key``.
+
+        Pass ``template`` (from :meth:`template`) to send fields shared by
+        many creates pre-serialized; arguments given here override it.
+        """
         body = _build_create_body(
             task, model, session_id, workspace_id, browser_settings, attached_file_ids, judge, extra
         )
-        return RunCreateResponse.model_validate(
-            await self._http.request("POST", "/runs", json=body)
+        key = _idempotency_key(idempotency_key)
+        return _validate_created(
+            CreatedRun,
+            await self._http.request("POST", "/runs", json=_render(template, body), idempotency_key=key),
+            key,
         )
 
     async def list(
@@ -222,15 +311,11 @@ class AsyncRuns:
 
     async def get(self, run_id: str | UUID) -> RunSummary:
         """Get the full run summary."""
-        return RunSummary.model_validate(
-            await self._http.request("GET", f"/runs/{run_id}")
-        )
+        return await self._http.request_model(RunSummary, "GET", f"/runs/{run_id}")
 
     async def status(self, run_id: str | UUID) -> RunStatusResponse:
         """Get just the run's status — the cheap poll target."""
-        return RunStatusResponse.model_validate(
-            await self._http.request("GET", f"/runs/{run_id}/status")
-        )
+        return await self._http.request_model(RunStatusResponse, "GET", f"/runs/{run_id}/status")
 
     async def events(
         self,
@@ -240,15 +325,14 @@ class AsyncRuns:
         limit: int | None = None,
     ) -> RunEventsResponse:
         """List run events incrementally — pass ``after`` from the previous page's next_after."""
-        return RunEventsResponse.model_validate(
-            await self._http.request(
-                "GET",
-                f"/runs/{run_id}/events",
-                params={
-                    "after": after,
-                    "limit": limit,
-                },
-            )
+        return await self._http.request_model(
+            RunEventsResponse,
+            "GET",
+            f"/runs/{run_id}/events",
+            params={
+                "after": after,
+                "limit": limit,
+            },
         )
 
     async def cancel(self, run_id: str | UUID) -> RunSummary:
@@ -269,6 +353,7 @@ class AsyncRuns:
         *,
         timeout: float = 14400,
         interval: float = 2,
+        on_timeout: OnTimeout = "raise",
     ) -> RunSummary:
         """Poll the run's status until terminal, then return the full run summary.
 
@@ -276,6 +361,9 @@ class AsyncRuns:
         completed, failed, or cancelled, then fetches the full RunSummary once.
         This is the loop the v4 API was designed for.
 
+        With ``on_timeout="cancel"`` the run is cancelled before
+        ``TimeoutError`` is raised, so it stops billing and frees its slot.
+
         Usage::
 
             created = await client.runs.create("Find the top HN post")
@@ -292,5 +380,196 @@ class AsyncRuns:
                 return await self.get(run_id)
             remaining = deadline - time.monotonic()
             if remaining <= 0:
+                if on_timeout == "cancel":
+                    await self._cancel_quietly(run_id)
                 raise TimeoutError(f"Run {run_id} did not complete within {timeout}s")
             await asyncio.sleep(min(interval, remaining))
+
+    async def run_many(
+        self,
+        tasks: Iterable[str],
+        *,
+        concurrency: int = 10,
+        straggler: StragglerPolicy | None = None,
+        journal: Journal | None = None,
+        timeout: float = 14400,
+        interval: float = 2,
+        return_exceptions: bool = False,
+        **create_kwargs: Any,
+    ) -> list[RunSummary]:
+        """Create and wait for one run per task, at most ``concurrency`` at a time.
+
+        Results come back in input order. Pass a :class:`StragglerPolicy` to
+        re-submit runs that take much longer than their finished peers; the
+        first copy to finish wins and the other is cancelled.
+
+        With a :class:`Journal`, every task is recorded before it is created
+        and its run id and result as they arrive, so :meth:`resume` can
+        finish the batch after a crash. Journaling and hedging are exclusive.
+
+        Usage::
+
+            policy = StragglerPolicy(percentile=0.9, max_hedge_ratio=0.05)
+            runs = await client.runs.run_many(tasks, straggler=policy)
+            print(policy.hedged, policy.hedge_wins)
+        """
+        if journal is not None:
+            if straggler is not None:
+                raise ValueError("journal and straggler cannot be combined")
+            entries = []
+            for task in tasks:
+                key = _idempotency_key(None)
+                payload = {"task": task, **create_kwargs}
+                journal.submitted(key, payload)
+                entries.append((key, payload))
+            return await run_batch(
+                entries,
+                lambda entry: self._run_journaled(journal, *entry, None, timeout, interval),
+                concurrency=concurrency,
+                return_exceptions=return_exceptions,
+            )
+
+        async def run_one(task: str) -> RunSummary:
+            creating = asyncio.ensure_future(self.create(task, **create_kwargs))
+            try:
+                created = await asyncio.shield(creating)
+            except asyncio.CancelledError:
+                # Cancelled mid-create (e.g. a losing hedge): wait for the id,
+                # then stop the run so it does not keep billing.
+                with contextlib.suppress(Exception):
+                    late = await creating
+                    await asyncio.shield(self._cancel_quietly(late.id))
+                raise
+            try:
+                return await self.wait_for_completion(created.id, timeout=timeout, interval=interval)
+            except asyncio.CancelledError:
+                await asyncio.shield(self._cancel_quietly(created.id))
+                raise
+
+        return await run_batch(
+            tasks,
+            run_one,
+            concurrency=concurrency,
+            straggler=straggler,
+            return_exceptions=return_exceptions,
+        )
+
+    async def resume(
+        self,
+        journal: Journal,
+        *,
+        concurrency: int = 10,
+        timeout: float = 14400,
+        interval: float = 2,
+        return_exceptions: bool = False,
+    ) -> list[RunSummary]:
+        """Finish a journaled :meth:`run_many` batch after a restart.
+
+        Finished entries are returned from the journal without a request,
+        created ones are polled again, and ones that never got a run id are
+        re-created with their original idempotency key. Results follow
+        submission order.
+
+        Usage::
+
+            runs = await client.runs.resume(Journal("batch.sqlite"))
+        """
+
+        async def resume_one(entry: JournalEntry) -> RunSummary:
+            if entry.result is not None:
+                return RunSummary.model_validate_json(entry.result)
+            return await self._run_journaled(journal, entry.key, entry.payload, entry.remote_id, timeout, interval)
+
+        return await run_batch(
+            journal.entries(),
+            resume_one,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    async def _run_journaled(
+        self,
+        journal: Journal,
+        key: str,
+        payload: dict[str, Any],
+        run_id: str | None,
+        timeout: float,
+        interval: float,
+    ) -> RunSummary:
+        if run_id is None:
+            created = await self.create(**payload, idempotency_key=key)
+            run_id = str(created.id)
+            journal.created(key, run_id)
+        try:
+            summary = await self.wait_for_completion(run_id, timeout=timeout, interval=interval)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._cancel_quietly(run_id))
+            raise
+        journal.finished(key, summary.model_dump_json(by_alias=True))
+        return summary
+
+    async def _cancel_quietly(self, run_id: str | UUID) -> None:
+        try:
+            await self.cancel(run_id)
+        except BrowserUseError:
+            pass  # finished or gone in the meantime
+
+    async def stream_many(
+        self,
+        run_ids: Iterable[str | UUID],
+        *,
+        interval: float = 2,
+        max_interval: float = 30,
+        concurrency: int = 10,
+        timeout: float = 14400,
+        on_error: Callable[[str, Exception], Any] | None = None,
+    ) -> AsyncIterator[tuple[str, RunEvent]]:
+        """Interleave the events of many runs from a single async iterator.
+
+        Each run keeps its own events cursor and finishes independently once
+        it is terminal and drained. Busy runs are polled every ``interval``
+        seconds; quiet ones back off up to ``max_interval``. The status
+        endpoint is only hit when a run's events page comes back empty. A
+        run whose polling fails ends on its own and the others keep going.
+        Pass ``on_error(run_id, error)`` to see each failure as it happens;
+        without it, the first failure is raised only once every other run
+        has finished, which can be hours later.
+
+        Usage::
+
+            async for run_id, event in client.runs.stream_many(run_ids):
+                print(run_id, event.type)
+        """
+        cursors: dict[str, int | None] = {}
+        finishing: set[str] = set()
+
+        async def tick(run_id: str) -> Tick[RunEvent]:
+            page = await self.events(run_id, after=cursors.get(run_id), limit=100)
+            if page.next_after is not None:
+                cursors[run_id] = page.next_after
+            elif page.events:
+                cursors[run_id] = page.events[-1].id
+            if page.has_more:
+                return Tick(page.events, more=True)
+            if run_id in finishing:
+                return Tick(page.events, done=True)
+            if page.events:
+                return Tick(page.events)
+            status = await self.status(run_id)
+            if status.status.value in _TERMINAL_STATUSES:
+                # One more page picks up events written before the status flipped.
+                finishing.add(run_id)
+                return Tick([], more=True)
+            return Tick([])
+
+        async for pair in merge_polled(
+            (str(r) for r in run_ids),
+            tick,
+            interval=interval,
+            max_interval=max_interval,
+            concurrency=concurrency,
+            timeout=timeout,
+            label="Run",
+            on_error=on_error,
+        ):
+            yield pair
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 
 from ..._core.http import AsyncHttpClient, SyncHttpClient
@@ -29,9 +30,71 @@ def _build_message_body(
     return body
 
 
+# Queued message statuses that still count as waiting to run.
+_PENDING_STATUSES = {"pending", "dispatching"}
+
+
+class QueueMirror:
+    """Local view of every session's pending message queue.
+
+    Kept up to date from ``send_message``/``remove_message`` responses and
+    replaced wholesale by each ``queue()`` read, so :meth:`pending` answers
+    without a network call. Messages that leave the queue server-side are
+    only noticed on the next ``queue()`` read (or :meth:`observe`).
+
+    Only sessions with pending messages are tracked: once a session's queue
+    empties, everything known about it is dropped, so the mirror stays as
+    small as the set of busy sessions.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, dict[int, QueuedMessage]] = {}
+        self._synced: dict[str, float] = {}
+
+    def pending(self, session_id: str | UUID) -> list[QueuedMessage]:
+        """Pending messages for the session, oldest first. No network call."""
+        return sorted(self._queues.get(str(session_id), {}).values(), key=lambda m: m.id)
+
+    def age(self, session_id: str | UUID) -> float | None:
+        """Seconds since the session's pending queue was last read from the API.
+
+        ``None`` if it never was, or the queue has since emptied.
+        """
+        synced = self._synced.get(str(session_id))
+        return None if synced is None else time.monotonic() - synced
+
+    def observe(self, message: QueuedMessage) -> None:
+        """Apply one message's latest state (e.g. from a send or remove response)."""
+        key = str(message.session_id)
+        if message.status.value in _PENDING_STATUSES:
+            self._queues.setdefault(key, {})[message.id] = message
+            return
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.pop(message.id, None)
+            if not queue:
+                self.forget(key)
+
+    def replace(self, session_id: str | UUID, messages: list[QueuedMessage]) -> None:
+        """Reconcile with an authoritative ``queue()`` read."""
+        key = str(session_id)
+        queue = {m.id: m for m in messages if m.status.value in _PENDING_STATUSES}
+        if queue:
+            self._queues[key] = queue
+            self._synced[key] = time.monotonic()
+        else:
+            self.forget(key)
+
+    def forget(self, session_id: str | UUID) -> None:
+        """Drop everything known about the session."""
+        self._queues.pop(str(session_id), None)
+        self._synced.pop(str(session_id), None)
+
+
 class Sessions:
     def __init__(self, http: SyncHttpClient) -> None:
         self._http = http
+        self.mirror = QueueMirror()
 
     def list(
         self,
@@ -53,9 +116,7 @@ class Sessions:
 
     def get(self, session_id: str | UUID) -> SessionInfo:
         """Get session metadata (latest run id, status, ...)."""
-        return SessionInfo.model_validate(
-            self._http.request("GET", f"/sessions/{session_id}")
-        )
+        return self._http.request_model(SessionInfo, "GET", f"/sessions/{session_id}")
 
     def send_message(
         self,
@@ -71,30 +132,50 @@ class Sessions:
         Runs as the next turn when the session is busy; pass ``interrupt=True``
         to cancel the active run so the message runs immediately.
         """
-        return QueuedMessage.model_validate(
+        message = QueuedMessage.model_validate(
             self._http.request(
                 "POST",
                 f"/sessions/{session_id}/queue",
                 json=_build_message_body(text, interrupt, attached_file_ids, extra),
             )
         )
+        self.mirror.observe(message)
+        return message
 
     def queue(self, session_id: str | UUID) -> QueueListResponse:
         """List the session's pending queued messages."""
-        return QueueListResponse.model_validate(
+        response = QueueListResponse.model_validate(
             self._http.request("GET", f"/sessions/{session_id}/queue")
         )
+        self.mirror.replace(session_id, response.queue)
+        return response
 
     def remove_message(self, session_id: str | UUID, message_id: int) -> QueuedMessage:
         """Remove a pending message from the session's queue."""
-        return QueuedMessage.model_validate(
+        message = QueuedMessage.model_validate(
             self._http.request("DELETE", f"/sessions/{session_id}/queue/{message_id}")
         )
+        self.mirror.observe(message)
+        return message
+
+    def pending(self, session_id: str | UUID, *, max_age: float | None = None) -> list[QueuedMessage]:
+        """Pending messages from the local mirror, oldest first.
+
+        Makes no request unless ``max_age`` is set and the mirror has not
+        reconciled a non-empty queue with ``queue()`` within that many
+        seconds (empty queues are not remembered).
+        """
+        if max_age is not None:
+            age = self.mirror.age(session_id)
+            if age is None or age > max_age:
+                self.queue(session_id)
+        return self.mirror.pending(session_id)
 
 
 class AsyncSessions:
     def __init__(self, http: AsyncHttpClient) -> None:
         self._http = http
+        self.mirror = QueueMirror()
 
     async def list(
         self,
@@ -116,9 +197,7 @@ class AsyncSessions:
 
     async def get(self, session_id: str | UUID) -> SessionInfo:
         """Get session metadata (latest run id, status, ...)."""
-        return SessionInfo.model_validate(
-            await self._http.request("GET", f"/sessions/{session_id}")
-        )
+        return await self._http.request_model(SessionInfo, "GET", f"/sessions/{session_id}")
 
     async def send_message(
         self,
@@ -134,22 +213,41 @@ class AsyncSessions:
         Runs as the next turn when the session is busy; pass ``interrupt=True``
         to cancel the active run so the message runs immediately.
         """
-        return QueuedMessage.model_validate(
+        message = QueuedMessage.model_validate(
             await self._http.request(
                 "POST",
                 f"/sessions/{session_id}/queue",
                 json=_build_message_body(text, interrupt, attached_file_ids, extra),
             )
         )
+        self.mirror.observe(message)
+        return message
 
     async def queue(self, session_id: str | UUID) -> QueueListResponse:
         """List the session's pending queued messages."""
-        return QueueListResponse.model_validate(
+        response = QueueListResponse.model_validate(
             await self._http.request("GET", f"/sessions/{session_id}/queue")
         )
+        self.mirror.replace(session_id, response.queue)
+        return response
 
     async def remove_message(self, session_id: str | UUID, message_id: int) -> QueuedMessage:
         """Remove a pending message from the session's queue."""
-        return QueuedMessage.model_validate(
+        message = QueuedMessage.model_validate(
             await self._http.request("DELETE", f"/sessions/{session_id}/queue/{message_id}")
         )
+        self.mirror.observe(message)
+        return message
+
+    async def pending(self, session_id: str | UUID, *, max_age: float | None = None) -> list[QueuedMessage]:
+        """Pending messages from the local mirror, oldest first.
+
+        Makes no request unless ``max_age`` is set and the mirror has not
+        reconciled a non-empty queue with ``queue()`` within that many
+        seconds (empty queues are not remembered).
+        """
+        if max_age is not None:
+            age = self.mirror.age(session_id)
+            if age is None or age > max_age:
+                await self.queue(session_id)
+        return self.mirror.pending(session_id)
@@ -0,0 +1,143 @@
+"""Tests for bounded batch execution and straggler hedging."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from browser_use_sdk._core.batch import StragglerPolicy, _BatchTimings, _run_hedged, run_batch
+
+
+def test_run_batch_keeps_order_and_bounds_concurrency() -> None:
+    async def run() -> None:
+        in_flight = 0
+        peak = 0
+
+        async def run_one(n: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (5 - n))
+            in_flight -= 1
+            return n * 10
+
+        assert await run_batch(range(5), run_one, concurrency=2) == [0, 10, 20, 30, 40]
+        assert peak == 2
+
+    asyncio.run(run())
+
+
+def test_straggler_is_hedged_and_loser_cancelled() -> None:
+    async def run() -> None:
+        attempts: dict[int, int] = {}
+        cancelled: list[int] = []
+
+        async def run_one(n: int) -> str:
+            attempts[n] = attempts.get(n, 0) + 1
+            # The first attempt of item 5 hangs; every other attempt is quick.
+            delay = 10.0 if n == 5 and attempts[n] == 1 else 0.01
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(n)
+                raise
+            return f"item {n} attempt {attempts[n]}"
+
+        policy = StragglerPolicy(min_samples=3, max_hedge_ratio=0.5, check_interval=0.01)
+        results = await asyncio.wait_for(run_batch(range(6), run_one, straggler=policy), 5)
+
+        assert results[5] == "item 5 attempt 2"
+        assert cancelled == [5]
+        assert policy.hedged == policy.hedge_wins == 1
+
+    asyncio.run(run())
+
+
+def test_hedge_win_is_timed_from_the_primary_start() -> None:
+    async def run() -> None:
+        attempts: list[int] = []
+
+        async def run_one(n: int) -> int:
+            attempts.append(n)
+            await asyncio.sleep(10.0 if len(attempts) == 1 else 0.01)
+            return n
+
+        policy = StragglerPolicy(min_samples=1, multiplier=1, max_hedge_ratio=1, check_interval=0.01)
+        timings = _BatchTimings(policy, 1)
+        timings.durations.append(0.05)
+
+        assert await asyncio.wait_for(_run_hedged(7, run_one, timings), 5) == 7
+        assert policy.hedge_wins == 1
+        assert timings.durations[-1] >= 0.05
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("failing", [0, 1])
+def test_hedge_success_wins_when_both_attempts_finish_together(failing: int) -> None:
+    async def run() -> None:
+        for _ in range(5):
+            release = asyncio.Event()
+            attempts: list[int] = []
+
+            async def run_one(n: int) -> int:
+                attempt = len(attempts)
+                attempts.append(attempt)
+                if attempt == 1:
+                    release.set()
+                await release.wait()
+                if attempt == failing:
+                    raise RuntimeError("boom")
+                return n
+
+            policy = StragglerPolicy(min_samples=1, multiplier=1, max_hedge_ratio=1, check_interval=0.01)
+            timings = _BatchTimings(policy, 1)
+            timings.durations.append(0.01)
+
+            # The hedge releases both attempts, so they finish in the same wakeup.
+            assert await asyncio.wait_for(_run_hedged(7, run_one, timings), 5) == 7
+            assert attempts == [0, 1]
+
+    asyncio.run(run())
+
+
+def test_hedge_budget_caps_duplicates() -> None:
+    async def run() -> None:
+        attempts: dict[int, int] = {}
+
+        async def run_one(n: int) -> int:
+            attempts[n] = attempts.get(n, 0) + 1
+            await asyncio.sleep(0.2 if n >= 4 else 0.01)
+            return n
+
+        policy = StragglerPolicy(min_samples=2, max_hedges=1, check_interval=0.01, max_hedge_ratio=1)
+        assert await run_batch(range(6), run_one, straggler=policy) == list(range(6))
+        assert policy.hedged == 1
+        assert sum(attempts.values()) == 7
+
+    asyncio.run(run())
+
+
+def test_run_batch_failure_cancels_remaining() -> None:
+    async def run() -> None:
+        cancelled: list[int] = []
+
+        async def run_one(n: int) -> int:
+            if n == 0:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(n)
+                raise
+            return n
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_batch(range(3), run_one)
+        assert sorted(cancelled) == [1, 2]
+
+        results = await run_batch([0], run_one, return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+
+    asyncio.run(run())
@@ -0,0 +1,117 @@
+"""Tests for the pooled standalone browser manager."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from browser_use_sdk._core.browser_pool import BrowserPool
+from browser_use_sdk.v3.resources.browsers import AsyncBrowsers
+
+
+class FakeBrowserHttp:
+    """Serves POST/GET/PATCH /browsers from an in-memory table."""
+
+    def __init__(self, lifetime: timedelta = timedelta(minutes=15)) -> None:
+        self.lifetime = lifetime
+        self.browsers: dict[str, dict[str, Any]] = {}
+        self.created: list[dict[str, Any]] = []
+        self.stopped: list[str] = []
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        if method == "POST":
+            self.created.append(json or {})
+            browser_id = f"00000000-0000-0000-0000-{len(self.created):012d}"
+            now = datetime.now(timezone.utc)
+            self.browsers[browser_id] = {
+                "id": browser_id,
+                "status": "active",
+                "cdpUrl": f"wss://cdp/{browser_id}",
+                "timeoutAt": (now + self.lifetime).isoformat(),
+                "startedAt": now.isoformat(),
+            }
+            return self.browsers[browser_id]
+        browser_id = path.rsplit("/", 1)[1]
+        if method == "PATCH":
+            self.stopped.append(browser_id)
+            self.browsers[browser_id]["status"] = "stopped"
+        return self.browsers[browser_id]
+
+
+def test_pool_reuses_browsers_per_group_and_stops_leaks_on_close() -> None:
+    async def run() -> None:
+        http = FakeBrowserHttp()
+        pool = BrowserPool(AsyncBrowsers(http), max_size=3)  # type: ignore[arg-type]
+        await pool.warm(1, proxy_country_code="us")
+
+        async with pool.lease(proxy_country_code="us") as first:
+            pass
+        async with pool.lease(proxy_country_code="us") as second:
+            assert second.cdp_url == first.cdp_url
+        assert len(http.created) == 1
+        assert http.created[0]["proxyCountryCode"] == "us"
+
+        leaked = pool.lease(browser_screen_width=1280)
+        view = await leaked.__aenter__()
+        assert http.created[1]["browserScreenWidth"] == 1280
+
+        await pool.close()
+        assert sorted(http.stopped) == sorted([str(first.id), str(view.id)])
+
+    asyncio.run(run())
+
+
+def test_pool_recycles_expiring_and_failed_browsers() -> None:
+    async def run() -> None:
+        http = FakeBrowserHttp(lifetime=timedelta(seconds=30))
+        pool = BrowserPool(AsyncBrowsers(http), recycle_before=60)  # type: ignore[arg-type]
+        await pool.warm(1)
+        expiring = next(iter(http.browsers))
+
+        async with pool.lease() as browser:
+            assert str(browser.id) != expiring
+        assert expiring in http.stopped
+        assert str(browser.id) in http.stopped  # also too close to its timeout to keep
+
+        http.lifetime = timedelta(minutes=15)
+        with pytest.raises(RuntimeError):
+            async with pool.lease() as broken:
+                raise RuntimeError("job failed")
+        assert str(broken.id) in http.stopped
+        assert pool.size == 0
+
+    asyncio.run(run())
+
+
+def test_lease_waits_for_in_flight_warm_create_at_max_size() -> None:
+    class SlowCreateHttp(FakeBrowserHttp):
+        async def request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+            if method == "POST":
+                await asyncio.sleep(0.02)
+            return await super().request(method, path, **kwargs)
+
+    async def run() -> None:
+        http = SlowCreateHttp()
+        pool = BrowserPool(AsyncBrowsers(http), max_size=1)  # type: ignore[arg-type]
+        warming = asyncio.ensure_future(pool.warm(1))
+        await asyncio.sleep(0)
+
+        async with pool.lease() as browser:
+            assert len(http.created) == 1
+        await warming
+        assert str(browser.id) in http.browsers
+        assert pool.size == 1
+        await pool.close()
+
+    asyncio.run(run())
@@ -0,0 +1,171 @@
+"""Tests for the opt-in run result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from browser_use_sdk._core.cache import ResultCache
+from browser_use_sdk.v3 import AsyncBrowserUse
+from browser_use_sdk.v3.resources.sessions import AsyncSessions
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class FakeSessionHttp:
+    """Sessions finish as soon as they are created; GETs yield once first."""
+
+    def __init__(self, status: str = "idle") -> None:
+        self.status = status
+        self.creates: list[dict[str, Any]] = []
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        if path.endswith("/messages"):
+            return {"messages": [], "hasMore": False}
+        if method == "POST":
+            self.creates.append(json or {})
+        await asyncio.sleep(0.01)
+        n = len(self.creates)
+        return {
+            "id": f"00000000-0000-0000-0000-{n:012d}",
+            "status": "running" if method == "POST" else self.status,
+            "model": "bu-mini",
+            "output": {"value": n},
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+        }
+
+
+def _client(http: FakeSessionHttp, cache: ResultCache) -> AsyncBrowserUse:
+    client = AsyncBrowserUse(api_key="test", result_cache=cache)
+    client.sessions = AsyncSessions(http)  # type: ignore[arg-type]
+    return client
+
+
+def test_key_is_canonical_and_namespaced() -> None:
+    assert ResultCache.key("v3", {"task": "a", "model": "m"}) == ResultCache.key("v3", {"model": "m", "task": "a"})
+    assert ResultCache.key("v3", {"task": "a"}) != ResultCache.key("v2", {"task": "a"})
+
+
+def test_ttl_and_lru_eviction() -> None:
+    cache = ResultCache(ttl=0.05, maxsize=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"  # refreshes "a"
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_disk_backend_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "results.sqlite"
+    ResultCache(path=path).put("k", "v")
+    assert ResultCache(path=path).get("k") == "v"
+
+
+def test_identical_runs_are_served_from_cache() -> None:
+    async def run() -> None:
+        http = FakeSessionHttp()
+        cache = ResultCache()
+        client = _client(http, cache)
+
+        first = await client.run("Count", output_schema=Answer)
+        second = await client.run("Count", output_schema=Answer)
+        assert len(http.creates) == 1
+        assert second.output == first.output == Answer(value=1)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        await client.run("Count", output_schema=Answer, model="bu-max")
+        assert len(http.creates) == 2
+
+    asyncio.run(run())
+
+
+def test_idempotency_key_does_not_change_the_cache_key() -> None:
+    async def run() -> None:
+        http = FakeSessionHttp()
+        cache = ResultCache()
+        client = _client(http, cache)
+
+        first = await client.run("Count", idempotency_key="a")
+        second = await client.run("Count", idempotency_key="b")
+        assert len(http.creates) == 1
+        assert second.output == first.output
+        assert cache.hits == 1
+
+    asyncio.run(run())
+
+
+def test_concurrent_identical_runs_share_one_session() -> None:
+    async def run() -> None:
+        http = FakeSessionHttp()
+        client = _client(http, ResultCache())
+
+        results = await asyncio.gather(*(client.run("Count") for _ in range(3)))
+        assert len(http.creates) == 1
+        assert {r.session.id for r in results} == {results[0].session.id}
+
+    asyncio.run(run())
+
+
+def test_failed_and_follow_up_runs_are_not_cached() -> None:
+    async def run() -> None:
+        http = FakeSessionHttp(status="error")
+        client = _client(http, ResultCache())
+
+        await client.run("Count")
+        await client.run("Count")
+        assert len(http.creates) == 2
+
+        http.status = "idle"
+        session_id = "00000000-0000-0000-0000-000000000001"
+        await client.run("Count", session_id=session_id)
+        await client.run("Count", session_id=session_id)
+        assert len(http.creates) == 4
+
+    asyncio.run(run())
+
+
+def test_joiners_take_over_when_the_leader_is_cancelled() -> None:
+    async def run() -> None:
+        cache = ResultCache()
+        release = asyncio.Event()
+        calls: list[int] = []
+
+        async def work() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                await release.wait()  # the leader hangs until cancelled
+            return "done"
+
+        leader = asyncio.ensure_future(cache.aget_or_run("k", work, lambda r: r, lambda r: r))
+        await asyncio.sleep(0)
+        joiner = asyncio.ensure_future(cache.aget_or_run("k", work, lambda r: r, lambda r: r))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.wait_for(joiner, 1) == "done"
+        assert leader.cancelled()
+        assert len(calls) == 2
+        assert cache.get("k") == "done"
+
+    asyncio.run(run())
@@ -0,0 +1,79 @@
+"""Tests for the stdlib and orjson JSON codecs."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from browser_use_sdk._core import codec as codec_module
+from browser_use_sdk._core.codec import JSONCodec, OrjsonCodec, default_codec
+from browser_use_sdk.generated.v4.models import RunBrowserSettings, Status2
+
+_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@dataclass
+class _Viewport:
+    width: int
+    owner: UUID
+
+
+_BODY: dict[str, Any] = {
+    "task": "Prix du café — 東京",
+    "status": Status2.running,
+    "sessionId": _ID,
+    "ids": [_ID],
+    "naive": datetime(2026, 1, 1, 12, 30),
+    "utc": datetime(2026, 1, 1, 12, 30, 0, 123456, tzinfo=timezone.utc),
+    "offset": datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    "browserSettings": RunBrowserSettings.model_validate({"profileId": _ID}),
+    "nested": {"n": [1, 2.5, True, None], 7: "int key"},
+    "viewport": _Viewport(1280, _ID),
+}
+
+
+def test_orjson_codec_encodes_the_same_data_as_stdlib() -> None:
+    pytest.importorskip("orjson")
+    assert OrjsonCodec().encode(_BODY) == JSONCodec().encode(_BODY)
+    encoded = JSONCodec().encode(_BODY)
+    assert OrjsonCodec().decode(encoded) == JSONCodec().decode(encoded)
+
+
+@pytest.mark.parametrize("value", [1e16, 1.5e-7, 0.1, -0.0, 2**63 - 1, 2**64, -(2**70), [None, 2**100]])
+def test_orjson_codec_round_trips_numbers_like_stdlib(value: Any) -> None:
+    pytest.importorskip("orjson")
+    orjson_codec, stdlib_codec = OrjsonCodec(), JSONCodec()
+    expected = stdlib_codec.decode(stdlib_codec.encode({"v": value}))
+    assert orjson_codec.decode(orjson_codec.encode({"v": value})) == expected == {"v": value}
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), [1.0, float("-inf")]])
+def test_non_finite_floats_are_rejected(backend: str, value: Any) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    codec = OrjsonCodec() if backend == "orjson" else JSONCodec()
+    with pytest.raises(ValueError):
+        codec.encode({"x": None, "v": value})
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_unknown_types_are_rejected(backend: str) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    codec = OrjsonCodec() if backend == "orjson" else JSONCodec()
+    with pytest.raises(TypeError):
+        codec.encode({"x": object()})
+
+
+def test_default_codec_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codec_module, "_default", None)
+    monkeypatch.setitem(sys.modules, "orjson", None)  # makes `import orjson` fail
+    codec = default_codec()
+    assert type(codec) is JSONCodec
+    assert default_codec() is codec
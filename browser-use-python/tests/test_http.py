@@ -0,0 +1,230 @@
+"""Tests for retries, hedged GETs and model decoding in the HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import httpx
+import pytest
+
+from browser_use_sdk._core import http as http_module
+from browser_use_sdk._core.errors import BrowserUseError
+from browser_use_sdk._core.http import AsyncHttpClient, HedgePolicy, SyncHttpClient
+from browser_use_sdk.generated.v4.models import RunBrowserSettings, RunStatusResponse, Status2
+
+
+def _client(handler: object, policy: HedgePolicy) -> AsyncHttpClient:
+    client = AsyncHttpClient("https://api.test", "key", hedge=policy)
+    client._client = httpx.AsyncClient(
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+    return client
+
+
+def test_slow_get_is_hedged_and_first_reply_wins() -> None:
+    async def run() -> None:
+        calls: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if request.url.path == "/slow" and calls.count("GET") == 1 + policy.min_samples:
+                await asyncio.sleep(5)  # the first /slow attempt hangs
+            return httpx.Response(200, json={"n": len(calls)})
+
+        policy = HedgePolicy(min_samples=3, min_delay=0.01, max_ratio=0.5)
+        client = _client(handler, policy)
+        for _ in range(policy.min_samples):
+            await client.request("GET", "/fast")
+        assert policy.hedged == 0
+
+        result = await asyncio.wait_for(client.request("GET", "/slow"), 2)
+
+        assert result == {"n": 5}
+        assert policy.hedged == policy.hedge_wins == 1
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_hedging_skips_writes_and_respects_ratio() -> None:
+    async def run() -> None:
+        calls: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            await asyncio.sleep(0.05 if len(calls) > 2 else 0)
+            return httpx.Response(200, json={})
+
+        policy = HedgePolicy(percentile=0.5, min_samples=2, min_delay=0.001, max_ratio=0.25)
+        client = _client(handler, policy)
+        await client.request("GET", "/a")
+        await client.request("GET", "/a")
+        await client.request("POST", "/a", json={})
+        for _ in range(4):
+            await client.request("GET", "/a")
+
+        assert calls.count("POST") == 1
+        assert policy.requests == 6
+        assert policy.hedged == 1
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_hedged_get_prefers_a_success_that_lands_with_a_failure() -> None:
+    async def run() -> None:
+        gate = asyncio.Event()
+        slow_calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal slow_calls
+            if request.url.path == "/fast":
+                return httpx.Response(200, json={})
+            slow_calls += 1
+            attempt = slow_calls
+            await gate.wait()  # release both copies together
+            if attempt == 1:
+                raise httpx.ConnectError("reset", request=request)
+            return httpx.Response(200, json={"copy": attempt})
+
+        policy = HedgePolicy(min_samples=2, min_delay=0.01, max_ratio=1)
+        client = _client(handler, policy)
+        for _ in range(policy.min_samples):
+            await client.request("GET", "/fast")
+
+        slow = asyncio.ensure_future(client.request("GET", "/slow"))
+        while policy.hedged == 0 or slow_calls < 2:
+            await asyncio.sleep(0.005)
+        gate.set()
+
+        assert await asyncio.wait_for(slow, 2) == {"copy": 2}
+        assert policy.hedge_wins == 1
+        await client.close()
+
+    asyncio.run(run())
+
+
+def _sync_client(handler: object, *, max_retries: int = 3) -> SyncHttpClient:
+    client = SyncHttpClient("https://api.test", "key", max_retries=max_retries)
+    client._client = httpx.Client(
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+    )
+    return client
+
+
+def test_keyed_post_is_retried_after_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_module, "_BACKOFF_BASE", 0)
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Idempotency-Key"))
+        if len(seen) == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        if len(seen) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _sync_client(handler)
+    assert client.request("POST", "/runs", json={}, idempotency_key="k1") == {"ok": True}
+    assert seen == ["k1", "k1", "k1"]
+
+
+def test_unkeyed_post_is_not_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_module, "_BACKOFF_BASE", 0)
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "POST":
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(503) if len(calls) == 2 else httpx.Response(200, json={})
+
+    client = _sync_client(handler)
+    with pytest.raises(httpx.ReadTimeout):
+        client.request("POST", "/runs", json={})
+    assert calls == ["POST"]
+
+    assert client.request("GET", "/runs") == {}
+    assert calls == ["POST", "GET", "GET"]
+
+
+@pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+def test_idempotent_methods_retry_transient_failures(monkeypatch: pytest.MonkeyPatch, method: str) -> None:
+    monkeypatch.setattr(http_module, "_BACKOFF_BASE", 0)
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ConnectError("reset", request=request)
+        if len(calls) == 2:
+            return httpx.Response(502)
+        return httpx.Response(200, json={})
+
+    assert _sync_client(handler).request(method, "/runs/r1") == {}
+    assert calls == [method] * 3
+
+
+def test_max_retries_zero_disables_transient_retries() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    client = _sync_client(handler, max_retries=0)
+    with pytest.raises(BrowserUseError):
+        client.request("GET", "/runs/r1")
+    assert calls == ["GET"]
+
+
+def test_request_model_validates_raw_body_and_raises_api_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/runs/missing/status":
+            return httpx.Response(404, json={"detail": "Run not found"})
+        return httpx.Response(200, content=b'{"status": "running"}')
+
+    client = _sync_client(handler)
+    status = client.request_model(RunStatusResponse, "GET", "/runs/r1/status")
+    assert status.status is Status2.running
+    with pytest.raises(BrowserUseError) as exc:
+        client.request_model(RunStatusResponse, "GET", "/runs/missing/status")
+    assert exc.value.status_code == 404
+
+
+def test_request_body_is_encoded_once_like_httpx_json() -> None:
+    sent: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        sent.append(request.content)
+        return httpx.Response(200, json={})
+
+    run_id = UUID("00000000-0000-0000-0000-000000000001")
+    body = {
+        "task": "café",
+        "status": Status2.running,
+        "sessionId": run_id,
+        "at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "browserSettings": RunBrowserSettings.model_validate({"profileId": run_id}),
+        "files": [{"n": 1}, None],
+    }
+    client = _sync_client(handler)
+    client.request("POST", "/runs", json=body)
+
+    assert json.loads(sent[0]) == {
+        "task": "café",
+        "status": "running",
+        "sessionId": str(run_id),
+        "at": "2026-01-01T00:00:00+00:00",
+        "browserSettings": {"profileId": str(run_id), "proxyCountryCode": "us"},
+        "files": [{"n": 1}, None],
+    }
+    plain = {"task": "café", "n": [1, 2.5, True]}
+    client.request("POST", "/runs", json=plain)
+    assert sent[1] == httpx.Request("POST", "https://api.test", json=plain).content
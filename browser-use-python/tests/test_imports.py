@@ -0,0 +1,54 @@
+"""Import-time regression tests for the lazily exported packages."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Generous for CI noise: a bare package import should not load pydantic,
+# httpx or any generated models at all.
+_IMPORT_BUDGET_S = 0.25
+
+
+def _probe(statement: str) -> dict[str, object]:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+@pytest.mark.parametrize("package", ["browser_use_sdk", "browser_use_sdk.v3", "browser_use_sdk.v4"])
+def test_package_import_is_lazy(package: str) -> None:
+    probe = _probe(f"import {package}")
+    modules = probe["modules"]
+    assert isinstance(modules, list)
+    assert not [m for m in modules if m.startswith("browser_use_sdk.generated.")]
+    assert "pydantic" not in modules
+    assert probe["elapsed"] < _IMPORT_BUDGET_S
+
+
+def test_v4_client_does_not_import_v2_or_v3_models() -> None:
+    modules = _probe("from browser_use_sdk.v4 import AsyncBrowserUse")["modules"]
+    assert isinstance(modules, list)
+    assert "browser_use_sdk.generated.v4.models" in modules
+    assert "browser_use_sdk.generated.v2.models" not in modules
+    assert "browser_use_sdk.generated.v3.models" not in modules
+
+
+@pytest.mark.parametrize("package", ["browser_use_sdk", "browser_use_sdk.v3", "browser_use_sdk.v4"])
+def test_every_export_resolves(package: str) -> None:
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+    with pytest.raises(AttributeError):
+        module.DoesNotExist  # noqa: B018
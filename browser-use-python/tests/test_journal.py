@@ -0,0 +1,173 @@
+"""Tests for the SQLite submission journal and batch resume."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from browser_use_sdk._core.batch import StragglerPolicy
+from browser_use_sdk._core.journal import Journal
+from browser_use_sdk.v3 import AsyncBrowserUse
+from browser_use_sdk.v3.resources.sessions import AsyncSessions
+from browser_use_sdk.v4.resources.runs import AsyncRuns
+
+
+def _summary(run_id: str, task: str) -> dict[str, Any]:
+    return {
+        "id": run_id,
+        "task": task,
+        "title": None,
+        "model": "minimax-m3",
+        "contextLimit": 200000,
+        "status": "completed",
+        "result": f"done: {task}",
+        "error": None,
+        "sessionId": "00000000-0000-0000-0000-000000000002",
+        "workspaceId": None,
+        "totalInputTokens": 1,
+        "totalOutputTokens": 1,
+        "totalCostUsd": "0.01",
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class FakeRunServer:
+    """Runs complete instantly; records creates with their idempotency keys."""
+
+    def __init__(self) -> None:
+        self.creates: list[tuple[str, str | None]] = []
+        self.tasks: dict[str, str] = {}
+        self.paths: list[str] = []
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        self.paths.append(path)
+        if method == "POST":
+            assert json is not None
+            self.creates.append((json["task"], idempotency_key))
+            run_id = f"00000000-0000-0000-0000-1000000000{len(self.creates):02d}"
+            self.tasks[run_id] = json["task"]
+            return {
+                "id": run_id,
+                "status": "queued",
+                "model": "minimax-m3",
+                "sessionId": "00000000-0000-0000-0000-000000000002",
+                "workspaceId": "00000000-0000-0000-0000-000000000003",
+                "eventsUrl": "",
+            }
+        run_id = path.split("/")[2]
+        if path.endswith("/status"):
+            return {"id": run_id, "status": "completed"}
+        return _summary(run_id, self.tasks.get(run_id, "earlier"))
+
+
+def test_run_many_journals_every_step(tmp_path: Path) -> None:
+    async def run() -> None:
+        http = FakeRunServer()
+        with Journal(tmp_path / "batch.sqlite") as journal:
+            runs = await AsyncRuns(http).run_many(["a", "b"], journal=journal, interval=0)  # type: ignore[arg-type]
+            entries = journal.entries()
+
+        assert [r.result for r in runs] == ["done: a", "done: b"]
+        assert [e.payload for e in entries] == [{"task": "a"}, {"task": "b"}]
+        assert [e.key for e in entries] == [key for _, key in http.creates]
+        assert all(e.finished and e.remote_id for e in entries)
+
+    asyncio.run(run())
+
+
+def test_resume_skips_finished_and_reattaches_in_flight(tmp_path: Path) -> None:
+    async def run() -> None:
+        path = tmp_path / "batch.sqlite"
+        in_flight = "00000000-0000-0000-0000-200000000001"
+        with Journal(path) as journal:
+            # State left behind by a worker that crashed mid-batch.
+            journal.submitted("k-done", {"task": "done"})
+            journal.created("k-done", "00000000-0000-0000-0000-200000000000")
+            journal.finished("k-done", json.dumps(_summary("00000000-0000-0000-0000-200000000000", "done")))
+            journal.submitted("k-running", {"task": "running"})
+            journal.created("k-running", in_flight)
+            journal.submitted("k-new", {"task": "new", "model": "minimax-m3"})
+
+        http = FakeRunServer()
+        with Journal(path) as journal:
+            runs = await AsyncRuns(http).resume(journal, interval=0)  # type: ignore[arg-type]
+            assert all(e.finished for e in journal.entries())
+
+        assert [r.result for r in runs] == ["done: done", "done: earlier", "done: new"]
+        assert http.creates == [("new", "k-new")]
+        assert f"/runs/{in_flight}/status" in http.paths
+
+    asyncio.run(run())
+
+
+def test_journal_rejects_hedging(tmp_path: Path) -> None:
+    async def run() -> None:
+        with Journal(tmp_path / "j.sqlite") as journal:
+            with pytest.raises(ValueError, match="journal"):
+                await AsyncRuns(FakeRunServer()).run_many(  # type: ignore[arg-type]
+                    ["a"], journal=journal, straggler=StragglerPolicy()
+                )
+
+    asyncio.run(run())
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class FakeSessionServer:
+    """v3 sessions that are idle as soon as they are created."""
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        if path.endswith("/messages"):
+            return {"messages": [], "hasMore": False}
+        return {
+            "id": "00000000-0000-0000-0000-300000000001",
+            "status": "running" if method == "POST" else "idle",
+            "model": "bu-mini",
+            "output": {"value": 1},
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+        }
+
+
+def test_v3_run_many_never_journals_schema_arguments(tmp_path: Path) -> None:
+    async def run() -> None:
+        client = AsyncBrowserUse(api_key="test")
+        client.sessions = AsyncSessions(FakeSessionServer())  # type: ignore[arg-type]
+        with Journal(tmp_path / "batch.sqlite") as journal:
+            results = await client.run_many(["a"], journal=journal, schema=Answer, output_schema=Answer)
+            entries = journal.entries()
+
+        assert results[0].output == Answer(value=1)
+        assert [e.payload for e in entries] == [{"task": "a"}]
+
+    asyncio.run(run())
@@ -0,0 +1,77 @@
+"""Tests for lazily decoded step, message and event payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from browser_use_sdk.generated.v2.models import TaskStepView
+from browser_use_sdk.generated.v3.models import MessageResponse
+from browser_use_sdk.generated.v4.models import RunEvent
+from browser_use_sdk.v2 import parse_actions
+from browser_use_sdk.v3 import parse_message
+from browser_use_sdk.v4 import BrowserReady, as_typed
+
+_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _message(data: str) -> MessageResponse:
+    return MessageResponse.model_validate(
+        {"id": _ID, "sessionId": _ID, "role": "ai", "data": data, "createdAt": "2026-01-01T00:00:00Z"}
+    )
+
+
+def _event(kind: str, data: dict[str, Any]) -> RunEvent:
+    return RunEvent.model_validate({"runId": _ID, "id": 1, "ts": "2026-01-01T00:00:00Z", "type": kind, "data": data})
+
+
+def test_step_actions_are_decoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    step = TaskStepView.model_validate(
+        {
+            "number": 1,
+            "memory": "",
+            "evaluationPreviousGoal": "",
+            "nextGoal": "",
+            "url": "https://example.com",
+            "actions": ['{"click_element": {"index": 12}}', "done"],
+        }
+    )
+    assert "_parsed_actions" not in step.__dict__
+
+    first = parse_actions(step)
+    assert first == [{"click_element": {"index": 12}}, "done"]
+    monkeypatch.setattr(json, "loads", lambda *_: pytest.fail("decoded twice"))
+    assert parse_actions(step) is first
+    assert "_parsed_actions" not in step.model_dump()
+
+
+def test_message_parsed_handles_json_and_text_and_tracks_updates() -> None:
+    message = _message('{"action": "navigate", "url": "https://example.com"}')
+    assert parse_message(message) == {"action": "navigate", "url": "https://example.com"}
+    assert parse_message(_message("Navigating to example.com")) == "Navigating to example.com"
+    assert parse_message(_message("{not json")) == "{not json"
+
+    updated = message.model_copy(update={"data": "[1, 2]"})
+    assert parse_message(updated) == [1, 2]
+    assert updated == _message("[1, 2]")
+
+
+def test_event_as_typed_uses_known_models_and_caches() -> None:
+    ready = _event("browser.ready", {"live_view_url": "https://live.example.com", "extra": 1})
+    typed = as_typed(ready)
+    assert isinstance(typed, BrowserReady)
+    assert typed.live_view_url == "https://live.example.com"
+    assert as_typed(ready) is typed
+
+    other = _event("tool.called", {"name": "click"})
+    assert as_typed(other) == {"name": "click"}
+
+    class ToolCall(BaseModel):
+        name: str
+
+    assert as_typed(other, ToolCall) == ToolCall(name="click")
+    with pytest.raises(ValidationError):
+        as_typed(_event("browser.ready", {}))
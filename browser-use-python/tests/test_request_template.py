@@ -0,0 +1,99 @@
+"""Tests for pre-serialized create templates."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+from typing import Any
+
+import httpx
+
+from browser_use_sdk._core.http import AsyncHttpClient, SyncHttpClient
+from browser_use_sdk._core.request_template import RequestTemplate
+from browser_use_sdk.generated.v2.models import SessionSettings
+from browser_use_sdk.v2.resources.tasks import AsyncTasks, Tasks
+from browser_use_sdk.v3.resources.sessions import AsyncSessions, Sessions
+from browser_use_sdk.v4.resources.runs import AsyncRuns, Runs
+
+_CREATED_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _recording(bodies: list[dict[str, Any]], response: dict[str, Any]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=response)
+
+    return httpx.MockTransport(handler)
+
+
+def test_render_splices_call_fields_and_lets_them_override() -> None:
+    template = RequestTemplate({"llm": "gpt-4.1", "secrets": {"k": "v"}, "maxSteps": 10})
+    body = template.render({"task": "a", "maxSteps": 3})
+    assert json.loads(body) == {"task": "a", "maxSteps": 3, "llm": "gpt-4.1", "secrets": {"k": "v"}}
+    assert json.loads(template.render({})) == {"llm": "gpt-4.1", "secrets": {"k": "v"}, "maxSteps": 10}
+    assert json.loads(RequestTemplate({}).render({"task": "a"})) == {"task": "a"}
+
+
+def test_v2_create_with_template_sends_same_body_as_plain_create() -> None:
+    bodies: list[dict[str, Any]] = []
+    http = SyncHttpClient("https://api.test", "key")
+    http._client = httpx.Client(
+        base_url="https://api.test", transport=_recording(bodies, {"id": _CREATED_ID, "sessionId": _CREATED_ID})
+    )
+    tasks = Tasks(http)
+    static: dict[str, Any] = dict(
+        llm="gpt-4.1", secrets={"pw": "x"}, session_settings=SessionSettings(profile_id=_CREATED_ID)
+    )
+
+    tasks.create("Find the top HN post", **static)
+    template = tasks.template(**static)
+    created = tasks.create("Find the top HN post", template=template)
+
+    assert bodies[0] == bodies[1]
+    assert str(created.id) == _CREATED_ID
+    assert created.idempotency_key
+
+
+def test_v3_template_keeps_resource_default_and_per_call_override() -> None:
+    async def run() -> None:
+        bodies: list[dict[str, Any]] = []
+        http = AsyncHttpClient("https://api.test", "key")
+        http._client = httpx.AsyncClient(
+            base_url="https://api.test",
+            transport=_recording(
+                bodies,
+                {
+                    "id": _CREATED_ID,
+                    "status": "running",
+                    "model": "bu-mini",
+                    "createdAt": "2026-01-01T00:00:00Z",
+                    "updatedAt": "2026-01-01T00:00:00Z",
+                },
+            ),
+        )
+        sessions = AsyncSessions(http, use_own_key=True)
+        template = sessions.template(model="bu-mini", output_schema={"type": "object"})
+
+        await sessions.create("a", template=template)
+        await sessions.create("b", template=template, use_own_key=False)
+
+        assert bodies == [
+            {"task": "a", "model": "bu-mini", "outputSchema": {"type": "object"}, "useOwnKey": True},
+            {"task": "b", "useOwnKey": False, "model": "bu-mini", "outputSchema": {"type": "object"}},
+        ]
+        await http.close()
+
+    asyncio.run(run())
+
+
+def test_template_signatures_mirror_create() -> None:
+    per_call = {"self", "task", "template", "idempotency_key"}
+    for resource in (Tasks, AsyncTasks, Sessions, AsyncSessions, Runs, AsyncRuns):
+        create = inspect.signature(resource.create).parameters
+        template = inspect.signature(resource.template).parameters
+        assert set(template) - {"self"} == set(create) - per_call, resource.__name__
+        for name, param in template.items():
+            if name != "self":
+                assert param.annotation == create[name].annotation, (resource.__name__, name)
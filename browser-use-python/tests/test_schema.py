@@ -0,0 +1,122 @@
+"""Tests for structured-output schema caching."""
+
+from __future__ import annotations
+
+import gc
+import json
+from enum import Enum
+from typing import Any, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from browser_use_sdk._core import schema as schema_module
+from browser_use_sdk._core.schema import compact_schema, json_schema, json_schema_str, schema_sizes
+
+
+class Product(BaseModel):
+    name: str
+    price: float
+
+
+def test_schema_is_generated_once_per_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[type[Any]] = []
+    original = Product.model_json_schema.__func__  # type: ignore[attr-defined]
+
+    def counting(cls: type[BaseModel], *args: Any, **kwargs: Any) -> dict[str, Any]:
+        calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(Product, "model_json_schema", classmethod(counting))
+    monkeypatch.setattr(schema_module, "_schemas", type(schema_module._schemas)())
+    monkeypatch.setattr(schema_module, "_serialized", type(schema_module._serialized)())
+
+    first = json_schema(Product)
+    assert json_schema(Product) is first
+    assert json.loads(json_schema_str(Product)) == first
+    assert json_schema_str(Product) is json_schema_str(Product)
+    assert calls == [Product]
+
+
+def test_cached_classes_can_be_collected() -> None:
+    def make() -> type[BaseModel]:
+        class Temporary(BaseModel):
+            value: int
+
+        json_schema_str(Temporary)
+        return Temporary
+
+    cls = make()
+    assert cls in schema_module._schemas
+    size = len(schema_module._schemas)
+    del cls
+    gc.collect()
+    assert len(schema_module._schemas) == size - 1
+
+
+class Condition(str, Enum):
+    new = "new"
+    used = "used"
+
+
+class Listing(BaseModel):
+    title: str
+    price: float = Field(description="Price in USD")
+    condition: Condition
+
+
+class Category(BaseModel):
+    name: str
+    subcategories: List["Category"] = []
+
+
+class Results(BaseModel):
+    """Listings found on the page."""
+
+    listings: List[Listing]
+    most_common: Optional[Condition] = Field(None, description="Most listed condition")
+    category: Category
+    page_heading: str = Field(title="Heading")
+
+
+def test_compact_schema_drops_generated_titles_and_inlines_defs() -> None:
+    compact = json_schema(Results, compact=True)
+
+    assert "title" not in compact
+    assert compact["description"] == "Listings found on the page."
+    assert compact["properties"]["page_heading"] == {"title": "Heading", "type": "string"}
+    # A field literally named "title" is data, not a keyword.
+    listing = compact["properties"]["listings"]["items"]
+    assert listing["properties"]["title"] == {"type": "string"}
+    assert listing["properties"]["price"] == {"description": "Price in USD", "type": "number"}
+    # Small definitions are inlined even when used more than once.
+    condition = {"enum": ["new", "used"], "type": "string"}
+    assert listing["properties"]["condition"] == condition
+    assert compact["properties"]["most_common"]["anyOf"][0] == condition
+    # Recursive definitions stay referenced.
+    assert list(compact["$defs"]) == ["Category"]
+    assert compact["properties"]["category"] == {"$ref": "#/$defs/Category"}
+    assert compact["$defs"]["Category"]["properties"]["subcategories"]["items"] == {"$ref": "#/$defs/Category"}
+
+    full, small = schema_sizes(Results)
+    assert full == len(json_schema_str(Results).encode())
+    assert small == len(json_schema_str(Results, compact=True).encode())
+    assert small < full * 0.8
+
+
+def test_compact_schema_keeps_ref_siblings_that_constrain() -> None:
+    schema = {
+        "$defs": {
+            "Word": {"type": "string", "maxLength": 10, "description": "one word"},
+            "Code": {"type": "string", "pattern": "^[A-Z]+$"},
+        },
+        "properties": {
+            "a": {"$ref": "#/$defs/Word", "description": "first"},
+            "b": {"$ref": "#/$defs/Code", "pattern": "^.{3}$"},
+        },
+        "type": "object",
+    }
+    compact = compact_schema(schema)
+    assert compact["properties"]["a"] == {"type": "string", "maxLength": 10, "description": "first"}
+    assert compact["properties"]["b"] == {"allOf": [schema["$defs"]["Code"]], "pattern": "^.{3}$"}
+    assert "$defs" not in compact
@@ -0,0 +1,153 @@
+"""Tests for the shared-poller subscription hub."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from browser_use_sdk._core.subscriptions import SubscriptionHub
+from browser_use_sdk.v4.helpers import _async_event_feed
+from browser_use_sdk.v4.resources.runs import AsyncRuns
+
+RUN_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _event(n: int) -> dict[str, Any]:
+    return {"runId": RUN_ID, "id": n, "ts": "2026-01-01T00:00:00Z", "type": "step", "data": {"n": n}}
+
+
+class FakeAsyncHttp:
+    def __init__(self, responses: list[dict[str, Any]]) -> None:
+        self.responses = list(responses)
+        self.calls: list[tuple[str, dict[str, Any] | None]] = []
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append((path, params))
+        return self.responses.pop(0)
+
+
+def test_hub_runs_one_poller_per_key() -> None:
+    async def run() -> None:
+        polls: list[str] = []
+        release = asyncio.Event()
+
+        async def poll(key: str, publish: Any) -> None:
+            polls.append(key)
+            await release.wait()
+            for n in range(3):
+                await publish(n)
+
+        hub: SubscriptionHub[int] = SubscriptionHub(poll)
+        a = hub.subscribe("run-1")
+        b = hub.subscribe("run-1")
+        await asyncio.sleep(0)
+        release.set()
+
+        got_a, got_b = await asyncio.gather(
+            _collect(a),
+            _collect(b),
+        )
+
+        assert polls == ["run-1"]
+        assert got_a == got_b == [0, 1, 2]
+        assert hub.active_keys() == []
+
+    asyncio.run(run())
+
+
+async def _collect(sub: Any) -> list[Any]:
+    return [item async for item in sub]
+
+
+def test_hub_overflow_policies() -> None:
+    async def run() -> None:
+        async def poll(key: str, publish: Any) -> None:
+            for n in range(5):
+                await publish(n)
+
+        hub: SubscriptionHub[int] = SubscriptionHub(poll)
+        oldest = hub.subscribe("k", maxsize=2, overflow="drop_oldest")
+        newest = hub.subscribe("k", maxsize=2, overflow="drop_newest")
+        await asyncio.sleep(0.01)
+
+        assert await _collect(oldest) == [3, 4]
+        assert await _collect(newest) == [0, 1]
+        assert oldest.dropped == newest.dropped == 3
+
+        with pytest.raises(ValueError, match="overflow"):
+            hub.subscribe("other", overflow="explode")  # type: ignore[arg-type]
+
+    asyncio.run(run())
+
+
+def test_hub_propagates_poll_errors_and_stops_when_unsubscribed() -> None:
+    async def run() -> None:
+        async def failing(key: str, publish: Any) -> None:
+            await publish(1)
+            raise RuntimeError("boom")
+
+        hub: SubscriptionHub[int] = SubscriptionHub(failing)
+        sub = hub.subscribe("k")
+        assert await sub.__anext__() == 1
+        with pytest.raises(RuntimeError, match="boom"):
+            await sub.__anext__()
+
+        cancelled = asyncio.Event()
+
+        async def forever(key: str, publish: Any) -> None:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        hub2: SubscriptionHub[int] = SubscriptionHub(forever)
+        async with hub2.subscribe("k"):
+            await asyncio.sleep(0)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert hub2.active_keys() == []
+
+    asyncio.run(run())
+
+
+def test_v4_event_feed_shares_one_cursor() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            [
+                {"events": [_event(1), _event(2)], "nextAfter": 2, "hasMore": False},
+                {"events": [], "nextAfter": None, "hasMore": False},
+                {"status": "completed"},
+                {"events": [_event(3)], "nextAfter": 3, "hasMore": False},
+            ]
+        )
+        runs = AsyncRuns(http)  # type: ignore[arg-type]
+        hub: SubscriptionHub[Any] = SubscriptionHub(
+            lambda run_id, publish: _async_event_feed(runs, run_id, publish, interval=0)
+        )
+
+        ui = hub.subscribe(RUN_ID)
+        audit = hub.subscribe(RUN_ID)
+        with_ui, with_audit = await asyncio.gather(_collect(ui), _collect(audit))
+
+        assert [e.id for e in with_ui] == [e.id for e in with_audit] == [1, 2, 3]
+        assert [c[0] for c in http.calls] == [
+            f"/runs/{RUN_ID}/events",
+            f"/runs/{RUN_ID}/events",
+            f"/runs/{RUN_ID}/status",
+            f"/runs/{RUN_ID}/events",
+        ]
+        assert http.calls[1][1] == {"after": 2, "limit": 100}
+
+    asyncio.run(run())
@@ -0,0 +1,226 @@
+"""Mocked-HTTP tests for the v2 ``AsyncTaskRun`` handle."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from browser_use_sdk.v2.helpers import AsyncTaskRun, TaskResult
+from browser_use_sdk.v2.resources.tasks import AsyncTasks
+from browser_use_sdk.generated.v2.models import TaskCreatedResponse, TaskView
+
+TASK_ID = "00000000-0000-0000-0000-000000000001"
+SESSION_ID = "00000000-0000-0000-0000-000000000002"
+
+
+def _step(n: int) -> dict[str, Any]:
+    return {
+        "number": n,
+        "memory": "",
+        "evaluationPreviousGoal": "",
+        "nextGoal": f"goal {n}",
+        "url": "https://example.com",
+        "actions": [],
+    }
+
+
+def _task(status: str, steps: int, output: str | None = None) -> dict[str, Any]:
+    return {
+        "id": TASK_ID,
+        "sessionId": SESSION_ID,
+        "llm": "browser-use-llm",
+        "task": "Find pricing",
+        "status": status,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "isScheduled": False,
+        "steps": [_step(n) for n in range(1, steps + 1)],
+        "output": output,
+        "outputFiles": [],
+    }
+
+
+class FakeAsyncHttp:
+    def __init__(self, responses: list[dict[str, Any]]) -> None:
+        self.responses = list(responses)
+        self.calls: list[str] = []
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(path)
+        return self.responses.pop(0)
+
+
+def test_async_task_run_shares_one_creation_and_poll_loop() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            [
+                _task("started", 1),
+                _task("finished", 2, output="done"),
+            ]
+        )
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+        creates: list[int] = []
+
+        async def create_fn() -> TaskCreatedResponse:
+            creates.append(1)
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=0)
+
+        async def consume() -> list[str]:
+            return [step.next_goal async for step in handle]
+
+        first, result = await asyncio.gather(consume(), handle)
+        again = await handle
+
+        assert creates == [1]
+        assert first == ["goal 1", "goal 2"]
+        assert result is again
+        assert result.output == "done"
+        assert http.calls == [f"/tasks/{TASK_ID}", f"/tasks/{TASK_ID}"]
+
+    asyncio.run(run())
+
+
+def test_async_task_run_await_uses_status_endpoint() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            [
+                {"id": TASK_ID, "status": "started"},
+                {"id": TASK_ID, "status": "finished"},
+                _task("finished", 3, output="done"),
+            ]
+        )
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> TaskCreatedResponse:
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=0)
+        result = await handle
+        steps = [step.number async for step in handle]
+
+        assert result.output == "done"
+        assert steps == [1, 2, 3]
+        assert http.calls == [
+            f"/tasks/{TASK_ID}/status",
+            f"/tasks/{TASK_ID}/status",
+            f"/tasks/{TASK_ID}",
+        ]
+
+    asyncio.run(run())
+
+
+def test_async_task_run_stops_remote_when_cancelled() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([{"id": TASK_ID, "status": "started"}, _task("stopped", 0)])
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> TaskCreatedResponse:
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=3600, on_timeout="cancel")
+        waiter = asyncio.ensure_future(handle._wait_for_output())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert http.calls == [f"/tasks/{TASK_ID}/status", f"/tasks/{TASK_ID}"]
+
+    asyncio.run(run())
+
+
+def test_async_task_run_stops_polling_when_last_awaiter_cancelled() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([{"id": TASK_ID, "status": "started"}])
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> TaskCreatedResponse:
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=3600)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(handle._wait_for_output(), timeout=0.01)
+        await asyncio.sleep(0)
+
+        assert handle._poller is not None and handle._poller.done()
+        assert http.calls == [f"/tasks/{TASK_ID}/status"]
+
+    asyncio.run(run())
+
+
+def test_async_task_run_stops_polling_when_iteration_breaks() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([_task("started", 1)])
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> TaskCreatedResponse:
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=3600)
+        async for step in handle:
+            assert step.number == 1
+            break
+        for _ in range(3):
+            await asyncio.sleep(0)  # let the loop close the abandoned iterator
+
+        assert handle._poller is not None and handle._poller.cancelled()
+        assert http.calls == [f"/tasks/{TASK_ID}"]
+
+    asyncio.run(run())
+
+
+def test_async_task_run_cancelled_mid_create_can_still_stop_the_task() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([_task("stopped", 0)])
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> TaskCreatedResponse:
+            await asyncio.sleep(0.02)
+            return TaskCreatedResponse.model_validate({"id": TASK_ID, "sessionId": SESSION_ID})
+
+        handle: AsyncTaskRun[Any] = AsyncTaskRun(create_fn, tasks, interval=3600)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(handle._wait_for_output(), timeout=0.01)
+        await handle.cancel()
+
+        assert handle.task_id == TASK_ID
+        assert http.calls == [f"/tasks/{TASK_ID}"]
+
+    asyncio.run(run())
+
+
+def test_tasks_wait_stops_task_and_session_on_timeout() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([_task("stopped", 0)])
+        tasks = AsyncTasks(http)  # type: ignore[arg-type]
+
+        with pytest.raises(TimeoutError):
+            await tasks.wait(TASK_ID, timeout=0, on_timeout="cancel")
+
+        assert http.calls == [f"/tasks/{TASK_ID}"]
+
+    asyncio.run(run())
+
+
+def test_slim_task_result_keeps_summary_without_steps() -> None:
+    task = TaskView.model_validate({**_task("finished", 50, output="done"), "isSuccess": True, "cost": "0.12"})
+    slim = TaskResult(task, "done").slim()
+
+    assert (str(slim.id), str(slim.session_id), slim.status.value) == (TASK_ID, SESSION_ID, "finished")
+    assert (slim.output, slim.is_success, slim.cost) == ("done", True, "0.12")
+    assert slim.created_at == task.created_at and slim.finished_at is None
+    assert not hasattr(slim, "__dict__") and not hasattr(slim, "steps")
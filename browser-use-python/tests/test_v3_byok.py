@@ -20,7 +20,7 @@ class FakeSyncHttp:
     def __init__(self) -> None:
         self.requests: list[dict[str, Any] | None] = []
 
-    def request(self, method: str, path: str, *, json: dict[str, Any] | None = None) -> dict[str, Any]:
+    def request(self, method: str, path: str, *, json: dict[str, Any] | None = None, idempotency_key: str | None = None) -> dict[str, Any]:
         self.requests.append(json)
         return _session_response()
 
@@ -29,7 +29,7 @@ class FakeAsyncHttp:
     def __init__(self) -> None:
         self.requests: list[dict[str, Any] | None] = []
 
-    async def request(self, method: str, path: str, *, json: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def request(self, method: str, path: str, *, json: dict[str, Any] | None = None, idempotency_key: str | None = None) -> dict[str, Any]:
         self.requests.append(json)
         return _session_response()
 
@@ -0,0 +1,162 @@
+"""Tests for the v3 warm session pool."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from browser_use_sdk.generated.v3.models import SessionResponse
+from browser_use_sdk.v3.helpers import SessionResult
+from browser_use_sdk.v3.pool import SessionPool
+
+
+def _session(n: int, status: str = "idle") -> SessionResponse:
+    return SessionResponse.model_validate(
+        {
+            "id": f"00000000-0000-0000-0000-{n:012d}",
+            "status": status,
+            "model": "bu-mini",
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+        }
+    )
+
+
+class FakeSessions:
+    def __init__(self) -> None:
+        self.created: list[dict[str, Any]] = []
+        self.stopped: list[str] = []
+        self.status: dict[str, str] = {}
+
+    async def create(self, **kwargs: Any) -> SessionResponse:
+        self.created.append(kwargs)
+        session = _session(len(self.created), "created")
+        self.status[str(session.id)] = "idle"
+        return session
+
+    async def get(self, session_id: str) -> SessionResponse:
+        n = int(session_id.rsplit("-", 1)[1])
+        return _session(n, self.status[session_id])
+
+    async def stop(self, session_id: str) -> SessionResponse:
+        self.stopped.append(session_id)
+        self.status[session_id] = "stopped"
+        return await self.get(session_id)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.sessions = FakeSessions()
+        self.dispatched: list[tuple[str, str]] = []
+
+    async def run(self, task: str, *, session_id: str, **kwargs: Any) -> SessionResult[Any]:
+        assert kwargs["keep_alive"] is True
+        self.dispatched.append((task, session_id))
+        await asyncio.sleep(0)
+        return SessionResult(await self.sessions.get(session_id), f"done: {task}")
+
+
+def test_pool_reuses_warm_sessions_per_group() -> None:
+    async def run() -> None:
+        client = FakeClient()
+        async with SessionPool(client, max_size=2) as pool:  # type: ignore[arg-type]
+            await pool.warm(1, model="bu-mini")
+            assert len(client.sessions.created) == 1
+
+            first = await pool.run("a", model="bu-mini")
+            second = await pool.run("b", model="bu-mini")
+            assert first.output == "done: a"
+            assert client.dispatched[0][1] == client.dispatched[1][1]
+            assert len(client.sessions.created) == 1
+
+            # A different profile gets its own session.
+            await pool.run("c", model="bu-mini", profile_id="p1")
+            assert len(client.sessions.created) == 2
+            assert client.sessions.created[1]["profile_id"] == "p1"
+            assert pool.size == 2
+
+        assert len(client.sessions.stopped) == 2
+
+    asyncio.run(run())
+
+
+def test_pool_replaces_dead_sessions_and_respects_cap() -> None:
+    async def run() -> None:
+        client = FakeClient()
+        pool = SessionPool(client, max_size=1)  # type: ignore[arg-type]
+        await pool.warm(1)
+        dead = next(iter(client.sessions.status))
+        client.sessions.status[dead] = "timed_out"
+
+        await pool.run("a")
+        assert client.dispatched[0][1] != dead
+        assert len(client.sessions.created) == 2
+
+        # Concurrent runs share the single slot instead of creating more.
+        await asyncio.gather(pool.run("b"), pool.run("c"), pool.run("d"))
+        assert len(client.sessions.created) == 2
+        assert pool.size == 1
+
+        # A full pool trades an idle session of another group for a new one.
+        await pool.run("e", profile_id="p2")
+        assert pool.size == 1
+        assert client.dispatched[-1][1] not in (dead, client.dispatched[0][1])
+        await pool.close()
+
+    asyncio.run(run())
+
+
+def test_pool_reaps_idle_sessions() -> None:
+    async def run() -> None:
+        client = FakeClient()
+        pool = SessionPool(client, idle_timeout=0)  # type: ignore[arg-type]
+        await pool.warm(2)
+        assert await pool.reap() == 2
+        assert pool.size == 0
+        assert len(client.sessions.stopped) == 2
+
+    asyncio.run(run())
+
+
+def test_pool_wakes_waiters_when_a_create_fails() -> None:
+    async def run() -> None:
+        client = FakeClient()
+        pool = SessionPool(client, max_size=1)  # type: ignore[arg-type]
+        create = client.sessions.create
+
+        async def failing_create(**kwargs: Any) -> SessionResponse:
+            client.sessions.create = create  # type: ignore[method-assign]
+            await asyncio.sleep(0)
+            raise RuntimeError("create failed")
+
+        client.sessions.create = failing_create  # type: ignore[method-assign]
+        first, second = await asyncio.wait_for(
+            asyncio.gather(pool.run("a"), pool.run("b"), return_exceptions=True), timeout=1
+        )
+        assert isinstance(first, RuntimeError)
+        assert isinstance(second, SessionResult)
+        assert pool.size == 1
+        await pool.close()
+
+    asyncio.run(run())
+
+
+def test_pool_stops_session_whose_health_check_raises() -> None:
+    async def run() -> None:
+        client = FakeClient()
+        pool = SessionPool(client)  # type: ignore[arg-type]
+        await pool.warm(1)
+        warm = next(iter(client.sessions.status))
+
+        async def broken_get(session_id: str) -> SessionResponse:
+            raise RuntimeError("connection reset")
+
+        client.sessions.get = broken_get  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError):
+            await pool.run("a")
+        assert client.sessions.stopped == [warm]
+        assert pool.size == 0
+
+    asyncio.run(run())
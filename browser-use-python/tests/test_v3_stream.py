@@ -0,0 +1,210 @@
+"""Mocked-HTTP tests for v3 message streaming (SessionStream / AsyncSessionRun)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from browser_use_sdk.v3.helpers import AsyncSessionRun, SessionStream
+from browser_use_sdk.v3.resources.sessions import AsyncSessions, Sessions
+from browser_use_sdk.generated.v3.models import SessionResponse
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _session(status: str, output: Any = None) -> dict[str, Any]:
+    return {
+        "id": SESSION_ID,
+        "status": status,
+        "model": "bu-mini",
+        "output": output,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+def _message(n: int, type: str = "browser_action") -> dict[str, Any]:
+    return {
+        "id": f"00000000-0000-0000-0000-0000000001{n:02d}",
+        "sessionId": SESSION_ID,
+        "role": "ai",
+        "data": f"step {n}",
+        "type": type,
+        "summary": f"step {n}",
+        "createdAt": "2026-01-01T00:00:00Z",
+    }
+
+
+def _page(*messages: dict[str, Any]) -> dict[str, Any]:
+    return {"messages": list(messages), "hasMore": False}
+
+
+class FakeSyncHttp:
+    """Routes by path: ``/messages`` pops from ``pages``, session GETs from ``sessions``."""
+
+    def __init__(self, pages: list[dict[str, Any]], sessions: list[dict[str, Any]]) -> None:
+        self.pages = list(pages)
+        self.sessions = list(sessions)
+        self.calls: list[str] = []
+
+    def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(self.request(method, path, params=params))
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        if path.endswith("/messages"):
+            self.calls.append("messages")
+            return self.pages.pop(0)
+        self.calls.append("get")
+        return self.sessions.pop(0)
+
+
+class FakeAsyncHttp(FakeSyncHttp):
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return FakeSyncHttp.request(self, method, path, json=json, params=params)
+
+
+def test_stream_skips_status_while_messages_arrive() -> None:
+    http = FakeSyncHttp(
+        pages=[
+            _page(_message(1)),
+            _page(_message(2)),
+            _page(_message(3, type="completion")),
+            _page(),  # drain
+        ],
+        sessions=[_session("idle", output="done")],
+    )
+    sessions = Sessions(http)  # type: ignore[arg-type]
+    stream = SessionStream(SessionResponse.model_validate(_session("running")), sessions, interval=0)
+
+    summaries = [msg.summary for msg in stream]
+
+    assert summaries == ["step 1", "step 2", "step 3"]
+    assert http.calls == ["messages", "messages", "messages", "get", "messages"]
+    assert stream.output == "done"
+
+
+def test_stream_checks_status_on_empty_page() -> None:
+    http = FakeSyncHttp(
+        pages=[_page(), _page(), _page()],
+        sessions=[_session("running"), _session("stopped")],
+    )
+    sessions = Sessions(http)  # type: ignore[arg-type]
+    stream = SessionStream(SessionResponse.model_validate(_session("running")), sessions, interval=0)
+
+    assert list(stream) == []
+    assert http.calls == ["messages", "get", "messages", "get", "messages"]
+
+
+def test_async_run_pipelines_status_after_quiet_tick() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            pages=[
+                _page(_message(1)),
+                _page(),
+                _page(_message(2)),  # fetched together with the terminal status
+                _page(),  # drain
+            ],
+            sessions=[_session("running"), _session("idle", output="ok")],
+        )
+        sessions = AsyncSessions(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> SessionResponse:
+            return SessionResponse.model_validate(_session("created"))
+
+        handle: AsyncSessionRun[Any] = AsyncSessionRun(create_fn, sessions, interval=0)
+        summaries = [msg.summary async for msg in handle]
+
+        assert summaries == ["step 1", "step 2"]
+        assert http.calls == ["messages", "messages", "get", "messages", "get", "messages"]
+        assert handle.output == "ok"
+
+    asyncio.run(run())
+
+
+def test_async_run_creates_once_for_iterator_and_awaiter() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            pages=[_page(_message(1)), _page(_message(2, type="completion")), _page()],
+            sessions=[_session("idle", output="ok")],
+        )
+        sessions = AsyncSessions(http)  # type: ignore[arg-type]
+        creates: list[int] = []
+
+        async def create_fn() -> SessionResponse:
+            creates.append(1)
+            return SessionResponse.model_validate(_session("created"))
+
+        handle: AsyncSessionRun[Any] = AsyncSessionRun(create_fn, sessions, interval=0)
+        seen: list[str | None] = []
+        handle.on_message(lambda msg: seen.append(msg.summary))
+
+        async def consume() -> list[str | None]:
+            return [msg.summary async for msg in handle]
+
+        first, second, result = await asyncio.gather(consume(), consume(), handle)
+        replay = [msg.summary async for msg in handle]
+
+        assert creates == [1]
+        assert first == second == replay == seen == ["step 1", "step 2"]
+        assert result.output == "ok"
+        assert http.calls == ["messages", "messages", "get", "messages"]
+
+    asyncio.run(run())
+
+
+def test_async_run_stops_polling_when_iteration_breaks() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp([_page(_message(1))], [])
+        sessions = AsyncSessions(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> SessionResponse:
+            return SessionResponse.model_validate(_session("running"))
+
+        handle: AsyncSessionRun[Any] = AsyncSessionRun(create_fn, sessions, interval=3600)
+        iterator = handle.__aiter__()
+        assert (await iterator.__anext__()).summary == "step 1"
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert handle._poller is not None and handle._poller.cancelled()
+        assert http.calls == ["messages"]
+
+    asyncio.run(run())
+
+
+def test_async_run_backfills_messages_after_await() -> None:
+    async def run() -> None:
+        http = FakeAsyncHttp(
+            pages=[_page(_message(1), _message(2)), _page()],
+            sessions=[_session("running"), _session("stopped")],
+        )
+        sessions = AsyncSessions(http)  # type: ignore[arg-type]
+
+        async def create_fn() -> SessionResponse:
+            return SessionResponse.model_validate(_session("created"))
+
+        handle: AsyncSessionRun[Any] = AsyncSessionRun(create_fn, sessions, interval=0)
+        await handle
+        summaries = [msg.summary async for msg in handle]
+
+        assert summaries == ["step 1", "step 2"]
+        assert http.calls == ["get", "get", "messages", "messages"]
+
+    asyncio.run(run())
@@ -0,0 +1,127 @@
+"""Tests for v3 template runs with script-cache warming."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from browser_use_sdk.v3 import AsyncBrowserUse, SlimSessionResult, render_template
+from browser_use_sdk.v3.resources.sessions import AsyncSessions
+
+
+class FakeScriptCacheHttp:
+    """The first successful session saves the script; later ones run it for free."""
+
+    def __init__(self, fail_first: int = 0, fail_at: tuple[int, ...] = ()) -> None:
+        self.fail_first = fail_first
+        self.fail_at = fail_at
+        self.creates: list[dict[str, Any]] = []
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.script_saved = False
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        await asyncio.sleep(0.01)
+        if method == "POST":
+            assert json is not None
+            self.creates.append(json)
+            n = len(self.creates)
+            failed = n <= self.fail_first or n in self.fail_at
+            session = {
+                "id": f"00000000-0000-0000-0000-{n:012d}",
+                "status": "error" if failed else "idle",
+                "model": "bu-mini",
+                "isTaskSuccessful": not failed,
+                "llmCostUsd": "0" if self.script_saved else "0.0421",
+                "output": json["task"],
+                "createdAt": "2026-01-01T00:00:00Z",
+                "updatedAt": "2026-01-01T00:00:00Z",
+            }
+            if not failed:
+                self.script_saved = True
+            self.sessions[session["id"]] = session
+            return {**session, "status": "running"}
+        return self.sessions[path.rsplit("/", 1)[1]]
+
+
+def _client(http: FakeScriptCacheHttp) -> AsyncBrowserUse:
+    client = AsyncBrowserUse(api_key="test")
+    client.sessions = AsyncSessions(http)  # type: ignore[arg-type]
+    return client
+
+
+def test_render_template_keeps_values_bracketed() -> None:
+    assert render_template("Price of @{{product}} on @{{ site }}", {"product": "iPhone", "site": "x.com"}) == (
+        "Price of @{{iPhone}} on @{{x.com}}"
+    )
+    with pytest.raises(KeyError):
+        render_template("Price of @{{product}}", {})
+
+
+def test_run_template_warms_one_row_before_fan_out() -> None:
+    async def run() -> None:
+        http = FakeScriptCacheHttp()
+        rows = [{"product": f"p{i}"} for i in range(5)]
+        report = await _client(http).run_template("Price of @{{product}}", rows, workspace_id="ws", concurrency=5)
+
+        assert [r.output for r in report.results] == [f"Price of @{{{{p{i}}}}}" for i in range(5)]
+        assert (report.agent_runs, report.cache_hits, report.failed) == (1, 4, 0)
+        assert all(c["cacheScript"] is True and c["workspaceId"] == "ws" for c in http.creates)
+
+    asyncio.run(run())
+
+
+def test_run_template_retries_warm_up_after_failed_row() -> None:
+    async def run() -> None:
+        http = FakeScriptCacheHttp(fail_first=1)
+        rows = [{"product": f"p{i}"} for i in range(4)]
+        report = await _client(http).run_template("Price of @{{product}}", rows, workspace_id="ws")
+
+        # The failed row and the successful warm-up paid for the agent.
+        assert (report.agent_runs, report.cache_hits) == (2, 2)
+        assert report.results[0].session.status.value == "error"
+
+    asyncio.run(run())
+
+
+def test_run_template_does_not_count_failed_free_rows_as_cache_hits() -> None:
+    async def run() -> None:
+        http = FakeScriptCacheHttp(fail_at=(3,))
+        rows = [{"product": f"p{i}"} for i in range(4)]
+        report = await _client(http).run_template("Price of @{{product}}", rows, workspace_id="ws", concurrency=1)
+
+        failed = report.results[2]
+        assert not isinstance(failed, BaseException)
+        assert (failed.session.status.value, failed.llm_cost_usd) == ("error", "0")
+        assert (report.agent_runs, report.cache_hits) == (2, 2)
+
+    asyncio.run(run())
+
+
+def test_run_template_slim_keeps_summary_records() -> None:
+    async def run() -> None:
+        http = FakeScriptCacheHttp()
+        rows = [{"product": f"p{i}"} for i in range(3)]
+        report = await _client(http).run_template("Price of @{{product}}", rows, workspace_id="ws", slim=True)
+
+        assert all(isinstance(r, SlimSessionResult) for r in report.results)
+        assert (report.agent_runs, report.cache_hits) == (1, 2)
+        assert report.results[2].output == "Price of @{{p2}}"
+        assert report.results[0].llm_cost_usd == "0.0421"
+        assert not hasattr(report.results[0], "__dict__")
+        # No run kwargs leak into the create bodies.
+        assert all("slim" not in c for c in http.creates)
+
+    asyncio.run(run())
@@ -9,8 +9,10 @@ from typing import Any
 import httpx
 import pytest
 
+from browser_use_sdk._core.errors import BrowserUseError
 from browser_use_sdk.v4.resources.runs import AsyncRuns, Runs
-from browser_use_sdk.v4.resources.sessions import Sessions
+from browser_use_sdk.v4.multiplexer import SessionMultiplexer
+from browser_use_sdk.v4.resources.sessions import AsyncSessions, Sessions
 from browser_use_sdk.v4.resources.workspaces import AsyncWorkspaces, Workspaces
 
 RUN_ID = "00000000-0000-0000-0000-000000000001"
@@ -56,6 +58,10 @@ class FakeSyncHttp:
     def __init__(self, responses: list[dict[str, Any]]) -> None:
         self.responses = list(responses)
         self.calls: list[tuple[str, str, dict[str, Any] | None, dict[str, Any] | None]] = []
+        self.idempotency_keys: list[str | None] = []
+
+    def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(self.request(method, path, params=params))
 
     def request(
         self,
@@ -64,8 +70,10 @@ class FakeSyncHttp:
         *,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         self.calls.append((method, path, json, params))
+        self.idempotency_keys.append(idempotency_key)
         return self.responses.pop(0)
 
 
@@ -74,6 +82,9 @@ class FakeAsyncHttp:
         self.responses = list(responses)
         self.calls: list[tuple[str, str, dict[str, Any] | None, dict[str, Any] | None]] = []
 
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
     async def request(
         self,
         method: str,
@@ -81,6 +92,7 @@ class FakeAsyncHttp:
         *,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         self.calls.append((method, path, json, params))
         return self.responses.pop(0)
@@ -132,6 +144,20 @@ def test_wait_for_completion_times_out() -> None:
         runs.wait_for_completion(RUN_ID, timeout=0.01, interval=0.005)
 
 
+def test_wait_for_completion_cancels_on_timeout() -> None:
+    http = FakeSyncHttp([{"status": "running"}] * 100)
+    http.responses.insert(1, _run_summary("cancelled"))
+    runs = Runs(http)  # type: ignore[arg-type]
+
+    with pytest.raises(TimeoutError):
+        runs.wait_for_completion(RUN_ID, timeout=0, interval=0, on_timeout="cancel")
+
+    assert [c[:2] for c in http.calls] == [
+        ("GET", f"/runs/{RUN_ID}/status"),
+        ("POST", f"/runs/{RUN_ID}/cancel"),
+    ]
+
+
 def test_async_wait_for_completion() -> None:
     async def run() -> None:
         http = FakeAsyncHttp(
@@ -195,6 +221,27 @@ def test_runs_create_sends_camel_case_body() -> None:
     assert str(created.id) == RUN_ID
 
 
+def test_runs_create_sends_and_echoes_idempotency_key() -> None:
+    response = {
+        "id": RUN_ID,
+        "status": "queued",
+        "model": "minimax-m3",
+        "sessionId": SESSION_ID,
+        "workspaceId": "00000000-0000-0000-0000-000000000003",
+        "eventsUrl": f"https://api.browser-use.com/api/v4/runs/{RUN_ID}/events",
+    }
+    http = FakeSyncHttp([response, response])
+    runs = Runs(http)  # type: ignore[arg-type]
+
+    generated = runs.create("Find pricing")
+    supplied = runs.create("Find pricing", idempotency_key="order-42")
+
+    assert http.idempotency_keys[0] == generated.idempotency_key
+    assert len(generated.idempotency_key) == 32
+    assert http.idempotency_keys[1] == supplied.idempotency_key == "order-42"
+    assert "idempotency_key" not in supplied.model_dump()
+
+
 def test_runs_list_cursor_pagination() -> None:
     http = FakeSyncHttp(
         [
@@ -284,6 +331,35 @@ def test_sessions_remove_message() -> None:
     assert msg.status.value == "cancelled"
 
 
+def test_sessions_queue_mirror_tracks_pending_without_requests() -> None:
+    second = {**_queued_message(), "id": 8, "text": "and the blog"}
+    http = FakeSyncHttp(
+        [
+            _queued_message(),
+            second,
+            _queued_message("cancelled"),
+            {"queue": []},  # id 8 was consumed server-side
+            {"queue": []},
+        ]
+    )
+    sessions = Sessions(http)  # type: ignore[arg-type]
+
+    sessions.send_message(SESSION_ID, "also check the careers page")
+    sessions.send_message(SESSION_ID, "and the blog")
+    assert [m.id for m in sessions.pending(SESSION_ID)] == [7, 8]
+
+    sessions.remove_message(SESSION_ID, 7)
+    assert [m.id for m in sessions.pending(SESSION_ID)] == [8]
+    assert len(http.calls) == 3
+
+    assert sessions.pending(SESSION_ID, max_age=60) == []
+    assert http.calls[-1][:2] == ("GET", f"/sessions/{SESSION_ID}/queue")
+    # An emptied queue is forgotten, so the next bounded read refreshes it.
+    assert sessions.mirror._queues == sessions.mirror._synced == {}
+    assert sessions.pending(SESSION_ID, max_age=60) == []
+    assert len(http.calls) == 5
+
+
 def test_sessions_list_cursor_pagination() -> None:
     http = FakeSyncHttp([{"sessions": [], "nextCursor": None, "hasMore": False}])
     sessions = Sessions(http)  # type: ignore[arg-type]
@@ -518,3 +594,265 @@ def test_async_workspaces_upload_short_presign_raises(tmp_path: Path) -> None:
             await workspaces.upload(WORKSPACE_ID, f)
 
     asyncio.run(run())
+
+
+# ---------------------------------------------------------------------------
+# runs.stream_many
+# ---------------------------------------------------------------------------
+
+
+class RoutedAsyncHttp:
+    """Fake AsyncHttpClient with a response queue per path."""
+
+    def __init__(self, routes: dict[str, list[Any]]) -> None:
+        self.routes = {path: list(responses) for path, responses in routes.items()}
+        self.calls: list[str] = []
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(path)
+        response = self.routes[path].pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _event(run_id: str, n: int) -> dict[str, Any]:
+    return {"runId": run_id, "id": n, "ts": "2026-01-01T00:00:00Z", "type": "step", "data": {}}
+
+
+def test_async_stream_many_interleaves_and_finishes_runs_independently() -> None:
+    other = "00000000-0000-0000-0000-000000000003"
+
+    async def run() -> None:
+        http = RoutedAsyncHttp(
+            {
+                # Chatty run: two full pages, then terminal.
+                f"/runs/{RUN_ID}/events": [
+                    {"events": [_event(RUN_ID, 1), _event(RUN_ID, 2)], "nextAfter": 2, "hasMore": True},
+                    {"events": [_event(RUN_ID, 3)], "nextAfter": 3, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                ],
+                f"/runs/{RUN_ID}/status": [{"status": "completed"}],
+                # Quiet run: one event, then terminal straight away.
+                f"/runs/{other}/events": [
+                    {"events": [_event(other, 1)], "nextAfter": 1, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                ],
+                f"/runs/{other}/status": [{"status": "failed"}],
+            }
+        )
+        runs = AsyncRuns(http)  # type: ignore[arg-type]
+
+        got = [(run_id, event.id) async for run_id, event in runs.stream_many([RUN_ID, other], interval=0)]
+
+        # Round-robin within the first round, then each run drains on its own.
+        assert got[:3] == [(RUN_ID, 1), (other, 1), (RUN_ID, 2)]
+        assert sorted(got) == sorted([(RUN_ID, 1), (RUN_ID, 2), (RUN_ID, 3), (other, 1)])
+        assert all(not responses for responses in http.routes.values())
+
+    asyncio.run(run())
+
+
+def test_async_stream_many_keeps_other_runs_going_when_one_fails() -> None:
+    other = "00000000-0000-0000-0000-000000000003"
+
+    async def run() -> None:
+        http = RoutedAsyncHttp(
+            {
+                f"/runs/{RUN_ID}/events": [BrowserUseError(404, "Run not found")],
+                f"/runs/{other}/events": [
+                    {"events": [_event(other, 1)], "nextAfter": 1, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                ],
+                f"/runs/{other}/status": [{"status": "completed"}],
+            }
+        )
+        runs = AsyncRuns(http)  # type: ignore[arg-type]
+        got: list[tuple[str, int]] = []
+
+        with pytest.raises(BrowserUseError):
+            async for run_id, event in runs.stream_many([RUN_ID, other], interval=0):
+                got.append((run_id, event.id))
+
+        assert got == [(other, 1)]
+        assert all(not responses for responses in http.routes.values())
+
+    asyncio.run(run())
+
+
+def test_async_stream_many_reports_failures_as_they_happen() -> None:
+    other = "00000000-0000-0000-0000-000000000003"
+
+    async def run() -> None:
+        http = RoutedAsyncHttp(
+            {
+                f"/runs/{RUN_ID}/events": [BrowserUseError(404, "Run not found")],
+                f"/runs/{other}/events": [
+                    {"events": [_event(other, 1)], "nextAfter": 1, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                    {"events": [], "nextAfter": None, "hasMore": False},
+                ],
+                f"/runs/{other}/status": [{"status": "completed"}],
+            }
+        )
+        runs = AsyncRuns(http)  # type: ignore[arg-type]
+        seen: list[tuple[str, Any]] = []
+
+        async for run_id, event in runs.stream_many(
+            [RUN_ID, other], interval=0, on_error=lambda key, e: seen.append((key, e.status_code))
+        ):
+            seen.append((run_id, event.id))
+
+        # The failure is reported before the other run's first event.
+        assert seen == [(RUN_ID, 404), (other, 1)]
+
+    asyncio.run(run())
+
+
+class FakeSessionServer:
+    """Fake AsyncHttpClient: runs complete instantly, sessions are numbered."""
+
+    def __init__(self, session_status: list[str] | None = None) -> None:
+        self.session_status = list(session_status or [])
+        self.creates: list[dict[str, Any]] = []
+        self.runs: dict[str, dict[str, Any]] = {}
+
+    async def request_model(self, model: type[Any], method: str, path: str, *, params: dict[str, Any] | None = None) -> Any:
+        return model.model_validate(await self.request(method, path, params=params))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        if method == "POST" and path == "/runs":
+            assert json is not None
+            self.creates.append(json)
+            run_id = f"00000000-0000-0000-0000-1000000000{len(self.creates):02d}"
+            session_id = json.get("sessionId") or f"00000000-0000-0000-0000-2000000000{len(self.creates):02d}"
+            self.runs[run_id] = {**_run_summary("completed"), "id": run_id, "task": json["task"], "sessionId": session_id}
+            return {
+                "id": run_id,
+                "status": "queued",
+                "model": "minimax-m3",
+                "sessionId": session_id,
+                "workspaceId": WORKSPACE_ID,
+                "eventsUrl": f"/runs/{run_id}/events",
+            }
+        if path.startswith("/sessions/"):
+            return {
+                "sessionId": path.rsplit("/", 1)[1],
+                "workspaceId": None,
+                "latestRunId": RUN_ID,
+                "task": "earlier",
+                "title": None,
+                "status": self.session_status.pop(0),
+                "createdAt": "2026-01-01T00:00:00Z",
+                "updatedAt": "2026-01-01T00:00:00Z",
+            }
+        run_id = path.split("/")[2]
+        if path.endswith("/status"):
+            return {"id": run_id, "status": "completed"}
+        return self.runs[run_id]
+
+
+def test_run_many_stops_a_run_cancelled_mid_create() -> None:
+    class SlowCreateServer(FakeSessionServer):
+        def __init__(self) -> None:
+            super().__init__()
+            self.paths: list[tuple[str, str]] = []
+
+        async def request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+            self.paths.append((method, path))
+            if method == "POST" and path == "/runs":
+                await asyncio.sleep(0.05)
+            return await super().request(method, path, **kwargs)
+
+    async def run() -> None:
+        http = SlowCreateServer()
+        runs = AsyncRuns(http)  # type: ignore[arg-type]
+
+        batch = asyncio.ensure_future(runs.run_many(["a"]))
+        await asyncio.sleep(0.01)
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        run_id = next(iter(http.runs))
+        assert http.paths == [("POST", "/runs"), ("POST", f"/runs/{run_id}/cancel")]
+
+    asyncio.run(run())
+
+
+def test_multiplexer_spreads_turns_across_sessions() -> None:
+    async def run() -> None:
+        http = FakeSessionServer()
+        mux = SessionMultiplexer(AsyncRuns(http), AsyncSessions(http), size=2, interval=0)  # type: ignore[arg-type]
+
+        results = await mux.map(["a", "b", "c", "d"])
+
+        assert [r.task for r in results] == ["a", "b", "c", "d"]
+        assert len(mux.session_ids) == 2
+        # The first turn of each slot creates its session; later turns reuse it.
+        assert [c.get("sessionId") for c in http.creates[:2]] == [None, None]
+        assert {c["sessionId"] for c in http.creates[2:]} == set(mux.session_ids)
+        assert {str(r.session_id) for r in results} == set(mux.session_ids)
+        assert mux.loads() == {sid: 0 for sid in mux.session_ids}
+        await mux.close()
+
+    asyncio.run(run())
+
+
+def test_multiplexer_waits_for_busy_adopted_session() -> None:
+    async def run() -> None:
+        http = FakeSessionServer(session_status=["running", "completed"])
+        mux = SessionMultiplexer(  # type: ignore[arg-type]
+            AsyncRuns(http), AsyncSessions(http), size=1, session_ids=[SESSION_ID], interval=0
+        )
+
+        result = await mux.submit("follow up", model="minimax-m3")
+
+        assert http.session_status == []
+        assert http.creates == [{"task": "follow up", "sessionId": SESSION_ID, "model": "minimax-m3"}]
+        assert str(result.session_id) == SESSION_ID
+        await mux.close()
+
+    asyncio.run(run())
+
+
+def test_multiplexer_drops_adopted_session_that_never_settles() -> None:
+    async def run() -> None:
+        http = FakeSessionServer(session_status=["running"] * 20)
+        mux = SessionMultiplexer(  # type: ignore[arg-type]
+            AsyncRuns(http), AsyncSessions(http), size=1, session_ids=[SESSION_ID], timeout=0.02, interval=0.01
+        )
+
+        with pytest.raises(TimeoutError, match="did not settle"):
+            await asyncio.wait_for(mux.submit("follow up"), 5)
+        result = await mux.submit("next")
+
+        assert http.creates == [{"task": "next"}]
+        assert mux.session_ids == [str(result.session_id)]
+        assert str(result.session_id) != SESSION_ID
+        await mux.close()
+
+    asyncio.run(run())